@@ -1,11 +1,39 @@
 # AppLogger.py
 import logging
+import logging.handlers
 import sys
 import os
+import gzip
+import queue
+import shutil
+import threading
+import time
+import atexit
 
 
 class AppLogger:
-    def __init__(self, log_file=None, level="INFO"):
+    """
+    비동기 로거.
+    - info/debug 등의 호출은 레코드를 큐에 넣기만 하고, 실제 콘솔/파일 출력은 백그라운드 writer 스레드(QueueListener)가 담당한다.
+    - msg, *args 형태의 지연 포맷팅을 지원한다. (비활성 레벨이면 포맷팅 비용 0)
+    - 로그 파일은 append 모드 + 크기 기반 회전(max_bytes), 회전된 파일은 백그라운드에서 gzip 압축한다.
+    - "ProjectWatcher" 로거는 프로세스에 하나이므로, 새 AppLogger 를 만들면 이전 인스턴스는 shutdown 된다.
+    """
+
+    DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+    DEFAULT_BACKUP_COUNT = 5
+
+    _active = None
+    _active_lock = threading.Lock()
+
+    def __init__(self, log_file=None, level="INFO", file_level="DEBUG",
+                 max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT):
+        # 이전 인스턴스의 writer 스레드/파일 핸들/atexit 등록을 먼저 정리한다.
+        with AppLogger._active_lock:
+            previous, AppLogger._active = AppLogger._active, self
+        if previous:
+            previous.shutdown()
+
         self.logger = logging.getLogger("ProjectWatcher")
         self.logger.setLevel(logging.DEBUG)
 
@@ -15,58 +43,232 @@ class AppLogger:
         self.formatter = logging.Formatter('[%(asctime)s][%(levelname)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
         self.console_handler = logging.StreamHandler(sys.stdout)
         self.console_handler.setFormatter(self.formatter)
-        self.console_handler.setLevel(getattr(logging, str(level).upper(), logging.INFO))
-        self.logger.addHandler(self.console_handler)
+        self.console_handler.setLevel(self._to_level(level))
 
         self.file_handler = None
+        self.file_level = self._to_level(file_level, logging.DEBUG)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        # 호출 스레드 → 큐 → writer 스레드
+        self._queue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(self._queue)
+        self.logger.addHandler(self._queue_handler)
+        self._listener = None
+        self._listener_lock = threading.Lock()
+        self._compressor = _RotationCompressor()
+        self._restart_listener()
+        atexit.register(self.shutdown)
+
         if log_file:
             self._add_file_handler(log_file)
         else:
             self.logger.warning("[AppLogger] 초기 로그 파일 경로가 지정되지 않았습니다.")
 
+    @staticmethod
+    def _to_level(level, default=logging.INFO):
+        return getattr(logging, str(level).upper(), default)
+
+    def _restart_listener(self):
+        """ writer 스레드를 현재 핸들러 구성으로 (재)시작. stop()은 큐에 남은 레코드를 모두 flush한 뒤 반환된다. """
+        with self._listener_lock:
+            if self._listener:
+                self._listener.stop()
+            handlers = [self.console_handler] + ([self.file_handler] if self.file_handler else [])
+            self._listener = logging.handlers.QueueListener(self._queue, *handlers, respect_handler_level=True)
+            self._listener.start()
+
+            # 어떤 핸들러도 받지 않을 레벨은 호출 지점에서 바로 걸러낸다.
+            levels = [h.level for h in handlers]
+            self.logger.setLevel(min(levels) if levels else logging.INFO)
+
     def _add_file_handler(self, log_file):
         """ 파일 핸들러를 추가하는 내부 헬퍼 함수 """
         try:
             log_dir = os.path.dirname(os.path.abspath(log_file))
             os.makedirs(log_dir, exist_ok=True)
 
-            if self.file_handler:
-                self.logger.removeHandler(self.file_handler)
-                self.file_handler = None
-
-            fh = logging.FileHandler(log_file, mode='w', encoding='utf-8')
+            if self.max_bytes and self.max_bytes > 0:
+                fh = _CompressingFileHandler(self._compressor, log_file, mode='a', maxBytes=self.max_bytes,
+                                             backupCount=self.backup_count, encoding='utf-8', delay=True)
+            else:
+                fh = logging.FileHandler(log_file, mode='a', encoding='utf-8', delay=True)
             fh.setFormatter(self.formatter)
-            fh.setLevel(logging.DEBUG)
+            fh.setLevel(self.file_level)
 
+            old_handler = self.file_handler
             self.file_handler = fh
-            self.logger.addHandler(self.file_handler)
-            self.info(f"[AppLogger] 로그 파일 핸들러 추가/변경 성공: {log_file}")
+            self._restart_listener()
+            if old_handler:
+                old_handler.close()
+            self.info("[AppLogger] 로그 파일 핸들러 추가/변경 성공: %s", log_file)
         except Exception as e:
             print(f"[AppLogger][CRITICAL ERROR] 로그 파일 핸들러 생성 실패: {e}")
             self.error(f"[AppLogger] 로그 파일 핸들러 생성 실패: {e}", exc_info=True)
 
-    def reconfigure(self, log_file=None, level="INFO"):
+    def reconfigure(self, log_file=None, level="INFO", file_level=None, max_bytes=None, backup_count=None):
         """ 로거의 설정을 동적으로 재구성합니다. """
-        self.info(f"로거 설정을 재구성합니다. 로그 파일: {log_file}, 레벨: {level}")
+        self.info("로거 설정을 재구성합니다. 로그 파일: %s, 레벨: %s", log_file, level)
 
-        if self.file_handler:
-            self.logger.removeHandler(self.file_handler)
-            self.file_handler = None
+        if file_level is not None:
+            self.file_level = self._to_level(file_level, logging.DEBUG)
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if backup_count is not None:
+            self.backup_count = backup_count
+
+        self.console_handler.setLevel(self._to_level(level))
 
         if log_file:
             self._add_file_handler(log_file)
+        elif self.file_handler:
+            old_handler = self.file_handler
+            self.file_handler = None
+            self._restart_listener()
+            old_handler.close()
+        else:
+            self._restart_listener()
 
-        self.console_handler.setLevel(getattr(logging, str(level).upper(), logging.INFO))
         self.info("콘솔 로그 레벨이 업데이트되었습니다.")
 
-    def info(self, msg):
-        self.logger.info(msg)
+    def shutdown(self):
+        """
+        큐에 남은 로그를 모두 기록하고 writer 스레드를 멈춘 뒤 파일 핸들/atexit 등록을 해제한다. (프로그램 종료 시 호출)
+        여러 번 호출해도 된다.
+        """
+        with self._listener_lock:
+            if self._listener:
+                self._listener.stop()
+                self._listener = None
+            if self._queue_handler in self.logger.handlers:
+                self.logger.removeHandler(self._queue_handler)
+            if self.file_handler:
+                self.file_handler.close()
+        self._compressor.join()
+        atexit.unregister(self.shutdown)
+        with AppLogger._active_lock:
+            if AppLogger._active is self:
+                AppLogger._active = None
+
+    # ------------------------------------------------------------
+    # 로깅 API (msg, *args → 지연 포맷팅)
+    # ------------------------------------------------------------
+    def is_debug_enabled(self):
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def info(self, msg, *args):
+        self.logger.info(msg, *args)
+
+    def warning(self, msg, *args):
+        self.logger.warning(msg, *args)
+
+    def error(self, msg, *args, exc_info=False):
+        self.logger.error(msg, *args, exc_info=exc_info)
+
+    def debug(self, msg, *args):
+        self.logger.debug(msg, *args)
+
+    def for_root(self, name):
+        """ 다중 루트: 메시지 앞에 [루트 이름]을 붙이는 로거 (같은 writer 스레드/파일 공유) """
+        return RootLogger(self, name)
+
+
+class RootLogger:
+    """ AppLogger 와 같은 API. 로그 메시지에 루트 이름 접두어만 붙인다. """
+
+    def __init__(self, app_logger, name):
+        self.app_logger = app_logger
+        self.prefix = f"[{name}] "
+
+    def _msg(self, msg, args):
+        return self.prefix.replace("%", "%%") + str(msg) if args else self.prefix + str(msg)
+
+    def is_debug_enabled(self):
+        return self.app_logger.is_debug_enabled()
+
+    def info(self, msg, *args):
+        self.app_logger.info(self._msg(msg, args), *args)
+
+    def warning(self, msg, *args):
+        self.app_logger.warning(self._msg(msg, args), *args)
+
+    def error(self, msg, *args, exc_info=False):
+        self.app_logger.error(self._msg(msg, args), *args, exc_info=exc_info)
+
+    def debug(self, msg, *args):
+        self.app_logger.debug(self._msg(msg, args), *args)
+
+
+class _CompressingFileHandler(logging.handlers.RotatingFileHandler):
+    """ 회전된 파일을 _RotationCompressor 로 압축하는 RotatingFileHandler """
+
+    def __init__(self, compressor, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compressor = compressor
+        self.namer = compressor.namer
+        self.rotator = compressor.rotator
+
+    def doRollover(self):
+        # 기본 doRollover 는 rotator 호출 전에 .N.gz → .N+1.gz 번호 이동부터 한다.
+        # 직전 압축이 아직 .1.gz 를 쓰는 중이면 이동이 덮어쓰기/유실로 이어지므로, 번호 이동 전에 완료를 기다린다.
+        # (회전이 비정상적으로 잦을 때만 실제로 기다리게 된다)
+        self.compressor.join()
+        super().doRollover()
+
+
+class _RotationCompressor:
+    """ 회전된 로그 파일을 백그라운드 스레드에서 gzip으로 압축한다. (writer 스레드는 rename만 하고 바로 복귀) """
+
+    def __init__(self):
+        self._jobs = queue.SimpleQueue()
+        self._thread = None
+        self._cond = threading.Condition()
+        self._pending = 0
+
+    @staticmethod
+    def namer(default_name):
+        return default_name + ".gz"
+
+    def rotator(self, source, dest):
+        # 직전 압축 완료는 _CompressingFileHandler.doRollover 가 번호 이동 전에 이미 기다렸다.
+        # dest = "<log>.1.gz" → 우선 압축 전 임시 이름으로 빠르게 옮긴다.
+        pending = f"{dest[:-3]}.{time.time_ns()}.tmp"
+        os.replace(source, pending)
+        with self._cond:
+            self._pending += 1
+        self._jobs.put((pending, dest))
+        self._ensure_thread()
 
-    def warning(self, msg):
-        self.logger.warning(msg)
+    def _ensure_thread(self):
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="LogCompressor", daemon=True)
+                self._thread.start()
 
-    def error(self, msg, exc_info=False):
-        self.logger.error(msg, exc_info=exc_info)
+    def _run(self):
+        while True:
+            try:
+                pending, dest = self._jobs.get(timeout=1.0)
+            except queue.Empty:
+                with self._cond:
+                    if self._pending == 0:
+                        self._thread = None
+                        return
+                continue
+            try:
+                part = dest + ".part"
+                with open(pending, "rb") as src, gzip.open(part, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                os.replace(part, dest)
+                os.remove(pending)
+            except Exception as e:
+                print(f"[AppLogger][WARN] 회전 로그 압축 실패: {pending} - {e}")
+            finally:
+                with self._cond:
+                    self._pending -= 1
+                    self._cond.notify_all()
 
-    def debug(self, msg):
-        self.logger.debug(msg)
\ No newline at end of file
+    def join(self, timeout=10.0):
+        """ 대기 중인 압축 작업이 모두 끝날 때까지 기다린다. """
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending == 0, timeout)
@@ -1,27 +1,117 @@
 # ConfigManager.py
 import json
 import os
+import re
 import sys
 import logging
+from types import MappingProxyType
+
+DEFAULT_WATCH_EXTENSIONS = [".cpp", ".h", ".hpp", ".c", ".inl"]
+DEFAULT_IGNORED_DIRS = ['/intermediate/', '/saved/', '/binaries/', '/build/', '/deriveddata/', '/staging/',
+                        '/unrealbuildtool/', '/logs/', '/backup/']
+DEFAULT_IGNORED_NAME_PATTERNS = ['.obj', '.pdb', '.tmp', '.user', '.log', '.ilk', '.ipch', '.sdf', '.vs', '.VC.opendb',
+                                 '.suo', '.ncb', '.bak', '~', '.swp', '.lock', '.autocover', '.asset']
+
+# 설정 파일이 바뀌면 바로 적용되는 키 (이벤트 판정/실행 시점에 스냅샷에서 읽음). 나머지는 재시작 후 적용.
+# (IgnoredDirs/WatchFileExtensions 도 감시 계획과 순찰 스냅샷에는 재시작 후 반영)
+HOT_RELOAD_KEYS = frozenset({"DebounceTimeMs", "WatchFileExtensions", "IgnoredDirs", "IgnoredNamePatterns",
+                             "UnrealEngineRootPath", "MainUprojectPath", "ReportDir"})
+
+
+def _substring_matcher(patterns):
+    """ 패턴 중 하나라도 부분 문자열로 포함하면 매치되는 컴파일된 정규식 (패턴이 없으면 None) """
+    if not patterns:
+        return None
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+class ConfigSnapshot:
+    """
+    한 시점의 설정을 해석해 둔 읽기 전용 스냅샷.
+    절대 경로, 확장자 집합, 무시 패턴(컴파일된 정규식)을 미리 계산해 두어 이벤트 처리 같은 핫 패스에서
+    abspath/join 재계산이나 디버그 로그 없이 바로 쓴다. 프로젝트 파일 목록 등 비싼 값은 첫 사용 때 한 번만 계산한다.
+    설정 파일이 바뀌면 새 스냅샷을 만들어 ConfigManager.snapshot 참조를 통째로 바꾸므로,
+    한 번 잡은 스냅샷으로 읽는 쪽은 항상 일관된 값을 본다.
+    settings 는 읽기 전용 매핑이다. 값을 바꾸려면 ConfigManager(overrides=...)/with_overrides() 로 새 스냅샷을 만든다.
+    """
+
+    def __init__(self, settings, base_dir, version=1):
+        self.settings = MappingProxyType(dict(settings))
+        self.base_dir = base_dir
+        self.version = version
+        self._memo = {}
+        self.project_root = os.path.abspath(os.path.join(base_dir, settings.get("ProjectRootPath", ".")))
+
+        self.watch_exts = tuple(e.lower() for e in settings.get("WatchFileExtensions", DEFAULT_WATCH_EXTENSIONS))
+        self.watch_ext_set = frozenset(self.watch_exts)
+        self.ignored_dirs = tuple(d.lower() for d in settings.get("IgnoredDirs", DEFAULT_IGNORED_DIRS))
+        self.ignored_name_patterns = tuple(p for p in settings.get("IgnoredNamePatterns", DEFAULT_IGNORED_NAME_PATTERNS)
+                                           if not (p.endswith('.vcxproj') or p.endswith('.vcxproj.filters')))
+        self.ignored_dir_matcher = _substring_matcher(self.ignored_dirs)
+        self.ignored_name_matcher = _substring_matcher(self.ignored_name_patterns)
+
+        self.main_vcxproj = self.abs_path(settings.get("MainVcxprojPath", ""))
+        self.main_vcxproj_filters = self.abs_path(settings.get("MainVcxprojFiltersPath", ""))
+        self.normalized_main_vcxproj_paths = (self.main_vcxproj.lower(), self.main_vcxproj_filters.lower())
+        self.backup_dir = self.abs_path_from_base_dir(settings.get("BackupDir", "backup"))
+        self.logfile = self.abs_path_from_base_dir(settings.get("LogPath", "Logs/Watcher.log"))
+        self.report_dir = self.abs_path_from_base_dir(settings.get("ReportDir", "Logs/Reports"))
+        self.uproject_path = os.path.join(self.project_root, settings.get("MainUprojectPath", ""))
+
+    def abs_path(self, relpath):
+        """ ProjectRootPath 기준 절대 경로 (스냅샷별 메모) """
+        key = ("root", relpath)
+        path = self._memo.get(key)
+        if path is None:
+            path = self._memo[key] = os.path.abspath(os.path.join(self.project_root, relpath))
+        return path
+
+    def abs_path_from_base_dir(self, relpath):
+        """ 실행 파일(base_dir) 기준 절대 경로 (스냅샷별 메모) """
+        key = ("base", relpath)
+        path = self._memo.get(key)
+        if path is None:
+            path = self._memo[key] = os.path.abspath(os.path.join(self.base_dir, relpath))
+        return path
+
+    def memo(self, key, compute):
+        """ 스냅샷 수명 동안 한 번만 계산하는 값 (compute(snapshot)) """
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute(self)
+            return value
+
+    def is_ignored_name(self, name_lower):
+        return self.ignored_name_matcher is not None and self.ignored_name_matcher.search(name_lower) is not None
+
+    def is_ignored_path(self, normalized_path):
+        """ normalized_path: 소문자 + '/' 구분자 절대 경로 """
+        return self.ignored_dir_matcher is not None and self.ignored_dir_matcher.search(normalized_path) is not None
 
 
 class ConfigManager:
-    def __init__(self):
+    def __init__(self, config_path=None, overrides=None):
+        """
+        config_path를 주면 해당 config.json이 있는 폴더를 base_dir로 사용 (테스트/벤치마크용 가짜 프로젝트 등)
+        overrides 를 주면 읽은 설정 위에 덮어쓴다. (다중 루트의 인라인 루트 설정, 테스트/재생용 설정 변경)
+        config.json 을 다시 읽어도 유지되며, Roots 는 overrides 에 있을 때만 남는다.
+        """
         try:
             self.logger = None
             self.is_pyinstaller_build = getattr(sys, 'frozen', False)
 
-            if self.is_pyinstaller_build:
+            if config_path:
+                self.base_dir = os.path.dirname(os.path.abspath(config_path))
+            elif self.is_pyinstaller_build:
                 self.base_dir = os.path.dirname(sys.executable)
             else:
                 self.base_dir = os.path.dirname(os.path.abspath(__file__))
 
-            self.config_path = os.path.join(self.base_dir, "config.json")
-            self.config = self._load_config()
-
-            self.project_root = os.path.abspath(
-                os.path.join(self.base_dir, self.config.get("ProjectRootPath", "."))
-            )
+            self.config_path = os.path.abspath(config_path) if config_path else os.path.join(self.base_dir, "config.json")
+            self._overrides = overrides
+            self._config_mtime = self._stat_config()
+            self.snapshot = ConfigSnapshot(self._read_settings(), self.base_dir)
 
         except FileNotFoundError:
             print(f"[CRITICAL ERROR] 설정 파일(config.json)을 찾을 수 없습니다: {self.config_path}")
@@ -43,6 +133,12 @@ class ConfigManager:
         if self.logger:
             self.logger.info("ConfigManager에 메인 로거가 성공적으로 설정되었습니다. ✨")
 
+    def with_overrides(self, overrides):
+        """ 현재 overrides 위에 overrides 를 더 덮어쓴 새 ConfigManager (기존 스냅샷은 그대로) """
+        config_manager = ConfigManager(self.config_path, overrides={**(self._overrides or {}), **overrides})
+        config_manager.logger = self.logger
+        return config_manager
+
     def _load_config(self):
         """ config.json 파일을 읽어오는 내부 함수 """
         with open(self.config_path, 'r', encoding='utf-8') as f:
@@ -50,6 +146,60 @@ class ConfigManager:
             print(f"[INFO] 설정 파일 로드 성공: {self.config_path}")
             return config_data
 
+    def _read_settings(self):
+        settings = self._load_config()
+        if self._overrides is not None:
+            settings = {k: v for k, v in settings.items() if k != "Roots"}
+            settings.update(self._overrides)
+        return settings
+
+    def _stat_config(self):
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+
+    # ------------------------------------------------------------
+    # 해석된 설정 스냅샷 / 핫 리로드
+    # ------------------------------------------------------------
+    @property
+    def config(self):
+        """ 현재 스냅샷의 원본 설정 (읽기 전용 매핑. 파생 값은 snapshot 에서 읽는다) """
+        return self.snapshot.settings
+
+    @property
+    def project_root(self):
+        return self.snapshot.project_root
+
+    def reload_if_changed(self):
+        """
+        config.json 이 바뀌었으면 다시 읽어 새 스냅샷으로 통째로 교체한다. (재시작 없이 적용, 교체했으면 True)
+        읽기/해석에 실패하면 기존 스냅샷을 그대로 쓴다. 교체는 참조 하나를 바꾸는 것이므로 읽는 쪽에 잠금이 필요 없다.
+        """
+        mtime = self._stat_config()
+        if mtime is None or mtime == self._config_mtime:
+            return False
+        self._config_mtime = mtime
+        old = self.snapshot
+        try:
+            settings = self._read_settings()
+            if settings == old.settings:
+                return False
+            new = ConfigSnapshot(settings, self.base_dir, old.version + 1)
+        except Exception as e:
+            if self.logger: self.logger.error(f"config.json 다시 읽기 실패 → 기존 설정을 유지합니다: {e}")
+            return False
+
+        self.snapshot = new
+        changed = sorted(k for k in set(old.settings) | set(settings) if old.settings.get(k) != settings.get(k))
+        if self.logger:
+            hot = [k for k in changed if k in HOT_RELOAD_KEYS]
+            cold = [k for k in changed if k not in HOT_RELOAD_KEYS]
+            self.logger.info(f"설정 변경 감지 → 새 설정(v{new.version}) 적용: {', '.join(hot) or '-'}")
+            if cold:
+                self.logger.warning(f"다음 설정 변경은 재시작 후 적용됩니다: {', '.join(cold)}")
+        return True
+
     def _crash_log(self, msg, path):
         try:
             with open(os.path.join(self.base_dir, "zzz_crashlog.txt"), "a", encoding="utf-8") as f:
@@ -58,21 +208,15 @@ class ConfigManager:
             pass
 
     def get_setting(self, key, default=None):
-        return self.config.get(key, default)
+        return self.snapshot.settings.get(key, default)
 
     def get_abs_path(self, relpath):
-        """ ProjectRootPath 기준으로 relpath를 절대경로로 변환합니다. """
-        calculated_path = os.path.abspath(os.path.join(self.project_root, relpath))
-        if self.logger:
-            self.logger.debug(f"DEBUG: get_abs_path (ProjectRoot 기준) '{relpath}' -> '{calculated_path}'")
-        return calculated_path
+        """ ProjectRootPath 기준으로 relpath를 절대경로로 변환합니다. (스냅샷에 메모) """
+        return self.snapshot.abs_path(relpath)
 
     def get_abs_path_from_base_dir(self, relpath):
-        """ 실행 파일(base_dir) 기준으로 relpath를 절대경로로 변환합니다. """
-        calculated_path = os.path.abspath(os.path.join(self.base_dir, relpath))
-        if self.logger:
-            self.logger.debug(f"DEBUG: get_abs_path_from_base_dir (BaseDir 기준) '{relpath}' -> '{calculated_path}'")
-        return calculated_path
+        """ 실행 파일(base_dir) 기준으로 relpath를 절대경로로 변환합니다. (스냅샷에 메모) """
+        return self.snapshot.abs_path_from_base_dir(relpath)
 
     def get_project_root_path(self):
         return self.project_root
@@ -91,36 +235,141 @@ class ConfigManager:
             else:
                 if self.logger: self.logger.warning(f"[WARN] WatchPaths에 지정된 경로가 유효한 디렉토리가 아닙니다: {full_path}")
 
-        main_vcxproj_path_full = self.get_abs_main_vcxproj()
-        main_vcxproj_dir = os.path.dirname(main_vcxproj_path_full)
-
-        if os.path.isdir(main_vcxproj_dir) and main_vcxproj_dir not in abs_paths:
-            abs_paths.append(main_vcxproj_dir)
+        for project_dir in self.get_project_file_dirs():
+            if os.path.isdir(project_dir) and project_dir not in abs_paths:
+                abs_paths.append(project_dir)
 
         final_watch_folders = list(set(abs_paths))
         if self.logger:
-            self.logger.debug(f"최종 감시 폴더: {final_watch_folders}")
+            self.logger.debug("최종 감시 폴더: %s", final_watch_folders)
             self.logger.debug("--- 감시 폴더 목록 계산 종료 ---")
 
         return final_watch_folders
 
     def get_abs_main_vcxproj(self):
         """ 메인 .vcxproj 파일의 절대 경로를 반환합니다. """
-        return self.get_abs_path(self.config.get("MainVcxprojPath", ""))
+        return self.snapshot.main_vcxproj
 
     def get_abs_main_vcxproj_filters(self):
         """ 메인 .vcxproj.filters 파일의 절대 경로를 반환합니다. """
-        return self.get_abs_path(self.config.get("MainVcxprojFiltersPath", ""))
+        return self.snapshot.main_vcxproj_filters
 
     def get_normalized_main_vcxproj_paths(self):
         """ 메인 .vcxproj 및 .vcxproj.filters 파일의 절대 경로를 정규화하여 반환 """
-        main_vcxproj_path = self.get_abs_main_vcxproj()
-        main_vcxproj_filters_path = self.get_abs_main_vcxproj_filters()
+        return self.snapshot.normalized_main_vcxproj_paths
 
-        normalized_vcxproj = os.path.abspath(main_vcxproj_path).lower()
-        normalized_filters = os.path.abspath(main_vcxproj_filters_path).lower()
+    # ------------------------------------------------------------
+    # 다중 프로젝트 (플러그인/프로그램 프로젝트 등)
+    # ------------------------------------------------------------
+    _SLN_PROJECT_RE = re.compile(r'^Project\("\{[^}]+\}"\)\s*=\s*"[^"]*"\s*,\s*"([^"]+\.vcxproj)"', re.IGNORECASE)
+
+    def get_project_files(self):
+        """
+        관리 대상 프로젝트 파일 목록 [(vcxproj, filters)] (절대 경로, 메인 프로젝트가 첫 번째)
+        - MainVcxprojPath / MainVcxprojFiltersPath
+        - ProjectFiles : ["Intermediate/ProjectFiles/Foo.vcxproj", {"Vcxproj": "...", "Filters": "..."}]
+                         (Filters 생략 시 <vcxproj>.filters)
+        - SolutionPath : .sln 의 .vcxproj 중 ProjectRootPath 아래에 있는 것 (엔진 프로젝트는 제외)
+        스냅샷마다 한 번만 계산한다. (.sln 을 다시 읽지 않음)
+        """
+        return list(self.snapshot.memo("project_files", self._resolve_project_files))
+
+    def _resolve_project_files(self, snapshot):
+        projects = [(snapshot.main_vcxproj, snapshot.main_vcxproj_filters)]
+        for entry in snapshot.settings.get("ProjectFiles", []):
+            if isinstance(entry, dict):
+                vcxproj = snapshot.abs_path(entry.get("Vcxproj", ""))
+                filters = snapshot.abs_path(entry["Filters"]) if entry.get("Filters") else vcxproj + ".filters"
+            else:
+                vcxproj = snapshot.abs_path(entry)
+                filters = vcxproj + ".filters"
+            projects.append((vcxproj, filters))
+        if snapshot.settings.get("SolutionPath"):
+            projects.extend((v, v + ".filters") for v in self._discover_solution_projects(snapshot))
 
-        return normalized_vcxproj, normalized_filters
+        unique, seen = [], set()
+        for vcxproj, filters in projects:
+            key = os.path.normcase(vcxproj)
+            if key not in seen:
+                seen.add(key)
+                unique.append((vcxproj, filters))
+        return unique
+
+    def _discover_solution_projects(self, snapshot):
+        sln_path = snapshot.abs_path(snapshot.settings.get("SolutionPath"))
+        try:
+            with open(sln_path, "r", encoding="utf-8-sig", errors="replace") as f:
+                lines = f.readlines()
+        except OSError as e:
+            if self.logger: self.logger.warning(f"솔루션 파일을 읽을 수 없습니다: {sln_path} - {e}")
+            return []
+
+        root = os.path.normcase(snapshot.project_root) + os.sep
+        sln_dir = os.path.dirname(sln_path)
+        found = []
+        for line in lines:
+            match = self._SLN_PROJECT_RE.match(line.strip())
+            if not match:
+                continue
+            vcxproj = os.path.abspath(os.path.join(sln_dir, match.group(1).replace("\\", os.sep)))
+            if os.path.normcase(vcxproj).startswith(root):
+                found.append(vcxproj)
+            elif self.logger:
+                self.logger.debug("프로젝트 루트 밖의 솔루션 프로젝트 제외: %s", vcxproj)
+        return found
+
+    def get_project_file_dirs(self):
+        """ 프로젝트 파일들이 있는 폴더 목록 (중복 제거) """
+        dirs = []
+        for vcxproj, filters in self.get_project_files():
+            for path in (vcxproj, filters):
+                d = os.path.dirname(path)
+                if d not in dirs:
+                    dirs.append(d)
+        return dirs
+
+    def get_normalized_project_file_paths(self):
+        """ 모든 프로젝트의 .vcxproj/.vcxproj.filters 정규화 경로 집합 (이벤트 판정용) """
+        return self.snapshot.memo("normalized_project_file_paths", lambda snapshot: frozenset(
+            os.path.abspath(path).lower() for pair in self._resolve_project_files(snapshot) for path in pair))
+
+    # ------------------------------------------------------------
+    # 다중 루트 (한 프로세스에서 여러 .uproject 체크아웃 감시)
+    # ------------------------------------------------------------
+    def get_root_name(self):
+        return self.get_setting("RootName") or os.path.basename(self.project_root.rstrip("\\/")) or "root"
+
+    def get_root_configs(self):
+        """
+        감시할 루트별 ConfigManager 목록
+        - Roots 가 없으면 [self] (기존 단일 루트)
+        - Roots : ["D:/GameB/AutoGenerate/config.json",             → 그 config.json 을 그대로 사용
+                   {"RootName": "GameC", "ProjectRootPath": "..."}]  → 이 config.json 위에 적은 키만 덮어씀
+          이 config.json 자체에 MainVcxprojPath 가 있으면 첫 번째 루트로 포함한다.
+        """
+        roots = self.get_setting("Roots")
+        if not roots:
+            return [self]
+
+        configs = [self] if self.get_setting("MainVcxprojPath") else []
+        for entry in roots:
+            if isinstance(entry, dict):
+                configs.append(ConfigManager(self.config_path, overrides=entry))
+            else:
+                configs.append(ConfigManager(self.get_abs_path_from_base_dir(entry)))
+        for config in configs:
+            if config is not self and self.logger:
+                config.logger = self.logger
+
+        unique, seen = [], set()
+        for config in configs:
+            key = os.path.normcase(config.project_root)
+            if key in seen:
+                if self.logger: self.logger.warning(f"중복된 루트는 한 번만 감시합니다: {config.project_root}")
+                continue
+            seen.add(key)
+            unique.append(config)
+        return unique
 
     def get_main_vcxproj_paths(self):
         """ 메인 .vcxproj 및 .vcxproj.filters 파일의 원본 절대 경로를 반환 """
@@ -129,10 +378,14 @@ class ConfigManager:
         return main_vcxproj_path, main_vcxproj_filters_path
 
     def get_abs_backup_dir(self):
-        return self.get_abs_path_from_base_dir(self.config.get("BackupDir", "backup"))
+        return self.snapshot.backup_dir
 
     def get_abs_logfile(self):
-        return self.get_abs_path_from_base_dir(self.config.get("LogPath", "Logs/Watcher.log"))
+        return self.snapshot.logfile
+
+    def get_abs_report_dir(self):
+        """ 실행(run)별 삭제 리포트(JSON-lines)를 저장할 폴더의 절대 경로 """
+        return self.snapshot.report_dir
 
     def get_abs_uproject_path(self):
-        return os.path.join(self.project_root, self.get_setting("MainUprojectPath", ""))
\ No newline at end of file
+        return self.snapshot.uproject_path
\ No newline at end of file
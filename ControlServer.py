@@ -0,0 +1,217 @@
+# ControlServer.py
+import json
+import os
+import secrets
+import socket
+import socketserver
+import threading
+import time
+
+
+PAUSE_REASON = "control:pause"
+MAX_REQUEST_BYTES = 64 * 1024
+REPORT_TAIL_LINES = 200
+
+
+class ControlServer:
+    """
+    실행 중인 감시기의 로컬 제어 채널. (127.0.0.1 TCP, 한 줄 JSON 요청 → 한 줄 JSON 응답)
+    재시작(=캐시 재로딩) 없이 외부 도구가 상태 조회/갱신 요청을 할 수 있게 한다.
+      요청: {"token": "...", "command": "status", "root": "GameA"(선택), "args": {...}}
+      응답: {"ok": true, "result": ...} / {"ok": false, "error": "..."}
+    - 포트 0 이면 OS 가 고른 빈 포트를 쓰고, 포트/토큰/pid 를 endpoint 파일에 기록한다. (watcherctl.py 가 읽음)
+    - 토큰이 맞지 않는 요청은 거부 (같은 PC 의 다른 사용자/프로세스 차단용)
+    명령: ping, status, update, report, pause, resume, metrics
+    """
+
+    COMMANDS = ("ping", "status", "update", "report", "pause", "resume", "metrics")
+
+    def __init__(self, root_set, logger, metrics, endpoint_path, port=0):
+        self.root_set = root_set
+        self.logger = logger
+        self.metrics = metrics
+        self.endpoint_path = endpoint_path
+        self.port = int(port or 0)
+        self.token = secrets.token_hex(16)
+        self.started = time.time()
+        self._server = None
+        self._thread = None
+
+    @classmethod
+    def from_config(cls, root_set, config_manager, logger, metrics):
+        if not config_manager.get_setting("ControlServer", True):
+            return None
+        endpoint = config_manager.get_abs_path_from_base_dir(
+            config_manager.get_setting("ControlEndpointFile", "control_endpoint.json"))
+        return cls(root_set, logger, metrics, endpoint, port=config_manager.get_setting("ControlPort", 0))
+
+    # ------------------------------------------------------------
+    # 서버 수명
+    # ------------------------------------------------------------
+    def start(self):
+        try:
+            self._server = _Server(("127.0.0.1", self.port), self._make_handler())
+        except OSError as e:
+            self.logger.error(f"제어 채널 시작 실패 (port {self.port}): {e}")
+            self._server = None
+            return False
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ControlServer", daemon=True)
+        self._thread.start()
+        self._write_endpoint()
+        self.logger.info(f"제어 채널 시작: 127.0.0.1:{self.port} (endpoint: {self.endpoint_path})")
+        return True
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        try:
+            with open(self.endpoint_path, "r", encoding="utf-8") as f:
+                mine = json.load(f).get("pid") == os.getpid()
+            if mine:
+                os.remove(self.endpoint_path)
+        except (OSError, ValueError):
+            pass
+
+    def _write_endpoint(self):
+        os.makedirs(os.path.dirname(self.endpoint_path) or ".", exist_ok=True)
+        tmp_path = self.endpoint_path + ".tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        with os.fdopen(os.open(tmp_path, flags, 0o600), "w", encoding="utf-8") as f:
+            json.dump({"host": "127.0.0.1", "port": self.port, "token": self.token, "pid": os.getpid()}, f)
+        os.replace(tmp_path, self.endpoint_path)
+
+    def _make_handler(self):
+        control = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline(MAX_REQUEST_BYTES)
+                response = control.handle_line(line)
+                self.wfile.write(json.dumps(response, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+
+        return _Handler
+
+    # ------------------------------------------------------------
+    # 명령 처리
+    # ------------------------------------------------------------
+    def handle_line(self, line):
+        try:
+            request = json.loads(line.decode("utf-8"))
+        except (ValueError, UnicodeDecodeError):
+            return {"ok": False, "error": "요청은 한 줄 JSON 이어야 합니다."}
+        if not isinstance(request, dict) or not secrets.compare_digest(str(request.get("token", "")), self.token):
+            self.metrics.inc("control_requests_total", command="unauthorized")
+            return {"ok": False, "error": "토큰이 올바르지 않습니다."}
+        return self.execute(request.get("command", ""), request.get("root"), request.get("args") or {})
+
+    def execute(self, command, root=None, args=None):
+        if command not in self.COMMANDS:
+            return {"ok": False, "error": f"알 수 없는 명령: {command} (가능: {', '.join(self.COMMANDS)})"}
+        self.metrics.inc("control_requests_total", command=command)
+        try:
+            roots = self._select_roots(root)
+            return {"ok": True, "result": getattr(self, f"_cmd_{command}")(roots, args or {})}
+        except (LookupError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            self.logger.error(f"제어 명령 처리 중 오류 ({command}): {e}", exc_info=True)
+            return {"ok": False, "error": f"내부 오류: {e}"}
+
+    def _select_roots(self, name):
+        if not name:
+            return list(self.root_set.roots)
+        for root in self.root_set.roots:
+            if root.name == name:
+                return [root]
+        raise LookupError(f"루트를 찾을 수 없습니다: {name} (가능: {', '.join(r.name for r in self.root_set.roots)})")
+
+    def _cmd_ping(self, roots, args):
+        return {"pid": os.getpid(), "uptime_seconds": round(time.time() - self.started, 1)}
+
+    def _cmd_status(self, roots, args):
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "queued_runs": self.root_set.generator_queue.pending(),
+            "roots": [{
+                "name": root.name,
+                "project_root": root.config_manager.get_project_root_path(),
+                "running": root.orchestrator.is_running(),
+                "paused": PAUSE_REASON in root.orchestrator.hold_reasons(),
+                "holds": root.orchestrator.hold_reasons(),
+                "pending_deletes": root.orchestrator.pending_work(),
+                **self._reference_status(root),
+                "last_run": root.orchestrator.last_run,
+            } for root in roots],
+        }
+
+    @staticmethod
+    def _reference_status(root):
+        """ 참조 스냅샷 요약 (잠금 없이 현재 스냅샷을 읽음, 캐시 로드 중이면 기다리지 않고 None) """
+        references = root.orchestrator.references
+        if not references.is_loaded():
+            return {"referenced_files": None, "reference_generation": None}
+        snapshot = references.current()
+        return {"referenced_files": len(snapshot), "reference_generation": snapshot.generation,
+                "reference_source": snapshot.source}
+
+    def _cmd_update(self, roots, args):
+        for root in roots:
+            root.logger.info("제어 채널 요청 → 프로젝트 갱신 실행")
+            root.orchestrator.run_full_update("control")
+        return {"requested": [root.name for root in roots]}
+
+    def _cmd_report(self, roots, args):
+        limit = int(args.get("limit", REPORT_TAIL_LINES))
+        reports = []
+        for root in roots:
+            last_run = root.orchestrator.last_run
+            records = []
+            if last_run and last_run.get("report_path"):
+                try:
+                    with open(last_run["report_path"], "r", encoding="utf-8") as f:
+                        lines = f.readlines()
+                    records = [json.loads(line) for line in lines[-limit:] if line.strip()]
+                except (OSError, ValueError):
+                    pass
+            reports.append({"name": root.name, "last_run": last_run, "records": records})
+        return {"roots": reports}
+
+    def _cmd_pause(self, roots, args):
+        for root in roots:
+            root.orchestrator.hold(PAUSE_REASON)
+            root.logger.info("제어 채널 요청 → 갱신 일시 정지 (resume 전까지 요청은 보류)")
+        return {"paused": [root.name for root in roots]}
+
+    def _cmd_resume(self, roots, args):
+        for root in roots:
+            root.orchestrator.release(PAUSE_REASON)
+            root.logger.info("제어 채널 요청 → 갱신 재개")
+        return {"resumed": [root.name for root in roots]}
+
+    def _cmd_metrics(self, roots, args):
+        if args.get("format") == "prometheus":
+            return self.metrics.render_prometheus()
+        return self.metrics.snapshot()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = False
+
+
+def send_command(endpoint_path, command, root=None, args=None, timeout=5.0):
+    """ 제어 채널 클라이언트: endpoint 파일을 읽어 명령 1개를 보내고 응답(dict) 반환 """
+    with open(endpoint_path, "r", encoding="utf-8") as f:
+        endpoint = json.load(f)
+    request = {"token": endpoint["token"], "command": command, "root": root, "args": args or {}}
+    with socket.create_connection((endpoint["host"], endpoint["port"]), timeout=timeout) as sock:
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("제어 채널이 응답 없이 연결을 닫았습니다.")
+    return json.loads(line.decode("utf-8"))
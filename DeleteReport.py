@@ -1,48 +1,88 @@
 import os
-# import sys # sys 모듈은 필요 없으므로 제거 (AppLogger 사용)
+import json
+import time
+from collections import deque
+
 
 class DeleteReport:
-    def __init__(self, logger=None): # logger 인자 추가
-        self.deleted = []
-        self.failed = []
-        self.dryrun = []
-        self.logger = logger # logger 저장 (main에서 주입)
-
-    def add_deleted(self, path): self.deleted.append(path)
-    def add_failed(self, path): self.failed.append(path)
-    def add_dryrun(self, path): self.dryrun.append(path)
-
-    def summary(self, to_file=None):
-        report_lines = []
-        report_lines.append(f"[REPORT] 삭제 성공 {len(self.deleted)}건, 실패 {len(self.failed)}건, DryRun {len(self.dryrun)}건")
-        if self.deleted:
-            report_lines.append(" - 삭제 성공 파일 목록:")
-            for f in self.deleted:
-                report_lines.append(f"    {f}")
-        if self.failed:
-            report_lines.append(" - 삭제 실패 파일 목록:")
-            for f in self.failed:
-                report_lines.append(f"    {f}")
-        if self.dryrun:
-            report_lines.append(" - DryRun 파일 목록:")
-            for f in self.dryrun:
-                report_lines.append(f"    {f}")
-
-        # 모든 리포트 라인을 logger.info로 전달 (콘솔과 파일 모두에 출력)
-        if self.logger:
-            for line in report_lines:
-                self.logger.info(line)
-        else: # logger가 없다면 기존처럼 print 사용 (최후의 보루)
-            print("\n".join(report_lines))
+    """
+    삭제 결과 리포트.
+    - 경로별 결과는 실행(run)마다 하나씩 생성되는 JSON-lines 리포트 파일에 즉시 기록(스트리밍)한다.
+    - 메모리에는 건수 카운터와 결과별 최대 SAMPLE_SIZE개의 샘플 경로만 유지한다.
+    - summary()는 한 줄 요약만 로그로 남긴다. (상세 목록은 리포트 파일 참고)
+    - with 블록으로 쓰면 중간에 예외가 나도 리포트 파일이 닫힌다.
+    """
+
+    SAMPLE_SIZE = 5
+    RESULTS = ("deleted", "failed", "dryrun")
+
+    def __init__(self, logger=None, report_path=None, stage=None):
+        self.logger = logger  # logger 저장 (main에서 주입)
+        self.report_path = report_path
+        self.stage = stage
+        self.counts = {r: 0 for r in self.RESULTS}
+        self.samples = {r: deque(maxlen=self.SAMPLE_SIZE) for r in self.RESULTS}
+        self._fp = None
+        self._write_failed = False
+
+    def add_deleted(self, path): self._add("deleted", path)
+    def add_failed(self, path): self._add("failed", path)
+    def add_dryrun(self, path): self._add("dryrun", path)
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def _add(self, result, path):
+        self.counts[result] += 1
+        self.samples[result].append(path)
+        self._write_record({"ts": round(time.time(), 3), "stage": self.stage, "result": result, "path": path})
 
+    def _write_record(self, record):
+        if not self.report_path or self._write_failed:
+            return
+        try:
+            if self._fp is None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.report_path)), exist_ok=True)
+                self._fp = open(self.report_path, "a", encoding="utf-8")
+            self._fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except Exception as e:
+            # 리포트 기록 실패가 삭제 작업 자체를 막아서는 안 된다.
+            self._write_failed = True
+            self._log_error(f"[DeleteReport] 리포트 파일 기록 실패: {e}")
 
-        if to_file:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._fp is not None:
             try:
-                # 리포트 파일에는 모든 상세 내용을 기록하기 위해 직접 쓰기
-                with open(to_file, "a", encoding="utf-8") as f:
-                    f.write("\n".join(report_lines) + "\n")
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"[DeleteReport] 리포트 파일 저장 실패: {e}", exc_info=True) # exc_info=True 추가
-                else:
-                    print(f"[DeleteReport] 리포트 파일 저장 실패: {e}")
\ No newline at end of file
+                self._fp.close()
+            except Exception:
+                pass
+            self._fp = None
+
+    def summary(self):
+        self.close()
+        stage = f"[{self.stage}] " if self.stage else ""
+        line = (f"[REPORT] {stage}삭제 성공 {self.counts['deleted']}건, 실패 {self.counts['failed']}건, "
+                f"DryRun {self.counts['dryrun']}건")
+        if self.counts["failed"]:
+            line += f" (실패 샘플: {', '.join(self.samples['failed'])})"
+        if self.report_path and self.total and not self._write_failed:
+            line += f" → 상세: {self.report_path}"
+
+        if self.logger:
+            self.logger.info(line)
+        else:  # logger가 없다면 print 사용 (최후의 보루)
+            print(line)
+        return line
+
+    def _log_error(self, msg):
+        if self.logger:
+            self.logger.error(msg)
+        else:
+            print(msg)
@@ -9,24 +9,7 @@ class EventFilter:
     def __init__(self, config_manager):
         self.config_manager = config_manager
         self.normalized_main_vcxproj_path, self.normalized_main_vcxproj_filters_path = self.config_manager.get_normalized_main_vcxproj_paths()
-
-        self.ignored_name_patterns = [p for p in self.config_manager.get_setting("IgnoredNamePatterns",
-                                                                                 ['.obj', '.pdb', '.tmp', '.user',
-                                                                                  '.log', '.ilk',
-                                                                                  '.ipch', '.sdf', '.vs', '.VC.opendb',
-                                                                                  '.suo',
-                                                                                  '.ncb', '.bak', '~', '.swp', '.lock',
-                                                                                  '.autocover', '.asset']) if
-                                      not (p.endswith('.vcxproj') or p.endswith('.vcxproj.filters'))]
-
-        self.ignored_dirs = [d.lower() for d in self.config_manager.get_setting("IgnoredDirs",
-                                                                                ['/intermediate/', '/saved/',
-                                                                                 '/binaries/', '/build/',
-                                                                                 '/deriveddata/', '/staging/',
-                                                                                 '/unrealbuildtool/',
-                                                                                 '/logs/',
-                                                                                 '/backup/'
-                                                                                 ])]
+        self.normalized_project_file_paths = self.config_manager.get_normalized_project_file_paths()
 
         self.recent_events = deque(maxlen=32)
         self.valid_event_types = ['modified', 'created', 'deleted', 'moved', 'renamed']
@@ -35,9 +18,7 @@ class EventFilter:
         return event_type in self.valid_event_types
 
     def is_interesting(self, event):
-        normalized_event_src_path = os.path.abspath(event.src_path).lower()
-        return normalized_event_src_path == self.normalized_main_vcxproj_path or \
-            normalized_event_src_path == self.normalized_main_vcxproj_filters_path
+        return os.path.abspath(event.src_path).lower() in self.normalized_project_file_paths
 
     def is_duplicate(self, event):
         now = time.time()
@@ -54,12 +35,71 @@ class EventFilter:
         if self.is_interesting(event):
             return False
 
-        event_file_name_lower = os.path.basename(event.src_path).lower()
-        if any(p in event_file_name_lower for p in self.ignored_name_patterns):
+        # IgnoredNamePatterns / IgnoredDirs 는 현재 설정 스냅샷의 컴파일된 매처로 판정 (config.json 변경 시 바로 반영)
+        snapshot = self.config_manager.snapshot
+        if snapshot.is_ignored_name(os.path.basename(event.src_path).lower()):
             return True
 
         normalized_path_for_ignored = os.path.abspath(event.src_path).lower().replace(os.sep, '/')
-        if any(d in normalized_path_for_ignored for d in self.ignored_dirs):
+        if snapshot.is_ignored_path(normalized_path_for_ignored):
+            return True
+
+        return False
+
+class EventStormDetector:
+    """
+    git checkout / 대규모 merge 처럼 짧은 시간에 이벤트가 폭주하는 상황(이벤트 스톰) 감지기.
+    - 1초 고정 창 카운터로 O(1) 측정, threshold_per_sec 초과 시 bulk 모드 진입
+    - bulk 모드에서는 마지막 이벤트 시각만 갱신하고, quiet_ms 동안 조용하면 종료 가능(is_quiet)
+    threshold_per_sec <= 0 이면 비활성.
+    """
+
+    WINDOW_SECONDS = 1.0
+
+    def __init__(self, threshold_per_sec=200, quiet_ms=2000):
+        self.threshold_per_sec = threshold_per_sec or 0
+        self.quiet_seconds = max(0.1, (quiet_ms or 0) / 1000.0)
+        self.in_bulk = False
+        self.bulk_started = None
+        self.bulk_events = 0
+        self._window_start = 0.0
+        self._window_count = 0
+        self._last_event = 0.0
+
+    @property
+    def enabled(self):
+        return self.threshold_per_sec > 0
+
+    def record(self, now=None):
+        """ 이벤트 1건 기록. bulk 모드 진입 순간이면 True (이미 bulk 상태면 False) """
+        if not self.enabled:
+            return False
+        now = time.monotonic() if now is None else now
+        self._last_event = now
+        if self.in_bulk:
+            self.bulk_events += 1
+            return False
+
+        if now - self._window_start >= self.WINDOW_SECONDS:
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+        if self._window_count > self.threshold_per_sec:
+            self.in_bulk = True
+            self.bulk_started = now
+            self.bulk_events = self._window_count
             return True
+        return False
+
+    def is_quiet(self, now=None):
+        now = time.monotonic() if now is None else now
+        return now - self._last_event >= self.quiet_seconds
 
-        return False
\ No newline at end of file
+    def end_bulk(self):
+        """ bulk 모드 종료. (bulk 동안 받은 이벤트 수, 지속 시간) 반환 """
+        events, duration = self.bulk_events, time.monotonic() - (self.bulk_started or time.monotonic())
+        self.in_bulk = False
+        self.bulk_started = None
+        self.bulk_events = 0
+        self._window_count = 0
+        return events, duration
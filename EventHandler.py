@@ -1,96 +1,299 @@
 # EventHandler.py
 from watchdog.events import FileSystemEventHandler
 import threading
+import time
 import os
+from Metrics import MetricsRegistry
+from EventTracer import EventTracer
+from EventFilter import EventStormDetector
 
 
 class ChangeHandler(FileSystemEventHandler):
-    def __init__(self, config_manager, logger, event_filter, orchestrator):
+    def __init__(self, config_manager, logger, event_filter, orchestrator, metrics=None, tracer=None, scheduler=None):
         super().__init__()
         self.config_manager = config_manager
         self.logger = logger
         self.event_filter = event_filter
         self.orchestrator = orchestrator
+        self.metrics = metrics or MetricsRegistry()
+        self.tracer = tracer or EventTracer()
+        # 다중 루트: 공유 Scheduler 스레드로 디바운스/스톰 종료 확인 (None 이면 threading.Timer/전용 스레드)
+        self.scheduler = scheduler
 
         self.debounce_lock = threading.Lock()
         self.timer = None
+        self._accepted_events = []  # 이번 디바운스 동안 통과한 이벤트 [(type, path)] (실행 기록의 계기)
 
         self.normalized_main_vcxproj_path, self.normalized_main_vcxproj_filters_path = self.config_manager.get_normalized_main_vcxproj_paths()
-        self.debounce_time_ms = self.config_manager.get_setting("DebounceTimeMs", 1500)
+        self.normalized_project_file_paths = self.config_manager.get_normalized_project_file_paths()
+        # DebounceTimeMs / WatchFileExtensions 는 이벤트마다 현재 설정 스냅샷에서 읽는다 (config.json 변경 시 바로 반영)
 
-        self.watch_exts = set(config_manager.get_setting(
-            "WatchFileExtensions", [".cpp", ".h", ".hpp", ".c", ".inl"]
-        ))
+        # 이벤트 스톰(bulk) 모드
+        self.storm_detector = EventStormDetector(config_manager.get_setting("StormEventsPerSecond", 200),
+                                                 config_manager.get_setting("StormQuietMs", 2000))
+        self.storm_lock = threading.Lock()
+        self._bulk_dirty = False
+
+        # 시작 시 오프라인 대조(warm start) 동안 받은 이벤트 버퍼 (None 이면 버퍼링하지 않음)
+        self.warm_buffer_limit = config_manager.get_setting("WarmStartBufferLimit", 10000)
+        self._warm_lock = threading.Lock()
+        self._warm_buffer = None
+        self._warm_overflowed = False
+
+    @property
+    def debounce_time_ms(self):
+        return self.config_manager.get_setting("DebounceTimeMs", 1500)
 
     def _is_interesting_extension(self, path: str) -> bool:
-        return os.path.splitext(path)[1].lower() in self.watch_exts
-    def on_any_event(self, event):
-        if self._is_filters_change(event):
-            self.orchestrator.run_full_update()
+        return os.path.splitext(path)[1].lower() in self.config_manager.snapshot.watch_ext_set
 
-        if self.orchestrator.is_running():
-            self.logger.debug(f"업데이트 작업 중... 이벤트 무시: {event.src_path}")
-            return
+    # ------------------------------------------------------------
+    # 이벤트 스톰 처리 (git checkout, 대규모 merge 등)
+    # ------------------------------------------------------------
+    def dispatch(self, event):
+        if self.storm_detector.enabled:
+            if self._is_storm_candidate(event):
+                with self.storm_lock:
+                    entered = self.storm_detector.record()
+                    in_bulk = self.storm_detector.in_bulk
+                    if in_bulk:
+                        self._bulk_dirty = True
+                if entered:
+                    self._enter_bulk_mode()
+                if in_bulk:
+                    # bulk 모드: 이벤트별 처리 없이 'dirty' 표시만
+                    self.metrics.inc("events_bulk_total")
+                    return
+            elif self.storm_detector.in_bulk:
+                self.metrics.inc("events_bulk_total")
+                return
+        super().dispatch(event)
 
-        if event.is_directory:
-            self.logger.debug(f"디렉토리 이벤트는 무시: {event.src_path}")
+    def _is_storm_candidate(self, event):
+        """ 스톰 판정에 셀 이벤트인지 (빌드 산출물 이벤트로 bulk 모드에 들어가지 않도록 값싼 검사만) """
+        if not event.is_directory and not self._is_interesting_extension(event.src_path):
+            return False
+        return not self.event_filter.ignore_by_pattern(event)
+
+    def _enter_bulk_mode(self):
+        self.metrics.inc("storm_entered_total")
+        self.tracer.instant("storm_begin", "handler")
+        self.logger.warning(f"⚠️ 이벤트 폭주 감지 (초당 {self.storm_detector.threshold_per_sec}건 초과) → bulk 모드 전환. "
+                            f"{self.storm_detector.quiet_seconds}초간 조용해지면 한 번에 전체 갱신합니다.")
+        with self.debounce_lock:
+            if self.timer:
+                self.timer.cancel()
+        if self.scheduler:
+            self.scheduler.call_later(self._quiet_poll_seconds(), self._poll_quiescence)
+        else:
+            threading.Thread(target=self._wait_for_quiescence, name="StormQuiescence", daemon=True).start()
+
+    def _quiet_poll_seconds(self):
+        return min(0.25, self.storm_detector.quiet_seconds)
+
+    def _wait_for_quiescence(self):
+        while True:
+            time.sleep(self._quiet_poll_seconds())
+            if self._try_end_bulk():
+                return
+
+    def _poll_quiescence(self):
+        if not self._try_end_bulk():
+            self.scheduler.call_later(self._quiet_poll_seconds(), self._poll_quiescence)
+
+    def _try_end_bulk(self):
+        """ 조용해졌으면 bulk 모드를 끝내고 (필요 시) 일괄 반영 후 True """
+        with self.storm_lock:
+            if not self.storm_detector.is_quiet():
+                return False
+            events, duration = self.storm_detector.end_bulk()
+            dirty, self._bulk_dirty = self._bulk_dirty, False
+
+        self.metrics.observe("storm_seconds", duration)
+        self.tracer.instant("storm_end", "handler", {"events": events})
+        self.logger.info(f"bulk 모드 종료: {duration:.1f}초 동안 이벤트 {events}건 수신")
+        if dirty:
+            self._run_reconciliation()
+        return True
+
+    def _run_reconciliation(self):
+        """ bulk 모드 종료 후 전체 갱신 1회. (진행 중인 갱신이 있으면 끝날 때까지 대기) """
+        # 생성기 큐가 있으면 실행 중 요청도 끝난 뒤 1회 더 실행되므로 기다리지 않는다 (Scheduler 스레드 블록 방지)
+        if getattr(self.orchestrator, "work_queue", None) is None:
+            self.orchestrator.wait_idle()
+        self.metrics.inc("storm_reconciliations_total")
+        self.logger.info("bulk 모드 변경 사항 일괄 반영: 전체 갱신 실행")
+        self.orchestrator.run_full_update("storm")
+
+    # ------------------------------------------------------------
+    # 시작 시 오프라인 대조(warm start) 중 이벤트 버퍼링
+    # ------------------------------------------------------------
+    def begin_warm_start(self):
+        """ observer 시작 전에 호출. end_warm_start() 까지 이벤트를 처리하지 않고 버퍼에 모은다. """
+        with self._warm_lock:
+            self._warm_buffer = {}
+            self._warm_overflowed = False
+
+    def is_warming(self):
+        return self._warm_buffer is not None
+
+    def _buffer_if_warming(self, event):
+        with self._warm_lock:
+            if self._warm_buffer is None:
+                return False
+            # 같은 (타입, 경로) 이벤트는 하나로 합치고 마지막 도착 순서로 옮긴다
+            key = (event.event_type, event.src_path, getattr(event, "dest_path", None))
+            self._warm_buffer.pop(key, None)
+            if len(self._warm_buffer) < self.warm_buffer_limit:
+                self._warm_buffer[key] = event
+            else:
+                self._warm_overflowed = True
+        self.metrics.inc("events_buffered_total")
+        return True
+
+    def end_warm_start(self):
+        """
+        오프라인 대조가 끝난 뒤 호출. 버퍼된 이벤트를 도착 순서대로 처리하고, 처리 중 새로 도착한 이벤트까지 비운 뒤 버퍼링을 끝낸다.
+        버퍼 한도(WarmStartBufferLimit)를 넘었으면 개별 처리 대신 bulk 모드처럼 전체 갱신 1회로 반영한다.
+        """
+        replayed = 0
+        while True:
+            with self._warm_lock:
+                if self._warm_buffer is None:
+                    break
+                events, overflowed = list(self._warm_buffer.values()), self._warm_overflowed
+                if not events and not overflowed:
+                    self._warm_buffer = None
+                    break
+                self._warm_buffer, self._warm_overflowed = {}, False
+            if overflowed:
+                self.logger.warning(f"시작 중 이벤트가 버퍼 한도({self.warm_buffer_limit}건)를 넘었습니다 → 전체 갱신 1회로 반영")
+                self.orchestrator.run_full_update("warm-start")
+                continue
+            for event in events:
+                self._process_event(event)
+            replayed += len(events)
+        if replayed:
+            self.logger.info(f"시작 중 버퍼된 이벤트 {replayed}건 처리 완료")
+
+    def on_any_event(self, event):
+        if self._buffer_if_warming(event):
             return
+        self._process_event(event)
+
+    def _process_event(self, event):
+        self.metrics.inc("events_received_total", type=event.event_type)
+        event_id = self.tracer.event_delivered(event)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            outcome = self._handle_event(event)
+        finally:
+            self.metrics.observe("event_handle_seconds", time.perf_counter() - started)
+            self.tracer.event_outcome(event_id, outcome)
+
+    def _filtered(self, reason):
+        self.metrics.inc("events_filtered_total", reason=reason)
+        return f"filtered:{reason}"
+
+    def _handle_event(self, event):
+        # 갱신 중에는 프로젝트 파일 이벤트도 무시 (UBT 가 .vcxproj/.filters 를 다시 쓰는 이벤트로 갱신이 반복되지 않도록)
+        if self.orchestrator.is_running():
+            outcome = self._filtered("busy")
+            self.logger.debug("업데이트 작업 중... 이벤트 무시: %s", event.src_path)
+            return outcome
 
         # Vcxproj 파일 변경은 최우선으로 처리!
-        if self.event_filter.is_interesting(event):
+        if self._is_filters_change(event):
+            if self.orchestrator.is_own_project_write(event.src_path):
+                # 실행이 끝난 뒤 늦게 도착한, 방금 실행(UBT)이 쓴 그대로의 프로젝트 파일 이벤트
+                outcome = self._filtered("own_write")
+                self.logger.debug("직전 갱신이 쓴 프로젝트 파일 이벤트는 무시: %s", event.src_path)
+                return outcome
             self.logger.info(f"⚡ Vcxproj 파일 변경 감지! 즉시 프로젝트 갱신: {event.src_path} ({event.event_type})")
             with self.debounce_lock:
                 if self.timer:
                     self.timer.cancel()
-                self.orchestrator.run_full_update()
-            return
+                events = self._take_accepted_events() + [(event.event_type, event.src_path)]
+                self.orchestrator.run_full_update("vcxproj", events)
+            return "vcxproj"
 
-        normalized_event_src_path = os.path.abspath(event.src_path).lower()
-        watched_extensions = self.config_manager.get_setting("WatchFileExtensions", [])
+        if event.is_directory:
+            outcome = self._filtered("directory")
+            self.logger.debug("디렉토리 이벤트는 무시: %s", event.src_path)
+            return outcome
 
-        is_source_file_event = any(normalized_event_src_path.endswith(ext) for ext in watched_extensions)
+        normalized_event_src_path = os.path.abspath(event.src_path).lower()
+        is_source_file_event = normalized_event_src_path.endswith(self.config_manager.snapshot.watch_exts)
 
         if is_source_file_event and event.event_type == 'modified':
-            self.logger.debug(f"소스 파일 내용 변경은 무시 (최적화): {event.src_path}")
-            return
+            outcome = self._filtered("modified_source")
+            self.logger.debug("소스 파일 내용 변경은 무시 (최적화): %s", event.src_path)
+            return outcome
 
         if not is_source_file_event:
-            self.logger.debug(f"관심 없는 확장자 파일. 무시됨: {event.src_path}")
-            return
+            outcome = self._filtered("extension")
+            self.logger.debug("관심 없는 확장자 파일. 무시됨: %s", event.src_path)
+            return outcome
 
         if not self.event_filter.is_valid_event_type(event.event_type):
-            self.logger.debug(f"무시된 이벤트 타입: {event.event_type} - {event.src_path}")
-            return
+            outcome = self._filtered("event_type")
+            self.logger.debug("무시된 이벤트 타입: %s - %s", event.event_type, event.src_path)
+            return outcome
 
         if self.event_filter.ignore_by_pattern(event):
-            self.logger.debug(f"무시된 패턴: {event.src_path}")
-            return
+            outcome = self._filtered("pattern")
+            self.logger.debug("무시된 패턴: %s", event.src_path)
+            return outcome
 
         if self.event_filter.is_duplicate(event):
-            self.logger.debug(f"중복 이벤트: {event.src_path}")
-            return
+            self.metrics.inc("events_deduped_total")
+            self.logger.debug("중복 이벤트: %s", event.src_path)
+            return "deduped"
 
-        self.logger.info(f"✅ 최종 통과! 이벤트 감지: {event.src_path} ({event.event_type})")
+        # 삭제는 메모리 참조 집합에 바로 반영하고, 프로젝트가 참조하던 파일일 때만 갱신 예약
+        if event.event_type == 'deleted' and not self.orchestrator.handle_file_deleted_pre_ubt(event.src_path):
+            outcome = self._filtered("unreferenced_delete")
+            self.logger.debug("프로젝트가 참조하지 않는 파일 삭제. 갱신 불필요: %s", event.src_path)
+            return outcome
+
+        self.metrics.inc("events_accepted_total")
+        self.logger.info("✅ 최종 통과! 이벤트 감지: %s (%s)", event.src_path, event.event_type)
 
         with self.debounce_lock:
             if self.timer:
+                if not self.timer.finished.is_set():
+                    self.metrics.inc("events_debounced_total")
                 self.timer.cancel()
 
-            self.timer = threading.Timer(self.debounce_time_ms / 1000.0, self.orchestrator.run_full_update)
-            self.timer.start()
-            self.logger.info(f"프로젝트 갱신 예약됨. ({self.debounce_time_ms / 1000.0}초 내 추가 변경 감지 시 재예약)")
+            if len(self._accepted_events) < self.ACCEPTED_EVENT_LIMIT:
+                self._accepted_events.append((event.event_type, event.src_path))
+            debounce_seconds = self.debounce_time_ms / 1000.0
+            self.timer = self._start_timer(debounce_seconds, self._on_debounce_expired)
+            self.metrics.inc("runs_queued_total")
+            self.logger.info(f"프로젝트 갱신 예약됨. ({debounce_seconds}초 내 추가 변경 감지 시 재예약)")
+        return "accepted"
+
+    def _start_timer(self, delay, fn):
+        if self.scheduler:
+            return self.scheduler.call_later(delay, fn)
+        timer = threading.Timer(delay, fn)
+        timer.start()
+        return timer
+
+    ACCEPTED_EVENT_LIMIT = 100
 
-    def on_deleted(self, event):
-        # 소스/헤더 파일이 실제로 지워졌을 때
-        if self._is_interesting_extension(event.src_path):
-            self.logger.info(f"[DEBUG] 실제 삭제 감지, UBT 이전에 직접 처리: {event.src_path}")
-            self.orchestrator.handle_file_deleted_pre_ubt(event.src_path)
+    def _take_accepted_events(self):
+        events, self._accepted_events = self._accepted_events, []
+        return events
+
+    def _on_debounce_expired(self):
+        self.tracer.debounce_expired()
+        with self.debounce_lock:
+            events = self._take_accepted_events()
+        self.orchestrator.run_full_update("debounce", events)
 
     def _is_filters_change(self, event):
         if event.is_directory:
             return False
-        normalized = os.path.abspath(event.src_path).lower()
-        return normalized in (
-            self.normalized_main_vcxproj_path,
-            self.normalized_main_vcxproj_filters_path,
-        )
\ No newline at end of file
+        return os.path.abspath(event.src_path).lower() in self.normalized_project_file_paths
\ No newline at end of file
@@ -0,0 +1,177 @@
+# EventRecorder.py
+import os
+import json
+import gzip
+import time
+import threading
+from watchdog import events as wd_events
+from watchdog.events import FileSystemEventHandler
+
+# 이벤트 타입 ↔ 1글자 코드 (파일 크기 절약)
+_TYPE_CODES = {"created": "c", "deleted": "d", "modified": "m", "moved": "v",
+               "opened": "o", "closed": "x", "closed_no_write": "n"}
+_CODE_TYPES = {v: k for k, v in _TYPE_CODES.items()}
+
+# (이벤트 타입, 디렉토리 여부) → watchdog 이벤트 클래스 (구버전 watchdog에 없는 클래스는 건너뜀)
+_EVENT_CLASSES = {key: getattr(wd_events, name) for key, name in {
+    ("created", False): "FileCreatedEvent", ("created", True): "DirCreatedEvent",
+    ("deleted", False): "FileDeletedEvent", ("deleted", True): "DirDeletedEvent",
+    ("modified", False): "FileModifiedEvent", ("modified", True): "DirModifiedEvent",
+    ("moved", False): "FileMovedEvent", ("moved", True): "DirMovedEvent",
+    ("opened", False): "FileOpenedEvent",
+    ("closed", False): "FileClosedEvent",
+    ("closed_no_write", False): "FileClosedNoWriteEvent",
+}.items() if hasattr(wd_events, name)}
+
+
+def _open_trace(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class EventRecorder(FileSystemEventHandler):
+    """
+    watchdog 원본 이벤트를 타임스탬프와 함께 기록한 뒤 실제 핸들러로 그대로 전달하는 래퍼.
+    파일 형식 (JSON-lines, .gz 확장자면 gzip 압축):
+        1행: {"v": 1, "root": <프로젝트 루트>, "started": <epoch>}
+        이후: [경과ms, 타입코드, src, dest|null, is_dir(0/1)]
+    경로는 프로젝트 루트 기준 상대경로('/' 구분)로 저장해 다른 트리(가짜 프로젝트)에 재생할 수 있다.
+    """
+
+    ENV_VAR = "AUTOGEN_RECORD_EVENTS"
+    FLUSH_INTERVAL_SECONDS = 1.0
+
+    def __init__(self, handler, trace_path, project_root, logger=None):
+        super().__init__()
+        self.handler = handler
+        self.trace_path = trace_path
+        self.project_root = os.path.abspath(project_root)
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._origin = time.monotonic()
+        self._last_flush = self._origin
+        self.recorded = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(trace_path)), exist_ok=True)
+        self._fp = _open_trace(trace_path, "w")
+        self._fp.write(json.dumps({"v": 1, "root": self.project_root, "started": time.time()}) + "\n")
+        if self.logger:
+            self.logger.info(f"watchdog 이벤트 기록 시작: {trace_path}")
+
+    @classmethod
+    def wrap_if_enabled(cls, handler, config_manager, logger):
+        """ 환경변수 AUTOGEN_RECORD_EVENTS 또는 config의 RecordEventsPath 가 있으면 기록 래퍼를 씌운다. """
+        path = os.environ.get(cls.ENV_VAR) or config_manager.get_setting("RecordEventsPath", "")
+        if not path:
+            return handler
+        try:
+            return cls(handler, config_manager.get_abs_path_from_base_dir(path),
+                       config_manager.get_project_root_path(), logger)
+        except OSError as e:
+            logger.error(f"이벤트 기록 파일을 열 수 없어 기록 없이 진행합니다: {e}")
+            return handler
+
+    def _rel(self, path):
+        if not path:
+            return None
+        abs_path = os.path.abspath(path)
+        try:
+            rel = os.path.relpath(abs_path, self.project_root)
+        except ValueError:  # 다른 드라이브
+            return abs_path
+        if rel.startswith(".."):
+            return abs_path
+        return rel.replace(os.sep, "/")
+
+    def dispatch(self, event):
+        now = time.monotonic()
+        record = [round((now - self._origin) * 1000.0, 3),
+                  _TYPE_CODES.get(event.event_type, event.event_type),
+                  self._rel(event.src_path),
+                  self._rel(getattr(event, "dest_path", None)),
+                  1 if event.is_directory else 0]
+        with self._lock:
+            if self._fp:
+                self._fp.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+                self.recorded += 1
+                if now - self._last_flush >= self.FLUSH_INTERVAL_SECONDS:
+                    self._fp.flush()
+                    self._last_flush = now
+        self.handler.dispatch(event)
+
+    def close(self):
+        with self._lock:
+            if self._fp:
+                self._fp.close()
+                self._fp = None
+        if self.logger:
+            self.logger.info(f"watchdog 이벤트 기록 종료: {self.recorded}건 → {self.trace_path}")
+
+
+class EventReplayer:
+    """
+    EventRecorder 로 기록한 파일을 읽어 핸들러에 다시 흘려보낸다.
+    - root: 상대경로를 붙일 프로젝트 루트 (None이면 기록 당시 루트)
+    - speed: 1.0 = 원래 속도, 10.0 = 10배속, 0 = 대기 없이 최대 속도
+    """
+
+    def __init__(self, handler, trace_path, root=None, speed=1.0, logger=None):
+        self.handler = handler
+        self.trace_path = trace_path
+        self.root = root
+        self.speed = float(speed)
+        self.logger = logger
+
+    def _abs(self, root, rel):
+        if rel is None:
+            return None
+        if os.path.isabs(rel):
+            return rel
+        return os.path.join(root, *rel.split("/"))
+
+    def _make_event(self, root, record):
+        _, code, src, dest, is_dir = record
+        event_type = _CODE_TYPES.get(code, code)
+        cls = _EVENT_CLASSES.get((event_type, bool(is_dir)))
+        if cls is None:
+            return None
+        if event_type == "moved":
+            return cls(self._abs(root, src), self._abs(root, dest))
+        return cls(self._abs(root, src))
+
+    def replay(self):
+        """ 재생 후 통계(dict) 반환 """
+        dispatched = skipped = errors = 0
+        with _open_trace(self.trace_path, "r") as f:
+            header = json.loads(f.readline())
+            root = self.root or header.get("root")
+            start = time.monotonic()
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if self.speed > 0:
+                    delay = record[0] / 1000.0 / self.speed - (time.monotonic() - start)
+                    if delay > 0:
+                        time.sleep(delay)
+                event = self._make_event(root, record)
+                if event is None:
+                    skipped += 1
+                    continue
+                try:
+                    self.handler.dispatch(event)
+                except Exception as e:
+                    # 실제 observer 스레드라면 여기서 죽는다 → 재생은 계속하고 건수만 센다.
+                    errors += 1
+                    if self.logger and errors == 1:
+                        self.logger.error(f"이벤트 처리 중 예외 (이후 동일 예외는 건수만 집계): {e}", exc_info=True)
+                dispatched += 1
+            elapsed = time.monotonic() - start
+
+        stats = {"events": dispatched, "skipped": skipped, "errors": errors, "seconds": round(elapsed, 3),
+                 "events_per_second": round(dispatched / elapsed, 1) if elapsed > 0 else None}
+        if self.logger:
+            self.logger.info(f"이벤트 재생 완료: {stats}")
+        return stats
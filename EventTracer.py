@@ -0,0 +1,169 @@
+# EventTracer.py
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+
+
+class EventTracer:
+    """
+    (옵트인) 파일 이벤트 → 프로젝트 갱신 완료까지의 타임라인을 Chrome/Perfetto trace-event JSON으로 기록한다.
+    - 이벤트마다 async 트랙(file_event) 하나: watchdog 전달 → ChangeHandler 수락/필터 → 디바운스 만료 → run 완료(ready)
+    - Orchestrator 단계/UBT 실행은 실행 스레드 위의 complete(X) 이벤트로 기록
+    - JSON Array 형식으로 스트리밍 기록하므로 프로세스가 비정상 종료돼도 파일을 그대로 열 수 있다.
+      (닫는 ']' 가 없어도 trace viewer 는 읽는다. close() 하면 배열을 닫아 일반 JSON 파서로도 읽힌다)
+    결과 파일은 chrome://tracing 또는 https://ui.perfetto.dev 에서 연다.
+    """
+
+    ENV_VAR = "AUTOGEN_TRACE_EVENTS"
+
+    def __init__(self, trace_path=None, logger=None):
+        self.trace_path = trace_path
+        self.logger = logger
+        self.enabled = bool(trace_path)
+        self._lock = threading.Lock()
+        self._fp = None
+        self._separator = ""
+        self._pid = os.getpid()
+        self._origin_ns = time.perf_counter_ns()
+        self._next_event_id = 0
+        self._pending_event_ids = []
+        self._named_threads = set()
+
+        if self.enabled:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(trace_path)), exist_ok=True)
+                self._fp = open(trace_path, "w", encoding="utf-8")
+                self._fp.write("[")
+                self._emit({"name": "process_name", "ph": "M", "pid": self._pid, "tid": 0,
+                            "args": {"name": "ProjectWatcher"}})
+                if self.logger:
+                    self.logger.info(f"이벤트 트레이스 기록 시작: {trace_path}")
+            except Exception as e:
+                self.enabled = False
+                self._fp = None
+                if self.logger:
+                    self.logger.error(f"이벤트 트레이스 파일 생성 실패: {e}")
+
+    @classmethod
+    def from_config(cls, config_manager, logger):
+        """ 환경변수 AUTOGEN_TRACE_EVENTS 또는 config의 TraceEventsPath 가 있으면 활성화 """
+        path = os.environ.get(cls.ENV_VAR) or config_manager.get_setting("TraceEventsPath", "")
+        if not path:
+            return cls(None, logger)
+        return cls(config_manager.get_abs_path_from_base_dir(path), logger)
+
+    # ------------------------------------------------------------
+    # 기록 헬퍼
+    # ------------------------------------------------------------
+    def _now_us(self):
+        return (time.perf_counter_ns() - self._origin_ns) / 1000.0
+
+    def _emit(self, record):
+        with self._lock:
+            if not self._fp:
+                return
+            tid = record.get("tid")
+            if tid and tid not in self._named_threads:
+                self._named_threads.add(tid)
+                meta = {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+                        "args": {"name": threading.current_thread().name}}
+                self._write_record(meta)
+            self._write_record(record)
+
+    def _write_record(self, record):
+        # 구분자를 앞에 붙인다 → 어느 시점에 끊겨도 끝에 ']' 만 붙이면 유효한 JSON
+        self._fp.write(self._separator + json.dumps(record, ensure_ascii=False))
+        self._separator = ",\n"
+
+    def _base(self, name, cat, ph, args=None):
+        record = {"name": name, "cat": cat, "ph": ph, "ts": self._now_us(),
+                  "pid": self._pid, "tid": threading.get_ident()}
+        if args:
+            record["args"] = args
+        return record
+
+    def instant(self, name, cat="watcher", args=None):
+        if not self.enabled:
+            return
+        record = self._base(name, cat, "i", args)
+        record["s"] = "t"
+        self._emit(record)
+
+    def span(self, name, cat="stage", args=None):
+        """ with tracer.span("ubt", "generator"): ... → 현재 스레드에 complete(X) 이벤트 """
+        if not self.enabled:
+            return nullcontext()
+        return self._span(name, cat, args)
+
+    @contextmanager
+    def _span(self, name, cat, args):
+        record = self._base(name, cat, "X", args)
+        try:
+            yield
+        finally:
+            record["dur"] = self._now_us() - record["ts"]
+            self._emit(record)
+
+    def _async(self, ph, event_id, name="file_event", args=None):
+        record = self._base(name, "event", ph, args)
+        record["id"] = event_id
+        self._emit(record)
+
+    # ------------------------------------------------------------
+    # 파일 이벤트 타임라인
+    # ------------------------------------------------------------
+    def event_delivered(self, event):
+        """ watchdog이 ChangeHandler로 이벤트를 전달한 시점. 추적 id를 돌려준다. (비활성 시 None) """
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._next_event_id += 1
+            event_id = self._next_event_id
+        self._async("b", event_id, args={"path": event.src_path, "type": event.event_type})
+        return event_id
+
+    def event_outcome(self, event_id, outcome):
+        """ ChangeHandler 처리 결과. 수락된 이벤트는 다음 run이 끝날 때까지 트랙을 열어 둔다. """
+        if event_id is None:
+            return
+        if outcome == "accepted":
+            self._async("n", event_id, name="accepted")
+            with self._lock:
+                self._pending_event_ids.append(event_id)
+        else:
+            self._async("e", event_id, args={"outcome": outcome})
+
+    def debounce_expired(self):
+        self.instant("debounce_expired", "handler")
+
+    def run_started(self):
+        """ run 시작 시점까지 수락된 이벤트 id들을 가져간다. """
+        if not self.enabled:
+            return []
+        with self._lock:
+            claimed, self._pending_event_ids = self._pending_event_ids, []
+        for event_id in claimed:
+            self._async("n", event_id, name="run_started")
+        return claimed
+
+    def run_finished(self, claimed_ids):
+        if not self.enabled:
+            return
+        for event_id in claimed_ids:
+            self._async("e", event_id, args={"outcome": "ready"})
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._fp:
+                self._fp.flush()
+
+    def close(self):
+        with self._lock:
+            if self._fp:
+                self._fp.write("\n]\n")
+                self._fp.close()
+                self._fp = None
+        self.enabled = False
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+가짜 Unreal 프로젝트 생성기
+- N개 모듈 × 모듈당 M개 소스 파일(.h/.cpp)
+- .uproject, *.Build.cs, Intermediate/ProjectFiles/<Name>.vcxproj(.filters), <Name>.sln
+- projects > 1 이면 모듈을 여러 .vcxproj 에 나눠 담고 config 에 SolutionPath 지정 (다중 프로젝트)
+- 감시 제외 대상(Intermediate/Build, Binaries, Saved) 더미 파일
+- 도구 폴더(AutoGenerate/config.json) → ConfigManager(config_path=...) 로 바로 사용 가능
+
+사용 예)
+    python FakeProjectGenerator.py C:\\Temp\\FakeGame --modules 20 --files 500
+"""
+
+import os
+import sys
+import json
+import uuid
+import argparse
+from xml.sax.saxutils import quoteattr, escape
+
+MSBUILD_NS = "http://schemas.microsoft.com/developer/msbuild/2003"
+
+
+class FakeProject:
+    """ 생성된 가짜 프로젝트의 경로 정보 """
+
+    def __init__(self, root, name):
+        self.root = os.path.abspath(root)
+        self.name = name
+        self.tool_dir = os.path.join(self.root, "AutoGenerate")
+        self.config_path = os.path.join(self.tool_dir, "config.json")
+        self.uproject_path = os.path.join(self.root, f"{name}.uproject")
+        self.project_files_dir = os.path.join(self.root, "Intermediate", "ProjectFiles")
+        self.vcxproj_path = os.path.join(self.project_files_dir, f"{name}.vcxproj")
+        self.filters_path = self.vcxproj_path + ".filters"
+        self.sln_path = os.path.join(self.root, f"{name}.sln")
+        self.source_files = []
+        self.project_sources = {}  # vcxproj 경로 → 참조 소스 파일 (다중 프로젝트)
+
+    def write_project_files(self, source_files=None, vcxproj_path=None):
+        """ 주어진 소스 파일 목록을 참조하는 .vcxproj / .vcxproj.filters 를 (재)작성한다. (UBT 결과 흉내) """
+        files = self.source_files if source_files is None else list(source_files)
+        vcxproj_path = vcxproj_path or self.vcxproj_path
+        filters_path = vcxproj_path + ".filters"
+        os.makedirs(self.project_files_dir, exist_ok=True)
+
+        compiles, includes, filters = [], [], set()
+        for path in files:
+            rel = os.path.relpath(path, self.project_files_dir)
+            folder = os.path.relpath(os.path.dirname(path), self.root).replace("/", "\\")
+            filters.add(folder)
+            (compiles if path.endswith((".cpp", ".c")) else includes).append((rel, folder))
+
+        with open(vcxproj_path, "w", encoding="utf-8") as f:
+            f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+            f.write(f'<Project DefaultTargets="Build" ToolsVersion="17.0" xmlns="{MSBUILD_NS}">\n')
+            f.write("  <ItemGroup>\n")
+            for rel, _ in compiles:
+                f.write(f"    <ClCompile Include={quoteattr(rel)} />\n")
+            f.write("  </ItemGroup>\n  <ItemGroup>\n")
+            for rel, _ in includes:
+                f.write(f"    <ClInclude Include={quoteattr(rel)} />\n")
+            f.write("  </ItemGroup>\n</Project>\n")
+
+        with open(filters_path, "w", encoding="utf-8") as f:
+            f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+            f.write(f'<Project ToolsVersion="4.0" xmlns="{MSBUILD_NS}">\n  <ItemGroup>\n')
+            for folder in sorted(filters):
+                f.write(f"    <Filter Include={quoteattr(folder)}>\n"
+                        f"      <UniqueIdentifier>{{{uuid.uuid5(uuid.NAMESPACE_URL, folder)}}}</UniqueIdentifier>\n"
+                        f"    </Filter>\n")
+            f.write("  </ItemGroup>\n  <ItemGroup>\n")
+            for rel, folder in compiles:
+                f.write(f"    <ClCompile Include={quoteattr(rel)}>\n      <Filter>{escape(folder)}</Filter>\n"
+                        f"    </ClCompile>\n")
+            f.write("  </ItemGroup>\n  <ItemGroup>\n")
+            for rel, folder in includes:
+                f.write(f"    <ClInclude Include={quoteattr(rel)}>\n      <Filter>{escape(folder)}</Filter>\n"
+                        f"    </ClInclude>\n")
+            f.write("  </ItemGroup>\n</Project>\n")
+
+
+    def write_solution(self, vcxproj_paths):
+        """ 프로젝트 목록을 담은 .sln 작성 (Visual Studio 형식의 Project 줄만) """
+        lines = ["Microsoft Visual Studio Solution File, Format Version 12.00\n"]
+        for path in vcxproj_paths:
+            name = os.path.splitext(os.path.basename(path))[0]
+            rel = os.path.relpath(path, os.path.dirname(self.sln_path)).replace("/", "\\")
+            guid = str(uuid.uuid5(uuid.NAMESPACE_URL, rel)).upper()
+            lines.append(f'Project("{{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}}") = "{name}", "{rel}", "{{{guid}}}"\n')
+            lines.append("EndProject\n")
+        _write(self.sln_path, "".join(lines))
+
+
+def _write(path, content=""):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def _generate_module(module_dir, module_name, file_count):
+    files = []
+    _write(os.path.join(module_dir, f"{module_name}.Build.cs"),
+           f"public class {module_name} : ModuleRules {{ public {module_name}(ReadOnlyTargetRules Target) : base(Target) {{ }} }}\n")
+    for i in range(file_count):
+        class_name = f"{module_name}Class{i // 2:04d}"
+        if i % 2 == 0:
+            path = os.path.join(module_dir, "Public", f"{class_name}.h")
+            _write(path, f"#pragma once\nclass {class_name} {{ public: void Tick(); }};\n")
+        else:
+            path = os.path.join(module_dir, "Private", f"{class_name}.cpp")
+            _write(path, f'#include "{class_name}.h"\nvoid {class_name}::Tick() {{}}\n')
+        files.append(path)
+    return files
+
+
+def generate_fake_project(root, name="FakeGame", modules=4, files_per_module=50, plugins=0, junk_files=20,
+                          projects=1):
+    """
+    root 아래에 가짜 Unreal 프로젝트를 생성하고 FakeProject를 반환한다.
+    총 소스 파일 수 = (modules + plugins) × files_per_module
+    projects > 1 이면 모듈/플러그인을 라운드로빈으로 <name>.vcxproj, <name>Program01.vcxproj ... 에 나눠 담는다.
+    """
+    project = FakeProject(root, name)
+    module_names = [f"{name}Module{i:02d}" for i in range(modules)]
+    vcxproj_paths = [project.vcxproj_path] + [os.path.join(project.project_files_dir, f"{name}Program{i:02d}.vcxproj")
+                                              for i in range(1, max(1, projects))]
+    for path in vcxproj_paths:
+        project.project_sources[path] = []
+
+    for m, module_name in enumerate(module_names):
+        files = _generate_module(os.path.join(project.root, "Source", module_name), module_name, files_per_module)
+        project.source_files.extend(files)
+        project.project_sources[vcxproj_paths[m % len(vcxproj_paths)]].extend(files)
+
+    plugin_entries = []
+    for p in range(plugins):
+        plugin_name = f"{name}Plugin{p:02d}"
+        plugin_dir = os.path.join(project.root, "Plugins", plugin_name)
+        _write(os.path.join(plugin_dir, f"{plugin_name}.uplugin"),
+               json.dumps({"FileVersion": 3, "Modules": [{"Name": plugin_name, "Type": "Runtime"}]}, indent=4))
+        files = _generate_module(os.path.join(plugin_dir, "Source", plugin_name), plugin_name, files_per_module)
+        project.source_files.extend(files)
+        project.project_sources[vcxproj_paths[(modules + p) % len(vcxproj_paths)]].extend(files)
+        plugin_entries.append({"Name": plugin_name, "Enabled": True})
+
+    _write(project.uproject_path, json.dumps({
+        "FileVersion": 3,
+        "EngineAssociation": "5.5",
+        "Modules": [{"Name": m, "Type": "Runtime", "LoadingPhase": "Default"} for m in module_names],
+        "Plugins": plugin_entries,
+    }, indent=4))
+    _write(os.path.join(project.root, "Source", f"{name}.Target.cs"), f"public class {name}Target : TargetRules {{ }}\n")
+
+    # 감시 제외 대상 폴더의 더미 산출물
+    for i in range(junk_files):
+        _write(os.path.join(project.root, "Intermediate", "Build", "Win64", name, f"Module.{i}.gen.cpp"), "// generated\n")
+        _write(os.path.join(project.root, "Binaries", "Win64", f"{name}-{i}.pdb"))
+        _write(os.path.join(project.root, "Saved", "Logs", f"{name}-{i}.log"))
+
+    if len(vcxproj_paths) == 1:
+        project.write_project_files()
+    else:
+        for path, files in project.project_sources.items():
+            project.write_project_files(files, path)
+    project.write_solution(vcxproj_paths)
+
+    config = {
+        "ProjectRootPath": "..",
+        "UnrealEngineRootPath": os.path.join(project.root, "FakeEngine"),
+        "MainUprojectPath": os.path.basename(project.uproject_path),
+        "MainVcxprojPath": os.path.relpath(project.vcxproj_path, project.root),
+        "MainVcxprojFiltersPath": os.path.relpath(project.filters_path, project.root),
+        "LogPath": "Logs/Watcher.log",
+        "WatchPaths": ["Source", "Plugins"],
+        "WatchFileExtensions": [".cpp", ".h", ".hpp", ".c", ".inl"],
+        "DebounceTimeMs": 1500,
+        "DryRun": True,
+        "IgnoredNamePatterns": [".obj", ".pdb", ".tmp", ".user", ".log"],
+        "IgnoredDirs": ["/saved/", "/binaries/", "/build/", "/intermediate/"],
+        "BackupDir": "backup",
+        "PatrolIntervalMinutes": 0,
+    }
+    if len(vcxproj_paths) > 1:
+        config["SolutionPath"] = os.path.basename(project.sln_path)
+    _write(project.config_path, json.dumps(config, indent=4))
+    return project
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="가짜 Unreal 프로젝트 트리 생성기")
+    parser.add_argument("root", help="생성할 프로젝트 루트 폴더")
+    parser.add_argument("--name", default="FakeGame")
+    parser.add_argument("--modules", type=int, default=4)
+    parser.add_argument("--files", type=int, default=50, help="모듈당 소스 파일 수")
+    parser.add_argument("--plugins", type=int, default=0)
+    parser.add_argument("--projects", type=int, default=1, help=".vcxproj 개수 (다중 프로젝트)")
+    args = parser.parse_args(argv)
+
+    project = generate_fake_project(args.root, args.name, args.modules, args.files, args.plugins,
+                                    projects=args.projects)
+    print(f"[INFO] 가짜 프로젝트 생성 완료: {project.root}")
+    print(f"[INFO] 소스 파일 {len(project.source_files)}개, config: {project.config_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,14 @@
 import os
-try:
-    import send2trash
-    SEND2TRASH_AVAILABLE = True
-except ImportError:
-    SEND2TRASH_AVAILABLE = False
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+# send2trash 는 첫 휴지통 삭제 때 import (시작 시간 단축). 설치 여부만 미리 확인
+SEND2TRASH_AVAILABLE = importlib.util.find_spec("send2trash") is not None
+
+
+def _send2trash(path):
+    importlib.import_module("send2trash").send2trash(path)
 
 
 class FileDeleter:
@@ -13,12 +18,19 @@ class FileDeleter:
                False → send2trash(휴지통) 또는 os.remove 로 삭제
     - backup_manager: 삭제 전에 백업을 수행할 수 있는 객체(선택)
     - logger: python logging.Logger 호환 객체(선택)
+    - use_trash: False 이면 send2trash가 있어도 휴지통을 거치지 않고 바로 삭제 (벤치마크 등)
     """
 
-    def __init__(self, dry_run: bool = True, backup_manager=None, logger=None):
+    def __init__(self, dry_run: bool = True, backup_manager=None, logger=None, use_trash: bool = True):
         self.dry_run = dry_run
         self.backup_manager = backup_manager
         self.logger = logger
+        self.use_trash = use_trash and SEND2TRASH_AVAILABLE
+        # 삭제 전 백업 경로 {원본 경로: 백업 경로} (실행 기록용, take_backups() 로 가져가며 비움)
+        # 실행 기록이 켜져 있을 때만 모은다 (record_backups, Orchestrator 가 설정). 꺼져 있으면 아무도 가져가지 않아 계속 쌓인다.
+        self.record_backups = False
+        self._backups = {}
+        self._backups_lock = threading.Lock()
 
     # ---------------------------------------------------
     # Public API
@@ -52,9 +64,9 @@ class FileDeleter:
         try:
             if os.path.isfile(file_path):
                 # 파일: 휴지통으로 이동 시도, 실패 시 직접 삭제
-                if SEND2TRASH_AVAILABLE:
+                if self.use_trash:
                     try:
-                        send2trash.send2trash(file_path)
+                        _send2trash(file_path)
                         self._log_info(f"파일 삭제(휴지통): {file_path}")
                         return True
                     except Exception as e:
@@ -70,9 +82,9 @@ class FileDeleter:
             elif os.path.isdir(file_path):
                 # 폴더: 내부가 비어 있을 때만 삭제
                 if not os.listdir(file_path):
-                    if SEND2TRASH_AVAILABLE:
+                    if self.use_trash:
                         try:
-                            send2trash.send2trash(file_path)
+                            _send2trash(file_path)
                             self._log_info(f"빈 폴더 삭제(휴지통): {file_path}")
                             return True
                         except Exception as e:
@@ -97,13 +109,33 @@ class FileDeleter:
 
         return True
 
+    def delete_many(self, paths, workers: int = 1):
+        """
+        여러 파일을 삭제하고 입력 순서대로 (path, 성공 여부) 를 돌려준다.
+        workers > 1 이면 작업 스레드로 병렬 삭제 (휴지통 이동/백업 복사는 파일마다 I/O 대기가 커서 효과가 크다)
+        """
+        paths = list(paths)
+        if workers <= 1 or len(paths) <= 1:
+            return [(path, self.delete(path)) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths)), thread_name_prefix="Delete") as pool:
+            return list(zip(paths, pool.map(self.delete, paths)))
+
+    def take_backups(self):
+        """지금까지 백업한 {원본 경로: 백업 경로} 를 돌려주고 비운다."""
+        with self._backups_lock:
+            backups, self._backups = self._backups, {}
+        return backups
+
     # ---------------------------------------------------
     # Internal Helpers
     # ---------------------------------------------------
     def _backup_if_needed(self, file_path: str) -> bool:
         """백업 매니저가 있으면 삭제 전 백업 수행."""
         try:
-            self.backup_manager.backup(file_path)
+            backup_path = self.backup_manager.backup(file_path)
+            if backup_path and self.record_backups:
+                with self._backups_lock:
+                    self._backups[file_path] = backup_path
             self._log_info(f"백업 완료: {file_path}")
             return True
         except Exception as e:
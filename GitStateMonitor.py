@@ -0,0 +1,145 @@
+# GitStateMonitor.py
+import os
+import threading
+import time
+from watchdog.events import FileSystemEventHandler
+
+
+def find_git_dir(start_path):
+    """
+    start_path 에서 위로 올라가며 git 디렉토리를 찾는다.
+    - .git 폴더 → 그대로 반환
+    - .git 파일(worktree/submodule, 'gitdir: <path>') → 가리키는 폴더 반환
+    """
+    current = os.path.abspath(start_path)
+    while True:
+        candidate = os.path.join(current, ".git")
+        if os.path.isdir(candidate):
+            return candidate
+        if os.path.isfile(candidate):
+            try:
+                with open(candidate, "r", encoding="utf-8") as f:
+                    content = f.read().strip()
+                if content.startswith("gitdir:"):
+                    git_dir = content[len("gitdir:"):].strip()
+                    if not os.path.isabs(git_dir):
+                        git_dir = os.path.join(current, git_dir)
+                    git_dir = os.path.normpath(git_dir)
+                    if os.path.isdir(git_dir):
+                        return git_dir
+            except OSError:
+                pass
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+class GitStateMonitor(FileSystemEventHandler):
+    """
+    git 작업(checkout, rebase, merge, cherry-pick ...) 진행 중에는 작업 트리가 반쯤 바뀐 상태이므로
+    그동안 요청된 갱신을 보류(orchestrator.hold)하고, 작업이 끝나면 한 번에 처리(release)한다.
+    - git 디렉토리를 비재귀로 감시하며 MARKERS 파일/폴더의 생성·삭제만 본다.
+    - 마커가 사라진 뒤 settle_ms 동안 다시 생기지 않으면 해제 (연속된 git 명령 사이의 틈 흡수)
+    - 비정상 종료로 남은 index.lock 등에 대비해 max_hold_seconds 가 지나면 강제로 해제
+    """
+
+    MARKERS = ("index.lock", "HEAD.lock", "rebase-merge", "rebase-apply",
+               "MERGE_HEAD", "CHERRY_PICK_HEAD", "REVERT_HEAD")
+    HOLD_REASON = "git"
+
+    def __init__(self, orchestrator, logger, git_dir, metrics=None, settle_ms=500, max_hold_seconds=600):
+        super().__init__()
+        self.orchestrator = orchestrator
+        self.logger = logger
+        self.git_dir = git_dir
+        self.metrics = metrics or orchestrator.metrics
+        self.settle_seconds = max(0.0, settle_ms / 1000.0)
+        self.max_hold_seconds = max_hold_seconds
+        self._lock = threading.Lock()
+        self._held_since = None
+        self._release_timer = None
+        self._hold_generation = 0
+
+    @classmethod
+    def create_if_available(cls, orchestrator, config_manager, logger, metrics=None):
+        """ GitAwareness 설정이 켜져 있고 프로젝트가 git 저장소 안에 있으면 모니터를 만든다. """
+        if not config_manager.get_setting("GitAwareness", True):
+            return None
+        git_dir = find_git_dir(config_manager.get_project_root_path())
+        if not git_dir:
+            logger.info("프로젝트가 git 저장소가 아니므로 git 작업 감지를 사용하지 않습니다.")
+            return None
+        return cls(orchestrator, logger, git_dir, metrics,
+                   settle_ms=config_manager.get_setting("GitSettleMs", 500),
+                   max_hold_seconds=config_manager.get_setting("GitMaxHoldSeconds", 600))
+
+    def start(self, observer):
+        observer.schedule(self, self.git_dir, recursive=False)
+        self.logger.info(f"git 작업 감지 시작: {self.git_dir}")
+        self.refresh()
+
+    # ------------------------------------------------------------
+    # 상태 판정
+    # ------------------------------------------------------------
+    def active_markers(self):
+        return [m for m in self.MARKERS if os.path.exists(os.path.join(self.git_dir, m))]
+
+    def is_busy(self):
+        return bool(self.active_markers())
+
+    def on_any_event(self, event):
+        names = {os.path.basename(event.src_path)}
+        dest = getattr(event, "dest_path", None)
+        if dest:
+            names.add(os.path.basename(dest))
+        if names.intersection(self.MARKERS):
+            self.refresh()
+
+    def refresh(self):
+        markers = self.active_markers()
+        with self._lock:
+            if markers:
+                if self._release_timer:
+                    self._release_timer.cancel()
+                    self._release_timer = None
+                if self._held_since is None:
+                    self._start_hold(markers)
+            elif self._held_since is not None and self._release_timer is None:
+                self._release_timer = threading.Timer(self.settle_seconds, self._settled, args=(self._hold_generation,))
+                self._release_timer.daemon = True
+                self._release_timer.start()
+
+    def _start_hold(self, markers):
+        self._held_since = time.monotonic()
+        self._hold_generation += 1
+        self.metrics.inc("git_holds_total")
+        self.orchestrator.hold(self.HOLD_REASON)
+        self.logger.info(f"git 작업 진행 중 ({', '.join(markers)}) → 프로젝트 갱신을 보류합니다.")
+        if self.max_hold_seconds and self.max_hold_seconds > 0:
+            guard = threading.Timer(self.max_hold_seconds, self._force_release, args=(self._hold_generation,))
+            guard.daemon = True
+            guard.start()
+
+    def _settled(self, generation):
+        if self.is_busy():
+            with self._lock:
+                self._release_timer = None
+            return
+        self._release(generation, "git 작업 완료")
+
+    def _force_release(self, generation):
+        self.logger.warning(f"git 작업 마커가 {self.max_hold_seconds}초 넘게 남아 있습니다 "
+                            f"({', '.join(self.active_markers()) or '-'}). 비정상 종료로 남은 파일인지 확인하세요. 보류를 해제합니다.")
+        self._release(generation, "최대 보류 시간 초과")
+
+    def _release(self, generation, why):
+        with self._lock:
+            if self._held_since is None or generation != self._hold_generation:
+                return
+            held_for = time.monotonic() - self._held_since
+            self._held_since = None
+            self._release_timer = None
+        self.metrics.observe("git_hold_seconds", held_for)
+        self.logger.info(f"{why}: {held_for:.1f}초 보류 후 갱신 보류를 해제합니다.")
+        self.orchestrator.release(self.HOLD_REASON)
@@ -0,0 +1,180 @@
+# IoThrottle.py
+import os
+import sys
+import importlib.util
+import subprocess
+import threading
+import time
+
+# psutil 은 첫 프로세스 조회 때 import (시작 시간 단축). 설치 여부만 미리 확인
+PSUTIL_AVAILABLE = importlib.util.find_spec("psutil") is not None
+
+
+class TokenBucket:
+    """ 초당 rate 개의 토큰이 burst 까지 쌓이는 토큰 버킷. rate <= 0 이면 제한 없음 """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate or 0)
+        self.burst = float(burst if burst is not None else self.rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.rate > 0
+
+    def consume(self, amount):
+        """ amount 만큼 토큰을 쓰고, 부족하면 채워질 때까지 기다린다. 기다린 시간(초) 반환 """
+        if not self.enabled or amount <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class BuildActivityProbe:
+    """
+    UBT/컴파일러 실행 여부 확인. psutil 이 있으면 사용하고, 없으면 /proc(Linux) 또는 tasklist(Windows)로 확인한다.
+    프로세스 목록 조회는 비싸므로 cache_seconds 동안 결과를 재사용한다.
+    """
+
+    DEFAULT_PROCESSES = ["UnrealBuildTool", "cl", "link", "clang", "clang++", "clang-cl", "lld-link",
+                         "MSBuild", "ShaderCompileWorker"]
+
+    def __init__(self, process_names=None, cache_seconds=2.0):
+        names = process_names if process_names is not None else self.DEFAULT_PROCESSES
+        self.process_names = {n.lower().removesuffix(".exe") for n in names}
+        self.cache_seconds = cache_seconds
+        self._checked = 0.0
+        self._busy = False
+        self._lock = threading.Lock()
+
+    def is_busy(self):
+        if not self.process_names:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked >= self.cache_seconds:
+                self._busy = any(name in self.process_names for name in self._process_names())
+                self._checked = now
+            return self._busy
+
+    @staticmethod
+    def _process_names():
+        if PSUTIL_AVAILABLE:
+            psutil = importlib.import_module("psutil")
+            for proc in psutil.process_iter(["name"]):
+                name = proc.info.get("name") or ""
+                yield name.lower().removesuffix(".exe")
+        elif sys.platform.startswith("linux"):
+            for pid in os.listdir("/proc"):
+                if pid.isdigit():
+                    try:
+                        with open(f"/proc/{pid}/comm", "r", encoding="utf-8", errors="replace") as f:
+                            yield f.read().strip().lower()
+                    except OSError:
+                        continue
+        elif os.name == "nt":
+            try:
+                out = subprocess.run(["tasklist", "/FO", "CSV", "/NH"], capture_output=True, text=True, timeout=10,
+                                     creationflags=subprocess.CREATE_NO_WINDOW).stdout
+            except (OSError, subprocess.SubprocessError):
+                return
+            for line in out.splitlines():
+                yield line.split(",", 1)[0].strip('"').lower().removesuffix(".exe")
+
+
+def lower_current_thread_priority():
+    """
+    현재 스레드의 CPU/I/O 우선순위를 낮춘다. (스캔 작업용 스레드에서 호출, 되돌리지 않음)
+    - Windows: THREAD_MODE_BACKGROUND_BEGIN (CPU + I/O + 메모리 우선순위)
+    - Linux  : 스레드 nice +10
+    """
+    try:
+        if os.name == "nt":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_BEGIN)
+        elif hasattr(os, "setpriority"):
+            tid = threading.get_native_id()
+            os.setpriority(os.PRIO_PROCESS, tid, min(19, os.getpriority(os.PRIO_PROCESS, tid) + 10))
+    except (OSError, AttributeError):
+        pass
+
+
+class IoThrottle:
+    """
+    백그라운드 스캔(순찰/재대조/고아 파일 스캔)의 I/O 예산.
+    - 디렉토리 항목 수/바이트 수 토큰 버킷 (초당 entries_per_sec / bytes_per_sec, 0 = 제한 없음)
+    - busy_checks 중 하나라도 참(UBT/컴파일러 실행 중)이면 끝날 때까지 지수 백오프로 대기
+    - 스캔 스레드 초기화용 worker_initializer → 스레드 우선순위를 낮춤
+    기본 생성자는 제한 없음(no-op).
+    """
+
+    def __init__(self, entries_per_sec=0, bytes_per_sec=0, busy_checks=None, backoff_ms=500, max_backoff_ms=8000,
+                 low_priority=False, logger=None, metrics=None):
+        self.entries = TokenBucket(entries_per_sec)
+        self.bytes = TokenBucket(bytes_per_sec)
+        self.busy_checks = list(busy_checks or [])
+        self.backoff_seconds = max(0.01, backoff_ms / 1000.0)
+        self.max_backoff_seconds = max(self.backoff_seconds, max_backoff_ms / 1000.0)
+        self.low_priority = low_priority
+        self.logger = logger
+        self.metrics = metrics
+
+    @classmethod
+    def from_config(cls, config_manager, logger, metrics=None):
+        busy_checks = []
+        processes = config_manager.get_setting("ScanBusyProcesses", BuildActivityProbe.DEFAULT_PROCESSES)
+        if processes:
+            busy_checks.append(BuildActivityProbe(processes).is_busy)
+        return cls(entries_per_sec=config_manager.get_setting("ScanEntriesPerSecond", 20000),
+                   bytes_per_sec=config_manager.get_setting("ScanBytesPerSecond", 32 * 1024 * 1024),
+                   busy_checks=busy_checks,
+                   backoff_ms=config_manager.get_setting("ScanBackoffMs", 500),
+                   max_backoff_ms=config_manager.get_setting("ScanMaxBackoffMs", 8000),
+                   low_priority=config_manager.get_setting("ScanLowPriority", True),
+                   logger=logger, metrics=metrics)
+
+    def add_busy_check(self, check):
+        self.busy_checks.append(check)
+
+    def worker_initializer(self):
+        if self.low_priority:
+            lower_current_thread_priority()
+
+    def is_busy(self):
+        return any(check() for check in self.busy_checks)
+
+    def charge(self, entries=0, nbytes=0):
+        """ 스캔 작업이 쓴 만큼 예산 차감. 예산이 바닥났거나 빌드 중이면 여기서 기다린다. """
+        waited = self._wait_while_busy()
+        waited += self.entries.consume(entries)
+        waited += self.bytes.consume(nbytes)
+        if waited and self.metrics:
+            self.metrics.inc("io_throttle_wait_seconds_total", waited)
+
+    def _wait_while_busy(self):
+        if not self.busy_checks or not self.is_busy():
+            return 0.0
+        started = time.monotonic()
+        delay = self.backoff_seconds
+        if self.logger:
+            self.logger.debug("빌드(UBT/컴파일러) 실행 중 → 백그라운드 스캔 일시 정지")
+        if self.metrics:
+            self.metrics.inc("io_throttle_backoffs_total")
+        while self.is_busy():
+            time.sleep(delay)
+            delay = min(self.max_backoff_seconds, delay * 2)
+        waited = time.monotonic() - started
+        if self.logger:
+            self.logger.debug("빌드 종료 → %.1f초 만에 스캔 재개", waited)
+        return waited
@@ -0,0 +1,254 @@
+# Metrics.py
+import os
+import time
+import bisect
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+
+class RollingHistogram:
+    """
+    누적(lifetime) 버킷 카운트 + 최근 window개 샘플(rolling)을 함께 유지하는 히스토그램.
+    - 버킷/합계/건수는 Prometheus histogram 규약대로 단조 증가
+    - 최근 샘플로 p50/p90/p99를 계산해 '지금' 느린지 확인할 수 있게 한다.
+    """
+
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+    QUANTILES = (0.5, 0.9, 0.99)
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, window=512):
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value):
+        idx = bisect.bisect_left(self.buckets, value)
+        if idx < len(self.bucket_counts):
+            self.bucket_counts[idx] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def quantiles(self):
+        if not self.recent:
+            return {}
+        ordered = sorted(self.recent)
+        last = len(ordered) - 1
+        return {q: ordered[min(last, int(round(q * last)))] for q in self.QUANTILES}
+
+
+class MetricsRegistry:
+    """
+    파이프라인 단계별 타이머/이벤트 카운터 저장소. (스레드 안전)
+    - inc("events_received_total")
+    - with metrics.timer("stage_seconds", stage="ubt"): ...
+    - render_prometheus() → Prometheus text exposition format
+    """
+
+    PREFIX = "autogen_"
+
+    def __init__(self, histogram_window=512):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+        self._histogram_window = histogram_window
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = RollingHistogram(window=self._histogram_window)
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """ 블록 실행 시간을 monotonic 시계로 측정해 histogram에 기록 """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def get_counter(self, name, **labels):
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0)
+
+    def snapshot(self):
+        """ 현재 값을 dict로 반환 (로그/상태 조회용) """
+        with self._lock:
+            counters = {self._format_name(n, l): v for (n, l), v in self._counters.items()}
+            gauges = {self._format_name(n, l): v for (n, l), v in self._gauges.items()}
+            histograms = {
+                self._format_name(n, l): {"count": h.count, "sum": round(h.sum, 6),
+                                          "recent": {str(q): round(v, 6) for q, v in h.quantiles().items()}}
+                for (n, l), h in self._histograms.items()
+            }
+        return {"counters": counters, "gauges": gauges, "histograms": histograms}
+
+    # ------------------------------------------------------------
+    # Prometheus text format
+    # ------------------------------------------------------------
+    @staticmethod
+    def _escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @classmethod
+    def _format_labels(cls, labels, extra=()):
+        items = list(labels) + list(extra)
+        if not items:
+            return ""
+        body = ",".join(f'{k}="{cls._escape(v)}"' for k, v in items)
+        return "{" + body + "}"
+
+    @classmethod
+    def _format_name(cls, name, labels):
+        return cls.PREFIX + name + cls._format_labels(labels)
+
+    def render_prometheus(self):
+        lines = []
+        with self._lock:
+            typed = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                full = self.PREFIX + name
+                if full not in typed:
+                    lines.append(f"# TYPE {full} counter")
+                    typed.add(full)
+                lines.append(f"{full}{self._format_labels(labels)} {value}")
+
+            for (name, labels), value in sorted(self._gauges.items()):
+                full = self.PREFIX + name
+                if full not in typed:
+                    lines.append(f"# TYPE {full} gauge")
+                    typed.add(full)
+                lines.append(f"{full}{self._format_labels(labels)} {value}")
+
+            for (name, labels), hist in sorted(self._histograms.items()):
+                full = self.PREFIX + name
+                if full not in typed:
+                    lines.append(f"# TYPE {full} histogram")
+                    typed.add(full)
+                cumulative = 0
+                for bound, count in zip(hist.buckets, hist.bucket_counts):
+                    cumulative += count
+                    lines.append(f"{full}_bucket{self._format_labels(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{full}_bucket{self._format_labels(labels, [('le', '+Inf')])} {hist.count}")
+                lines.append(f"{full}_sum{self._format_labels(labels)} {hist.sum:.6f}")
+                lines.append(f"{full}_count{self._format_labels(labels)} {hist.count}")
+
+            # 최근 window 기준 분위수 (rolling)
+            for (name, labels), hist in sorted(self._histograms.items()):
+                full = f"{self.PREFIX}{name}_recent"
+                quantiles = hist.quantiles()
+                if not quantiles:
+                    continue
+                if full not in typed:
+                    lines.append(f"# TYPE {full} gauge")
+                    typed.add(full)
+                for q, v in quantiles.items():
+                    lines.append(f"{full}{self._format_labels(labels, [('quantile', q)])} {v:.6f}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """
+    MetricsRegistry 내용을 로컬 스크레이퍼가 읽을 수 있게 내보낸다.
+    - file_path: 주기적으로 Prometheus 텍스트 파일을 원자적으로 덮어쓴다. (node_exporter textfile collector 호환)
+    - http_port: 127.0.0.1:<port>/metrics 로 제공 (0이면 비활성)
+    """
+
+    def __init__(self, registry, logger, file_path=None, http_port=0, interval_seconds=15.0):
+        self.registry = registry
+        self.logger = logger
+        self.file_path = file_path
+        self.http_port = int(http_port or 0)
+        self.interval_seconds = max(1.0, float(interval_seconds))
+        self._stop_event = threading.Event()
+        self._file_thread = None
+        self._http_server = None
+        self._http_thread = None
+
+    def start(self):
+        if self.file_path:
+            self._file_thread = threading.Thread(target=self._file_loop, name="MetricsFileWriter", daemon=True)
+            self._file_thread.start()
+            self.logger.info(f"메트릭 파일 내보내기 시작: {self.file_path} (매 {self.interval_seconds}초)")
+
+        if self.http_port > 0:
+            from http.server import ThreadingHTTPServer  # 엔드포인트를 켤 때만 로드 (시작 시간 단축)
+            try:
+                self._http_server = ThreadingHTTPServer(("127.0.0.1", self.http_port), self._make_handler())
+                self._http_server.daemon_threads = True
+                self._http_thread = threading.Thread(target=self._http_server.serve_forever,
+                                                     name="MetricsHttpServer", daemon=True)
+                self._http_thread.start()
+                self.logger.info(f"메트릭 HTTP 엔드포인트 시작: http://127.0.0.1:{self.http_port}/metrics")
+            except OSError as e:
+                self._http_server = None
+                self.logger.error(f"메트릭 HTTP 엔드포인트 시작 실패 (port {self.http_port}): {e}")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._file_thread:
+            self._file_thread.join()
+            self._file_thread = None
+        if self._http_server:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+    def write_file(self):
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.file_path)), exist_ok=True)
+            tmp_path = self.file_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.registry.render_prometheus())
+            os.replace(tmp_path, self.file_path)
+        except Exception as e:
+            self.logger.error(f"메트릭 파일 기록 실패: {e}")
+
+    def _file_loop(self):
+        while True:
+            self.write_file()
+            if self._stop_event.wait(self.interval_seconds):
+                self.write_file()
+                return
+
+    def _make_handler(self):
+        from http.server import BaseHTTPRequestHandler
+        registry = self.registry
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 스크레이프마다 콘솔에 찍히지 않도록
+
+        return _Handler
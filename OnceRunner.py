@@ -0,0 +1,129 @@
+# OnceRunner.py
+import argparse
+import json
+import os
+import sys
+import time
+
+from AppLogger import AppLogger
+from BackupManager import BackupManager
+from ConfigManager import ConfigManager
+from FileDeleter import FileDeleter
+from ProjectFileManager import ProjectFileManager
+from Orchestrator import UpdateOrchestrator
+from RunHistory import RunHistory
+from RunCoordinator import RunCoordinator
+from SourceSnapshot import SourceTreeSnapshot
+
+EXIT_CLEAN = 0
+EXIT_DRIFT = 1
+EXIT_ERROR = 2
+SAMPLE_SIZE = 5
+
+
+class OnceRunner:
+    """
+    빌드 에이전트용 1회 실행(headless) 모드: watchdog/순찰/제어 채널 없이
+    파싱 → 대조 → 정리 → UBT 1회 → 요약 출력 후 종료한다.
+    - 디스크 소스 목록은 SourceTreeSnapshot(병렬 scandir, 스냅샷 파일 미저장), 프로젝트 파싱은 프로세스 풀 경로 사용
+    - 대조 결과(drift): 프로젝트에 없는 디스크 소스 / 디스크에 없는 프로젝트 항목 / 캐시에만 남은(정리 대상) 파일
+    - check=True 이면 대조만 하고 아무것도 바꾸지 않는다. (CI 검사용)
+    """
+
+    def __init__(self, config_manager, logger, check=False):
+        self.config_manager = config_manager
+        self.logger = logger
+        self.check = check
+
+    def run(self):
+        """ (summary dict, exit code) 반환 """
+        started = time.perf_counter()
+        history = RunHistory.from_config(self.config_manager, self.logger)
+        try:
+            roots = [self._run_root(config, history) for config in self.config_manager.get_root_configs()]
+        finally:
+            history.close()
+        if any(r["error"] for r in roots):
+            exit_code = EXIT_ERROR
+        elif any(r["drift"] for r in roots):
+            exit_code = EXIT_DRIFT
+        else:
+            exit_code = EXIT_CLEAN
+        summary = {"mode": "check" if self.check else "once", "exit_code": exit_code,
+                   "seconds": round(time.perf_counter() - started, 3), "roots": roots}
+        return summary, exit_code
+
+    def _run_root(self, config_manager, history=None):
+        logger = self.logger
+        name = config_manager.get_root_name()
+        result = {"name": name, "project_root": config_manager.get_project_root_path(), "drift": False,
+                  "error": None, "run": None}
+        project_file_manager = ProjectFileManager(config_manager, logger)
+        try:
+            file_deleter = FileDeleter(config_manager.get_setting("DryRun", False),
+                                       BackupManager(config_manager.get_abs_backup_dir(), logger), logger)
+            snapshot = SourceTreeSnapshot.from_config(config_manager, logger, persist=False)
+            orchestrator = UpdateOrchestrator(config_manager, logger, project_file_manager, file_deleter,
+                                              source_snapshot=snapshot, history=history,
+                                              coordinator=RunCoordinator.from_config(config_manager, logger))
+
+            snapshot.scan()
+            current = set(project_file_manager.parse_filters(filters_only=True))
+            if not current:
+                result["error"] = "filters 파싱 실패 (프로젝트 파일 없음/손상)"
+                return result
+
+            on_disk = snapshot.files()
+            referenced = orchestrator._referenced_sources(current)
+            drift = {
+                "not_in_project": sorted(on_disk - referenced),
+                "missing_on_disk": sorted(referenced - on_disk),
+                "stale_cache": sorted(orchestrator.cache_set - current),
+            }
+            result["drift"] = any(drift.values())
+            result["counts"] = {"sources_on_disk": len(on_disk), "referenced": len(current),
+                                **{k: len(v) for k, v in drift.items()}}
+            result["samples"] = {k: v[:SAMPLE_SIZE] for k, v in drift.items() if v}
+            if result["drift"]:
+                orchestrator._log_drift(f"[{name}] 1회 대조", drift["not_in_project"], drift["missing_on_disk"])
+
+            if not self.check:
+                orchestrator.run_full_update("once")
+                result["run"] = orchestrator.last_run
+                # 같은 프로젝트를 갱신 중이던 감시기의 결과를 재사용한 경우도 성공
+                if orchestrator.last_run and orchestrator.last_run["result"] not in ("ok", "reused"):
+                    result["error"] = "갱신 실행 실패 (로그 참고)"
+        except Exception as e:
+            logger.error(f"[{name}] 1회 실행 중 오류: {e}", exc_info=True)
+            result["error"] = str(e)
+        finally:
+            project_file_manager.close()
+        return result
+
+
+def main(argv=None):
+    """ main.py --once 진입점. 요약 JSON 을 stdout 마지막 한 줄로 출력하고 종료 코드로 drift 를 알린다. """
+    parser = argparse.ArgumentParser(description="1회 대조/정리/UBT 실행 후 종료 (빌드 에이전트용)")
+    parser.add_argument("--once", action="store_true", help="(main.py 호환용) 1회 실행 모드")
+    parser.add_argument("--check", action="store_true", help="대조만 하고 삭제/UBT 는 하지 않음")
+    parser.add_argument("--config", help="config.json 경로 (기본: 스크립트 폴더의 config.json)")
+    parser.add_argument("--summary-file", help="요약 JSON 을 파일로도 저장")
+    parser.add_argument("--log-level", default="WARNING", help="콘솔 로그 레벨 (기본 WARNING: stdout 을 요약 위주로)")
+    args = parser.parse_args(argv)
+
+    logger = AppLogger(level=args.log_level)
+    try:
+        config_manager = ConfigManager(config_path=args.config)
+        config_manager.set_logger(logger)
+        summary, exit_code = OnceRunner(config_manager, logger, check=args.check).run()
+    finally:
+        logger.shutdown()
+
+    line = json.dumps(summary, ensure_ascii=False, default=str)
+    if args.summary_file:
+        os.makedirs(os.path.dirname(os.path.abspath(args.summary_file)), exist_ok=True)
+        with open(args.summary_file, "w", encoding="utf-8") as f:
+            f.write(line + "\n")
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+    return exit_code
@@ -2,7 +2,18 @@ import os
 import locale
 import subprocess
 import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
 from DeleteReport import DeleteReport
+from Metrics import MetricsRegistry
+from EventTracer import EventTracer
+from RunProfiler import RunProfiler
+from SourceSnapshot import SourceTreeSnapshot
+from IoThrottle import IoThrottle
+from ProjectFileManager import ProjectFileManager
+from RunHistory import RunHistory
+from RunCoordinator import RunCoordinator
 
 
 class UpdateOrchestrator:
@@ -14,17 +25,62 @@ class UpdateOrchestrator:
     # ------------------------------------------------------------------
     ENABLE_PRE_UBT_DELETE: bool = True
 
-    def __init__(self, config_manager, logger, project_file_manager, file_deleter):
+    def __init__(self, config_manager, logger, project_file_manager, file_deleter, metrics=None, tracer=None,
+                 profiler=None, source_snapshot=None, io_throttle=None, work_queue=None, history=None,
+                 coordinator=None):
         self.config_manager = config_manager
+        self.name = config_manager.get_root_name()
         self.logger = logger
         self.project_file_manager = project_file_manager
         self.file_deleter = file_deleter
+        self.metrics = metrics or MetricsRegistry()
+        self.tracer = tracer or EventTracer()
+        self.profiler = profiler or RunProfiler()
+        self.history = history or RunHistory()
+        if self.history.enabled:
+            file_deleter.record_backups = True
+        # 같은 프로젝트를 갱신하는 다른 프로세스와의 실행 조정 (프로젝트 잠금 파일, 진행 중인 실행 결과 재사용)
+        self.coordinator = coordinator or RunCoordinator()
+        self._source_snapshot = source_snapshot  # 순찰/재대조용 소스 트리 스냅샷 (첫 사용 시 생성)
+        # 백그라운드 스캔 I/O 예산 (자체 UBT 실행 중에도 스캔을 멈춘다)
+        self.io_throttle = io_throttle or IoThrottle()
+        self.io_throttle.add_busy_check(self.is_running)
+        # 다중 루트: 루트들이 공유하는 생성기 큐 (None 이면 호출 스레드에서 바로 실행)
+        self.work_queue = work_queue
+        self.delete_workers = config_manager.get_setting("DeleteWorkers", 4)
 
-        # diff 계산용 캐시 (초기 로드)
-        self.cache_set = set(self.project_file_manager.cached_file_list)
+        # 참조 상태 저장소 (ProjectFileManager 와 공유, 불변 스냅샷 단위로 읽고 원자적으로 커밋)
+        self.references = project_file_manager.reference_store
+        # 다음 실행이 반영해야 할 대기 작업: 이벤트로 이미 참조 집합에서 뺀 삭제 파일
+        self._pending_lock = threading.Lock()
+        self._pending_deletes = set()
+        # 다음 실행의 계기 (실행 기록용): [{"ts", "reason", "events": [(type, path)]}]
+        self._triggers = []
+        # 다음 실행이 반영해야 할 가장 이른 요청 시각 (다른 프로세스의 실행 재사용 판단용)
+        self._requested_at = None
+        self._run_record = None
 
         self._is_running = False
         self.run_lock = threading.Lock()
+        # 진행 중인 갱신이 없을 때 set (재대조 등이 폴링 없이 실행 종료를 기다림)
+        self._idle = threading.Event()
+        self._idle.set()
+        # 마지막 실행 직후 프로젝트 파일 mtime (UBT 가 쓴 파일의 늦은 이벤트로 갱신이 반복되지 않도록)
+        self._project_file_stamps = {}
+
+        # 갱신 보류 (git 작업 진행 중 등) → 해제 시 보류된 요청을 한 번에 실행
+        self._hold_lock = threading.Lock()
+        self._holds = set()
+        self._deferred = False
+
+        # 마지막 실행 요약 (제어 채널 report/status 용)
+        self.last_run = None
+        self._run_counts = {}
+
+    @property
+    def cache_set(self):
+        """ 현재 참조 스냅샷의 파일 집합 (frozenset, 백그라운드 캐시 로드 중이면 완료 대기) """
+        return self.references.current().files
 
     # --------------------------------------------------------------
     # 상태 체크
@@ -32,116 +88,497 @@ class UpdateOrchestrator:
     def is_running(self):
         return self._is_running
 
+    def wait_idle(self, timeout=None):
+        """ 진행 중인 갱신이 끝날 때까지 대기. 제한 시간 안에 끝났으면(또는 실행 중이 아니면) True """
+        return self._idle.wait(timeout)
+
+    def is_held(self):
+        return bool(self._holds)
+
+    def hold_reasons(self):
+        with self._hold_lock:
+            return sorted(self._holds)
+
+    def hold(self, reason):
+        """reason 이 해제될 때까지 run_full_update 요청을 실행하지 않고 보류한다."""
+        with self._hold_lock:
+            self._holds.add(reason)
+
+    def release(self, reason):
+        """보류 해제. 모든 보류가 풀렸고 그동안 요청이 있었다면 전체 갱신을 1회 실행한다."""
+        with self._hold_lock:
+            self._holds.discard(reason)
+            if self._holds or not self._deferred:
+                return
+            self._deferred = False
+        self.logger.info(f"보류 해제({reason}) → 보류된 프로젝트 갱신을 1회 실행합니다.")
+        if self.work_queue is not None:
+            self.run_full_update()
+        else:
+            threading.Thread(target=self.run_full_update, name="DeferredUpdate", daemon=True).start()
+
+    def _defer_if_held(self):
+        with self._hold_lock:
+            if not self._holds:
+                return False
+            self._deferred = True
+            reasons = ", ".join(sorted(self._holds))
+        self.metrics.inc("runs_deferred_total", reason=reasons)
+        self.tracer.instant("run_deferred", "orchestrator", {"reason": reasons})
+        self.logger.info(f"갱신 보류 중({reasons}) → 이번 요청은 보류 해제 후 한 번에 처리합니다.")
+        return True
+
+    @contextmanager
+    def _stage(self, name):
+        """파이프라인 단계 실행 시간을 측정하는 컨텍스트 (stage_seconds{stage=...} + 트레이스 span)"""
+        started = time.perf_counter()
+        try:
+            with self.metrics.timer("stage_seconds", stage=name), \
+                    self.tracer.span(name, "generator" if name == "ubt" else "stage"):
+                yield
+        finally:
+            record = self._run_record
+            if record is not None and record["thread"] == threading.get_ident():
+                record["stages"].append((name, round(time.perf_counter() - started, 6)))
+
     # --------------------------------------------------------------
     # 메인 플로우
     # --------------------------------------------------------------
-    def run_full_update(self):
+    def run_full_update(self, reason=None, events=()):
+        """
+        전체 갱신 요청. reason/events 는 실행 기록(RunHistory)에 남는 계기다.
+        (reason: "debounce", "vcxproj", "patrol" 등, events: [(이벤트 종류, 경로)])
+        """
+        self._note_trigger(reason, events)
+        if self.work_queue is not None and not self.work_queue.in_worker():
+            # 공유 생성기 큐에 넣고 바로 반환. 같은 루트의 요청은 하나로 합쳐지고, 실행 중이면 끝난 뒤 1회 더 실행
+            if self.work_queue.submit(self.name, self._run_full_update_now):
+                self.metrics.inc("runs_enqueued_total")
+            return
+        self._run_full_update_now()
+
+    TRIGGER_LIMIT = 64
+    TRIGGER_EVENT_LIMIT = 100
+
+    def _note_trigger(self, reason, events):
+        now = time.time()
+        with self._pending_lock:
+            if self._requested_at is None:
+                self._requested_at = now
+        if not self.history.enabled:
+            return
+        # 이벤트 경로는 diff/삭제 기록과 같은 정규화 경로로 남긴다 (file_lineage 에서 인덱스로 정확히 일치 검색)
+        trigger = {"ts": now, "reason": reason or "manual",
+                   "events": [(t, ProjectFileManager._normalize_path(p) if p else p)
+                              for t, p in list(events)[:self.TRIGGER_EVENT_LIMIT]]}
+        with self._pending_lock:
+            # 합쳐진 요청은 다음 실행 하나의 계기로 모두 남긴다 (오래된 것부터 버림)
+            self._triggers.append(trigger)
+            del self._triggers[:-self.TRIGGER_LIMIT]
+
+    def _run_full_update_now(self):
+        if self._defer_if_held():
+            return
+
         if not self.run_lock.acquire(blocking=False):
+            self.metrics.inc("runs_skipped_total")
+            self.tracer.instant("run_skipped", "orchestrator")
             self.logger.warning("이미 다른 업데이트 작업이 진행 중입니다. 이번 요청은 건너뜁니다.")
             return
 
         self._is_running = True
+        self._idle.clear()
+        self._report_path = self._new_report_path()
+        self._run_counts = {}
+        self.metrics.inc("runs_executed_total")
+        run_started = time.perf_counter()
+        started_at = datetime.now().isoformat(timespec="seconds")
+        result = "failed"
+        reused_from = None
+        traced_events = self.tracer.run_started()
+        with self._pending_lock:
+            requested_at, self._requested_at = self._requested_at, None
+        if self.history.enabled:
+            with self._pending_lock:
+                triggers, self._triggers = self._triggers, []
+            self._run_record = {"root": self.name, "started": time.time(), "thread": threading.get_ident(),
+                                "triggers": triggers, "stages": [], "diffs": [], "deletions": []}
         try:
-            self.logger.info("VS 프로젝트 갱신/파일 청소 시작!")
+            with self.tracer.span("run_full_update", "orchestrator", {"events": len(traced_events)}):
+                outcome, state = self.coordinator.run(lambda: self.profiler.profile(self._run_pipeline),
+                                                      owner=self.name, requested_at=requested_at)
+            if outcome == "reused":
+                reused_from = {"pid": state.get("pid"), "owner": state.get("owner")}
+                self._reload_after_reuse()
+            result = "ok" if outcome == "ran" else outcome
+            if outcome == "aborted":
+                self.metrics.inc("runs_aborted_total")
+        except Exception as e:
+            self.metrics.inc("runs_failed_total")
+            self.logger.error(f"업데이트 작업 중 예외: {e}", exc_info=True)
+        finally:
+            seconds = time.perf_counter() - run_started
+            self.metrics.observe("run_seconds", seconds)
+            self.last_run = {"started": started_at, "seconds": round(seconds, 3), "result": result,
+                             "deleted": self._run_counts,
+                             "report_path": self._report_path if os.path.exists(self._report_path) else None}
+            if reused_from:
+                self.last_run["reused_from"] = reused_from
+            self.tracer.run_finished(traced_events)
+            self._finish_run_record(seconds, result)
+            self._stamp_project_files()
+            self._is_running = False
+            self.run_lock.release()
+            self._idle.set()
+            self.logger.info("모든 작업 완료. 다시 감시를 시작합니다. ✨")
+
+    def _stamp_project_files(self):
+        stamps = {}
+        for project_file in self.project_file_manager.project_files:
+            for path in project_file:
+                try:
+                    stamps[os.path.abspath(path).lower()] = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+        self._project_file_stamps = stamps
+
+    def is_own_project_write(self, path):
+        """ 프로젝트 파일이 마지막 실행 직후 그대로인지 (이 이벤트는 방금 실행이 쓴 것) """
+        stamp = self._project_file_stamps.get(os.path.abspath(path).lower())
+        if stamp is None:
+            return False
+        try:
+            return os.stat(path).st_mtime_ns == stamp
+        except OSError:
+            return False
+
+    def _reload_after_reuse(self):
+        """ 다른 프로세스의 실행 결과를 재사용했을 때: 그 실행이 커밋한 캐시 파일을 다시 읽는다. (이벤트로 뺀 대기 삭제는 유지) """
+        with self._pending_lock:
+            pending_deletes = set(self._pending_deletes)
+        if self.project_file_manager.reload_cache(exclude=pending_deletes) is None:
+            self.logger.warning("재사용한 실행의 캐시 파일을 읽지 못해 현재 참조 집합을 유지합니다.")
+
+    def _finish_run_record(self, seconds, result):
+        """ 메모리에 모은 이번 실행 기록을 RunHistory 에 한 번에 넘긴다. (쓰기는 기록 스레드에서) """
+        record, self._run_record = self._run_record, None
+        if record is None:
+            return
+        del record["thread"]
+        record.update(seconds=round(seconds, 6), result=result, report_path=self.last_run["report_path"])
+        self.history.record_run(record)
+
+    def _record_diff(self, stage, paths):
+        if self._run_record is not None:
+            self._run_record["diffs"].extend((stage, p) for p in paths)
+
+    def _record_deletions(self, stage, results):
+        """ 삭제 결과 [(path, ok)] 를 실행 기록에 추가 (백업했다면 백업 경로 포함) """
+        if self._run_record is None:
+            return
+        backups = self.file_deleter.take_backups()
+        ok_result = "dryrun" if self.file_deleter.dry_run else "deleted"
+        now = time.time()
+        self._run_record["deletions"].extend(
+            (now, stage, p, ok_result if ok else "failed", backups.get(p)) for p, ok in results)
+
+    def handle_file_deleted_pre_ubt(self, path):
+        """
+        소스 파일 삭제 이벤트를 XML 파싱 없이 반영한다. (O(1))
+        프로젝트가 참조하던 파일이면 메모리 참조 집합에서 빼고 캐시 저널/대기 작업에 기록한 뒤 True(갱신 필요),
+        참조하지 않던 파일이거나 같은 경로에 다시 생긴 경우(에디터의 삭제 후 재생성 저장 등)는 False.
+        """
+        if os.path.exists(path):
+            self.metrics.inc("deletes_handled_total", result="recreated")
+            return False
+        normalized = ProjectFileManager._normalize_path(path)
+        with self._pending_lock:
+            if not self.project_file_manager.journal_remove(normalized):
+                self.metrics.inc("deletes_handled_total", result="unreferenced")
+                self.logger.debug("프로젝트가 참조하지 않는 파일 삭제 → 갱신 불필요: %s", path)
+                return False
+            self._pending_deletes.add(normalized)
+        self.metrics.inc("deletes_handled_total", result="referenced")
+        self.logger.info(f"참조 중인 파일 삭제 반영(캐시 저널 기록): {path}")
+        return True
+
+    def pending_work(self):
+        """다음 실행에서 반영될 대기 작업 수"""
+        with self._pending_lock:
+            return len(self._pending_deletes)
+
+    def reconcile(self, reason):
+        """
+        이벤트 유실(overflow 등) 의심 시 감시 트리와 프로젝트(filters)를 값싸게 대조한다.
+        디스크의 소스 파일 집합과 filters 가 참조하는 (감시 트리 안의) 파일 집합이 다를 때만 전체 갱신(UBT)을 실행한다.
+        """
+        self.wait_idle()
+        self.logger.info(f"감시 트리 재대조 시작 (사유: {reason})")
+        with self._stage("reconcile_scan"):
+            self.source_snapshot.scan()
+            on_disk = self.source_snapshot.files()
+            referenced = self._referenced_sources()
 
-            # [A] filters diff → 즉시 삭제 (옵션)
-            if self.ENABLE_PRE_UBT_DELETE:
-                self.logger.info("=== PRE-UBT 삭제 단계 시작 ===")
+        added = on_disk - referenced
+        removed = referenced - on_disk
+        if not added and not removed:
+            self.metrics.inc("reconciliations_total", result="clean")
+            self.logger.info(f"재대조 결과: 프로젝트와 일치 (소스 {len(on_disk)}개) → 갱신 불필요")
+            return False
+
+        self.metrics.inc("reconciliations_total", result="drift")
+        self._log_drift("재대조", added, removed)
+        self.run_full_update(f"reconcile:{reason}", self._drift_events(added, removed))
+        return True
+
+    def check_offline_changes(self):
+        """
+        시작 시 오프라인 대조 (warm start). 감시를 먼저 시작한 뒤 백그라운드 큐에서 실행되며, 갱신은 요청하지 않고 drift 여부만 반환한다.
+        프로그램이 꺼져 있던 동안의 변경:
+          - 저장된 캐시(마지막 실행의 참조 집합)에만 남은 항목 → 꺼져 있는 동안 프로젝트에서 빠진 파일 (정리 대상)
+          - 저장된 순찰 스냅샷 기준 증분 스캔 후 디스크 소스 ↔ filters 참조 → 추가/삭제된 소스
+        """
+        with self._stage("warm_start"):
+            cached = self.cache_set  # 백그라운드 캐시 로드 완료 대기
+            self.source_snapshot.scan()
+            on_disk = self.source_snapshot.files()
+            current = set(self.project_file_manager.parse_filters(filters_only=True))
+            if not current:
+                self.metrics.inc("warm_starts_total", result="failed")
+                self.logger.warning("시작 시 오프라인 대조: filters 파싱 실패 → 대조를 건너뜁니다.")
+                return False
+            referenced = self._referenced_sources(current)
+
+        added = on_disk - referenced
+        removed = referenced - on_disk
+        stale = cached - current
+        if not added and not removed and not stale:
+            self.metrics.inc("warm_starts_total", result="clean")
+            self.logger.info(f"시작 시 오프라인 대조: 프로젝트와 일치 (소스 {len(on_disk)}개)")
+            return False
+
+        self.metrics.inc("warm_starts_total", result="drift")
+        self._log_drift("시작 시 오프라인 대조", added, removed)
+        if stale:
+            self.logger.warning(f"  꺼져 있는 동안 프로젝트에서 빠진 항목 {len(stale)}개 (정리 대상)")
+        return True
+
+    def patrol_for_changes(self):
+        """
+        정기 순찰 (PatrolThread). 순찰 스냅샷으로 mtime 이 바뀐 폴더만 다시 나열하고,
+        바뀐 파일이 프로젝트와 어긋날 때(새 파일이 filters 에 없음 / 사라진 파일이 filters 에 남음)만 전체 갱신한다.
+        """
+        if self.is_running() or self.is_held():
+            self.logger.debug("갱신 진행/보류 중이므로 이번 순찰은 건너뜁니다.")
+            return False
+
+        with self._stage("patrol_scan"):
+            added, removed = self.source_snapshot.scan()
+        stats = self.source_snapshot.last_stats
+        # 저장된 순찰 스냅샷도 없던 첫 스캔(전체 나열)인지는 스캔이 스냅샷을 읽은 뒤에 판단
+        first_scan = stats["full"]
+        self.metrics.inc("patrols_total")
+        self.logger.debug("순찰: 폴더 %d개 중 %d개 재나열, +%d/-%d (%.3f초)", stats["dirs"], stats["dirs_listed"],
+                          stats["added"], stats["removed"], stats["seconds"])
+        if not added and not removed:
+            return False
+
+        with self._stage("patrol_compare"):
+            referenced = self._referenced_sources()
+            if first_scan:
+                # 스냅샷이 없던 첫 순찰: 전체 목록으로 대조
+                removed = referenced - added
+                added = added - referenced
+            else:
+                added = added - referenced
+                removed = removed & referenced
+        if not added and not removed:
+            self.logger.info("순찰: 파일 변경이 이미 프로젝트에 반영되어 있습니다.")
+            return False
+
+        self.metrics.inc("patrol_drift_total")
+        self._log_drift("순찰", added, removed)
+        self.run_full_update("patrol", self._drift_events(added, removed))
+        return True
+
+    @property
+    def source_snapshot(self):
+        if self._source_snapshot is None:
+            self._source_snapshot = SourceTreeSnapshot.from_config(self.config_manager, self.logger,
+                                                                   throttle=self.io_throttle)
+        return self._source_snapshot
+
+    def _referenced_sources(self, current=None):
+        """ filters 가 참조하는 파일 중 감시 트리 안의 소스 파일 (정규화 경로). current: 이미 파싱한 filters 결과 """
+        prefixes = tuple(ProjectFileManager._normalize_path(r).rstrip("/") + "/" for r in self.source_snapshot.roots)
+        exts = self.source_snapshot.watch_exts
+        if current is None:
+            for _, filters in self.project_file_manager.project_files:
+                try:
+                    self.io_throttle.charge(nbytes=os.path.getsize(filters))
+                except OSError:
+                    pass
+            current = self.project_file_manager.parse_filters(filters_only=True)
+        return {p for p in current
+                if p.startswith(prefixes) and p.endswith(exts)}
+
+    def _drift_events(self, added, removed):
+        events = [("created", p) for p in added] + [("deleted", p) for p in removed]
+        return events[:self.TRIGGER_EVENT_LIMIT]
+
+    def _log_drift(self, what, added, removed):
+        self.logger.warning(f"{what} 결과: 프로젝트에 없는 파일 {len(added)}개, 사라진 파일 {len(removed)}개 → 전체 갱신 실행")
+        for path in list(added)[:5]:
+            self.logger.info(f"  + {path}")
+        for path in list(removed)[:5]:
+            self.logger.info(f"  - {path}")
+
+    def _run_pipeline(self):
+        """ 갱신 파이프라인. 끝까지 진행하면 True, 중단하면 False (RunCoordinator 가 "aborted" 로 기록) """
+        self.logger.info("VS 프로젝트 갱신/파일 청소 시작!")
+        with self._pending_lock:
+            pending_deletes, self._pending_deletes = self._pending_deletes, set()
+        self._record_diff("event", pending_deletes)
+        if pending_deletes:
+            self.logger.info(f"이벤트로 반영된 삭제 파일 {len(pending_deletes)}개 → 이번 갱신에서 프로젝트에서 제거")
+
+        completed = False
+        try:
+            completed = self._run_stages(pending_deletes)
+        finally:
+            if not completed and pending_deletes:
+                # 중단된 실행(filters 파싱 실패, 삭제 대상 과다, 예외)은 대기 삭제를 반영하지 못했다 → 다음 실행으로 넘긴다
+                # (그 사이 같은 경로에 다시 생긴 파일은 제외)
+                with self._pending_lock:
+                    self._pending_deletes.update(p for p in pending_deletes if not os.path.exists(p))
+                self.logger.info(f"갱신이 중단되어 대기 삭제 {len(pending_deletes)}개를 다음 실행으로 넘깁니다.")
+        return completed
+
+    def _run_stages(self, pending_deletes):
+        """ 갱신 단계 실행. 끝까지 진행하면 True, 중간에 중단하면 False """
+        # [A] filters diff → 즉시 삭제 (옵션)
+        if self.ENABLE_PRE_UBT_DELETE:
+            self.logger.info("=== PRE-UBT 삭제 단계 시작 ===")
+            base = self.references.current()  # 이번 단계의 diff/커밋 기준 스냅샷 (파싱 중 삭제 이벤트는 커밋 때 유지)
+            cache_set = base.files
+            with self._stage("filters_parse"):
                 current_set = set(self.project_file_manager.parse_filters(filters_only=True))
-                self.logger.info(f"현재 filters에서 파싱된 파일 수: {len(current_set)}")
-                self.logger.info(f"캐시에 저장된 파일 수: {len(self.cache_set)}")
+            self.logger.info(f"현재 filters에서 파싱된 파일 수: {len(current_set)}")
+            if len(self.project_file_manager.project_files) > 1:
+                for vcxproj, files in self.project_file_manager.project_references.items():
+                    self.logger.debug("  %s: %d개", os.path.basename(vcxproj), len(files))
+            self.logger.info(f"캐시에 저장된 파일 수: {len(cache_set)}")
+            
+            # 경로 정규화 디버깅을 위한 샘플 로그 추가
+            if current_set:
+                self.logger.info("=== 경로 정규화 디버깅 ===")
+                self.logger.info(f"캐시 파일 샘플 (처음 3개):")
+                for i, path in enumerate(list(cache_set)[:3]):
+                    self.logger.info(f"  {i+1}. {path}")
                 
-                # 경로 정규화 디버깅을 위한 샘플 로그 추가
-                if current_set:
-                    self.logger.info("=== 경로 정규화 디버깅 ===")
-                    self.logger.info(f"캐시 파일 샘플 (처음 3개):")
-                    for i, path in enumerate(list(self.cache_set)[:3]):
-                        self.logger.info(f"  {i+1}. {path}")
-                    
-                    self.logger.info(f"현재 파일 샘플 (처음 3개):")
-                    for i, path in enumerate(list(current_set)[:3]):
-                        self.logger.info(f"  {i+1}. {path}")
-                
-                if not current_set:
-                    self.logger.error("Filters 파싱 실패 -> 삭제 작업 중단")
+                self.logger.info(f"현재 파일 샘플 (처음 3개):")
+                for i, path in enumerate(list(current_set)[:3]):
+                    self.logger.info(f"  {i+1}. {path}")
+            
+            if not current_set:
+                self.logger.error("Filters 파싱 실패 -> 삭제 작업 중단")
+                with self._stage("ubt"):
                     self._run_generate_script()
-                    return
+                return False
 
-                removed = self.cache_set - current_set
-                self.logger.info(f"삭제 대상 파일 수: {len(removed)}")
-                
-                # 삭제 대상 샘플 로그 추가
-                if removed:
-                    self.logger.info(f"삭제 대상 샘플 (처음 5개):")
-                    for i, path in enumerate(list(removed)[:5]):
-                        self.logger.info(f"  {i+1}. {path}")
-                        # 파일 존재 확인
-                        if os.path.exists(path):
-                            self.logger.info(f"     ✅ 파일 존재")
-                        else:
-                            self.logger.info(f"     ❌ 파일 존재하지 않음")
+            with self._stage("diff"):
+                removed = cache_set - current_set
+            self._record_diff("pre-ubt", removed)
+            self.logger.info(f"삭제 대상 파일 수: {len(removed)}")
+            
+            # 삭제 대상 샘플 로그 추가
+            if removed:
+                self.logger.info(f"삭제 대상 샘플 (처음 5개):")
+                for i, path in enumerate(list(removed)[:5]):
+                    self.logger.info(f"  {i+1}. {path}")
+                    # 파일 존재 확인
+                    if os.path.exists(path):
+                        self.logger.info(f"     ✅ 파일 존재")
+                    else:
+                        self.logger.info(f"     ❌ 파일 존재하지 않음")
+            
+            MAX_SAFE_DELETE = 50
+            if len(removed) > MAX_SAFE_DELETE:
+                self.logger.warning(f"[DIFF] 삭제 대상이 너무 많음: cache={len(cache_set)} current={len(current_set)} removed={len(removed)} (최대 {MAX_SAFE_DELETE})")
+                return False
+            if removed:
+                self.logger.info(f"[DIFF] 삭제 대상 파일 {len(removed)}개 발견")
+                # 삭제 대상 파일 목록 출력
+                for f in list(removed)[:5]:  # 처음 5개만 출력
+                    self.logger.info(f"삭제 대상: {f}")
+                if len(removed) > 5:
+                    self.logger.info(f"... 외 {len(removed) - 5}개 더")
                 
-                MAX_SAFE_DELETE = 50
-                if len(removed) > MAX_SAFE_DELETE:
-                    self.logger.warning(f"[DIFF] 삭제 대상이 너무 많음: cache={len(self.cache_set)} current={len(current_set)} removed={len(removed)} (최대 {MAX_SAFE_DELETE})")
-                    return
-                if removed:
-                    self.logger.info(f"[DIFF] 삭제 대상 파일 {len(removed)}개 발견")
-                    # 삭제 대상 파일 목록 출력
-                    for f in list(removed)[:5]:  # 처음 5개만 출력
-                        self.logger.info(f"삭제 대상: {f}")
-                    if len(removed) > 5:
-                        self.logger.info(f"... 외 {len(removed) - 5}개 더")
-                    
-                    pre_report = DeleteReport(logger=self.logger)
-                    for f in removed:
-                        self.logger.debug(f"삭제 시도: {f}")
-                        if self.file_deleter.delete(f):
-                            pre_report.add_deleted(f)
-                        else:
-                            pre_report.add_failed(f)
-                    # 캐시 저장
-                    self.cache_set = current_set
-                    self.project_file_manager.save_cache(self.cache_set)
-                    pre_report.summary(to_file=self.config_manager.get_abs_logfile())
-                else:
-                    self.logger.info("삭제 대상 파일이 없습니다.")
-                self.logger.info("=== PRE-UBT 삭제 단계 완료 ===")
-
-            # [B] UBT 실행 (항상 수행)
+                with DeleteReport(logger=self.logger, report_path=self._report_path, stage="pre-ubt") as pre_report:
+                    with self._stage("pre_delete"):
+                        results = self.file_deleter.delete_many(removed, self.delete_workers)
+                        self._record_deletions("pre-ubt", results)
+                        for f, ok in results:
+                            if ok:
+                                pre_report.add_deleted(f)
+                            else:
+                                pre_report.add_failed(f)
+                    self.metrics.inc("files_deleted_total", pre_report.counts["deleted"], stage="pre-ubt")
+                    self.metrics.inc("files_delete_failed_total", pre_report.counts["failed"], stage="pre-ubt")
+                    # 캐시 커밋 (이미 지워진 파일은 UBT 전 filters 에 남아 있어도 제외, 파싱 중 삭제 이벤트도 유지)
+                    with self._stage("cache_save"):
+                        self.project_file_manager.save_cache(current_set - pending_deletes, "pre-ubt", base=base)
+                    self._run_counts["pre-ubt"] = dict(pre_report.counts)
+                    pre_report.summary()
+            else:
+                self.logger.info("삭제 대상 파일이 없습니다.")
+            self.logger.info("=== PRE-UBT 삭제 단계 완료 ===")
+
+        # [B] UBT 실행 (항상 수행)
+        with self._stage("ubt"):
             self._run_generate_script()
 
-            # [C] UBT 후 diff → 후처리(기존 로직 유지)
-            post_report = DeleteReport(logger=self.logger)
+        # [C] UBT 후 diff → 후처리(기존 로직 유지)
+        with self._stage("post_parse"):
             files_to_delete = self.project_file_manager.get_newly_unreferenced_files_and_update_cache()
-            if files_to_delete:
-                self.logger.info(f"UBT 후 새롭게 참조가 끊긴 파일 {len(files_to_delete)}개 삭제")
+        self._record_diff("post-ubt", files_to_delete or ())
+        if files_to_delete:
+            self.logger.info(f"UBT 후 새롭게 참조가 끊긴 파일 {len(files_to_delete)}개 삭제")
+            with DeleteReport(logger=self.logger, report_path=self._report_path, stage="post-ubt") as post_report:
                 deleted_dirs = set()
-                for file_path in files_to_delete:
-                    dir_path = os.path.dirname(file_path)
-                    if self.file_deleter.delete(file_path):
-                        post_report.add_deleted(file_path)
-                        deleted_dirs.add(dir_path)
-                    else:
-                        post_report.add_failed(file_path)
+                with self._stage("post_delete"):
+                    results = self.file_deleter.delete_many(files_to_delete, self.delete_workers)
+                    self._record_deletions("post-ubt", results)
+                    for file_path, ok in results:
+                        if ok:
+                            post_report.add_deleted(file_path)
+                            deleted_dirs.add(os.path.dirname(file_path))
+                        else:
+                            post_report.add_failed(file_path)
+                self.metrics.inc("files_deleted_total", post_report.counts["deleted"], stage="post-ubt")
+                self.metrics.inc("files_delete_failed_total", post_report.counts["failed"], stage="post-ubt")
 
                 # 빈 폴더 정리
-                for dir_path in sorted(deleted_dirs, key=len, reverse=True):
-                    try:
-                        if not os.listdir(dir_path):
-                            self.file_deleter.delete_folder(dir_path)
-                    except (FileNotFoundError, PermissionError):
-                        continue
-                post_report.summary(to_file=self.config_manager.get_abs_logfile())
-            else:
-                self.logger.info("UBT 후: 새롭게 참조 끊긴 파일 없음")
+                with self._stage("folder_cleanup"):
+                    for dir_path in sorted(deleted_dirs, key=len, reverse=True):
+                        try:
+                            if not os.listdir(dir_path):
+                                self.file_deleter.delete_folder(dir_path)
+                        except (FileNotFoundError, PermissionError):
+                            continue
+                self._run_counts["post-ubt"] = dict(post_report.counts)
+                post_report.summary()
+        else:
+            self.logger.info("UBT 후: 새롭게 참조 끊긴 파일 없음")
+        return True
 
-        except Exception as e:
-            self.logger.error(f"업데이트 작업 중 예외: {e}", exc_info=True)
-        finally:
-            self._is_running = False
-            self.run_lock.release()
-            self.logger.info("모든 작업 완료. 다시 감시를 시작합니다. ✨")
+    # --------------------------------------------------------------
+    # 리포트 경로
+    # --------------------------------------------------------------
+    def _new_report_path(self):
+        """실행(run)마다 하나의 JSON-lines 리포트 파일 경로를 만든다. (실제 파일은 첫 기록 시 생성)"""
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return os.path.join(self.config_manager.get_abs_report_dir(), f"run_{ts}.jsonl")
 
     # --------------------------------------------------------------
     # UBT 직접 호출
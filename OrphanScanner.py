@@ -0,0 +1,79 @@
+# OrphanScanner.py
+import os
+import sys
+import json
+import time
+from datetime import datetime
+
+from ProjectFileManager import ProjectFileManager
+from SourceSnapshot import SourceTreeSnapshot
+from IoThrottle import IoThrottle
+
+
+class OrphanScanner:
+    """
+    고아 소스 탐지기: WatchPaths 아래 디스크에는 있지만 .vcxproj/.filters 어디에도 없는 소스 파일을 찾는다.
+    (기존 흐름은 '프로젝트에서 빠진 파일(cache - current)' 한 방향만 본다)
+    - 감시 트리는 SourceTreeSnapshot 으로 작업 스레드 풀에서 병렬 os.scandir 전체 나열 (WatchFileExtensions/IgnoredDirs 적용)
+    - 참조 집합(.vcxproj + .filters)은 sys.intern 한 정규화 경로 집합으로 만들어 O(1) 조회
+    - 결과는 ReportDir 아래 orphans_<ts>.jsonl 로 기록
+    """
+
+    def __init__(self, config_manager, project_file_manager, logger, throttle=None, metrics=None):
+        self.config_manager = config_manager
+        self.project_file_manager = project_file_manager
+        self.logger = logger
+        self.throttle = throttle or IoThrottle()
+        self.metrics = metrics
+
+    def reference_set(self):
+        pfm = self.project_file_manager
+        for path in (p for pair in pfm.project_files for p in pair):
+            try:
+                self.throttle.charge(nbytes=os.path.getsize(path))
+            except OSError:
+                pass
+        return {sys.intern(p) for p in pfm.parse_filters(filters_only=False)}
+
+    def scan(self):
+        """ {"roots", "scanned", "referenced", "orphans", "seconds"} 반환 (orphans 는 디스크 상의 실제 경로) """
+        started = time.perf_counter()
+        snapshot = SourceTreeSnapshot.from_config(self.config_manager, self.logger, throttle=self.throttle,
+                                                  persist=False)
+        snapshot.scan()
+        referenced = self.reference_set()
+
+        scanned = 0
+        orphans = []
+        for path in snapshot.iter_files():
+            scanned += 1
+            if ProjectFileManager._normalize_path(path) not in referenced:
+                orphans.append(path)
+        orphans.sort()
+
+        seconds = time.perf_counter() - started
+        if self.metrics:
+            self.metrics.set_gauge("orphan_sources", len(orphans))
+            self.metrics.observe("orphan_scan_seconds", seconds)
+        self.logger.info(f"고아 소스 스캔 완료: 디스크 소스 {scanned}개, 프로젝트 참조 {len(referenced)}개, "
+                         f"고아 {len(orphans)}개 ({seconds:.2f}초)")
+        for path in orphans[:5]:
+            self.logger.info(f"  고아: {path}")
+        if len(orphans) > 5:
+            self.logger.info(f"  ... 외 {len(orphans) - 5}개 더")
+        return {"roots": snapshot.roots, "scanned": scanned, "referenced": len(referenced),
+                "orphans": orphans, "seconds": round(seconds, 3)}
+
+    def write_report(self, result, report_path=None):
+        """ 고아 목록을 JSON-lines 로 기록하고 경로 반환 """
+        if report_path is None:
+            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            report_path = os.path.join(self.config_manager.get_abs_report_dir(), f"orphans_{ts}.jsonl")
+        os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+        now = datetime.now().isoformat(timespec="seconds")
+        with open(report_path, "w", encoding="utf-8") as f:
+            for path in result["orphans"]:
+                f.write(json.dumps({"ts": now, "stage": "orphan-scan", "result": "orphan", "path": path},
+                                   ensure_ascii=False) + "\n")
+        self.logger.info(f"고아 소스 리포트: {report_path}")
+        return report_path
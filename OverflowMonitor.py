@@ -0,0 +1,162 @@
+# OverflowMonitor.py
+import threading
+import time
+
+
+class OverflowMonitor(threading.Thread):
+    """
+    watchdog 이벤트 유실 감시기.
+    부하가 큰 I/O 중에는 OS 감시 버퍼가 넘쳐 이벤트가 조용히 사라질 수 있고, ChangeHandler 는 이를 알 수 없다.
+    아래 상황을 '유실 의심'으로 보고, 잠잠해진 뒤 orchestrator.reconcile() 로 감시 트리와 프로젝트를 한 번 대조한다.
+      - native      : ReadDirectoryChangesW 버퍼 overflow (Windows, 0바이트 결과)
+      - queue_depth : observer.event_queue 적체가 max_queue_depth 초과 (핸들러가 따라가지 못함)
+      - emitter_dead: 감시 스레드(emitter)가 예외 등으로 죽어 해당 트리 이벤트가 끊김
+                      → 같은 핸들러로 다시 감시를 등록하고, 등록될 때까지 재대조를 반복한다.
+      - clock_gap   : 점검 주기가 비정상적으로 길어짐 (절전/최대절전 복귀 등)
+    orchestrator 자리에 RootSet 을 넘기면 다중 루트 전체를 재대조한다.
+    Linux inotify 의 IN_Q_OVERFLOW 는 watchdog 내부에서 버려지므로 queue_depth/emitter_dead 로만 감지한다.
+    """
+
+    CLOCK_GAP_FACTOR = 10
+
+    def __init__(self, observer, orchestrator, logger, metrics=None, max_queue_depth=5000,
+                 check_interval_ms=1000, rescan_delay_ms=2000):
+        super().__init__(name="OverflowMonitor", daemon=True)
+        self.observer = observer
+        self.orchestrator = orchestrator
+        self.logger = logger
+        self.metrics = metrics or orchestrator.metrics
+        self.max_queue_depth = max_queue_depth
+        self.check_interval = max(0.05, check_interval_ms / 1000.0)
+        self.rescan_delay = max(0.0, rescan_delay_ms / 1000.0)
+
+        self._stop_event = threading.Event()
+        self._signal_lock = threading.Lock()
+        self._pending_reasons = set()
+        self._last_signal = 0.0
+        self._queue_over = False
+        self._hooked = set()     # native overflow 훅을 건 emitter id
+        self._dead = set()       # 이미 보고한 죽은 emitter id
+        self._lost = {}          # 죽은 emitter 를 내리고 아직 다시 등록하지 못한 watch → 핸들러 목록
+
+    @classmethod
+    def from_config(cls, observer, orchestrator, config_manager, logger, metrics=None):
+        if not config_manager.get_setting("OverflowDetection", True):
+            return None
+        return cls(observer, orchestrator, logger, metrics,
+                   max_queue_depth=config_manager.get_setting("EventQueueMaxDepth", 5000),
+                   check_interval_ms=config_manager.get_setting("OverflowCheckIntervalMs", 1000),
+                   rescan_delay_ms=config_manager.get_setting("OverflowRescanDelayMs", 2000))
+
+    # ------------------------------------------------------------
+    # 유실 신호
+    # ------------------------------------------------------------
+    def signal(self, reason, detail=""):
+        """유실 의심 기록. 재대조는 rescan_delay 동안 추가 신호가 없을 때 1회만 수행된다."""
+        self.metrics.inc("event_queue_overflows_total", reason=reason)
+        with self._signal_lock:
+            first = not self._pending_reasons
+            self._pending_reasons.add(reason)
+            self._last_signal = time.monotonic()
+        if first:
+            self.logger.warning(f"⚠️ 파일 이벤트 유실 의심({reason}{': ' + detail if detail else ''}) "
+                                f"→ 잠잠해지면 감시 트리를 전체 대조합니다.")
+
+    def _hook_native_overflow(self, emitter):
+        """ Windows emitter 의 _read_events 를 감싸 0바이트 결과(버퍼 overflow)를 감지한다. """
+        key = id(emitter)
+        if key in self._hooked:
+            return
+        self._hooked.add(key)
+        read_events = getattr(emitter, "_read_events", None)
+        if read_events is None or not hasattr(emitter, "_whandle"):
+            return
+
+        def _read_events_checked():
+            events = read_events()
+            # ReadDirectoryChangesW 는 변경이 있을 때까지 블록하므로, 중지가 아닌데 비어 있으면 overflow
+            if not events and not emitter.stopped_event.is_set():
+                self.signal("native", emitter.watch.path)
+            return events
+
+        emitter._read_events = _read_events_checked
+
+    # ------------------------------------------------------------
+    # 점검 루프
+    # ------------------------------------------------------------
+    def run(self):
+        self.logger.info(f"이벤트 유실 감시 시작 (큐 적체 한도 {self.max_queue_depth}건, "
+                         f"점검 주기 {self.check_interval:.1f}초)")
+        last_check = time.monotonic()
+        while not self._stop_event.wait(self.check_interval):
+            now = time.monotonic()
+            if now - last_check > self.check_interval * self.CLOCK_GAP_FACTOR:
+                self.signal("clock_gap", f"{now - last_check:.0f}초")
+            last_check = now
+            try:
+                self.check()
+            except Exception as e:
+                self.logger.error(f"이벤트 유실 점검 중 오류: {e}", exc_info=True)
+            last_check = time.monotonic()
+
+    def check(self):
+        """ 1회 점검: 큐 깊이/emitter 상태 확인 후, 조건이 되면 재대조 실행 """
+        depth = self.observer.event_queue.qsize()
+        self.metrics.set_gauge("event_queue_depth", depth)
+        if self.max_queue_depth and self.max_queue_depth > 0:
+            if depth > self.max_queue_depth and not self._queue_over:
+                self._queue_over = True
+                self.signal("queue_depth", f"{depth}건 적체")
+            elif depth <= self.max_queue_depth // 2:
+                self._queue_over = False
+
+        emitters = list(self.observer.emitters)
+        current = {id(e) for e in emitters}
+        self._hooked &= current
+        self._dead &= current
+        for emitter in emitters:
+            self._hook_native_overflow(emitter)
+            if not emitter.is_alive() and not emitter.stopped_event.is_set() and id(emitter) not in self._dead:
+                self._dead.add(id(emitter))
+                self.signal("emitter_dead", emitter.watch.path)
+                self._unwatch(emitter)
+        self._rewatch_lost()
+
+        with self._signal_lock:
+            ready = (self._pending_reasons and not self._queue_over
+                     and time.monotonic() - self._last_signal >= self.rescan_delay)
+            if not ready:
+                return False
+            reasons, self._pending_reasons = self._pending_reasons, set()
+
+        self.orchestrator.reconcile(", ".join(sorted(reasons)))
+        if self._lost:
+            # 다시 감시하지 못한 트리는 여전히 이벤트가 없으므로, 등록될 때까지 주기적으로 재대조한다.
+            self.signal("emitter_dead", ", ".join(watch.path for watch in self._lost))
+        return True
+
+    def _unwatch(self, emitter):
+        """ 죽은 emitter 의 watch 를 내리고 핸들러를 기억한다. (다시 등록은 _rewatch_lost) """
+        watch = emitter.watch
+        handlers = list(getattr(self.observer, "_handlers", {}).get(watch, ()))
+        try:
+            self.observer.unschedule(watch)
+        except KeyError:
+            pass
+        if handlers:
+            self._lost[watch] = handlers
+
+    def _rewatch_lost(self):
+        for watch, handlers in list(self._lost.items()):
+            try:
+                for handler in handlers:
+                    self.observer.schedule(handler, watch.path, recursive=watch.is_recursive)
+            except OSError as e:
+                self.logger.warning(f"감시 재등록 실패 (다음 점검 때 다시 시도): {watch.path} - {e}")
+                continue
+            del self._lost[watch]
+            self.metrics.inc("watches_restarted_total")
+            self.logger.info(f"죽은 감시 스레드를 대신해 감시를 다시 등록했습니다: {watch.path}")
+
+    def stop(self):
+        self._stop_event.set()
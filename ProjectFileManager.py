@@ -8,28 +8,106 @@ ProjectFileManager.py  (patched – 2025‑06‑27)
 2. save_cache(set_or_list)  공개 메서드 추가
    • Orchestrator 에서 project_file_manager.save_cache(...) 호출 가능
 3. 내부 구현은 기존 로직 최대한 유지(가독성 용 리팩터 최소화)
+4. 다중 프로젝트 (ConfigManager.get_project_files)
+   • 프로젝트별 참조 집합(project_references) + 합집합 기준으로 diff/캐시
+   • 프로젝트가 여러 개면 프로세스 풀에서 동시에 파싱
+5. 참조 상태(캐시)는 ReferenceStore 하나에 generation 번호가 붙은 불변 스냅샷으로 보관
+   • Orchestrator 와 같은 저장소를 공유 (cached_file_list 는 현재 스냅샷의 목록)
 """
 
 import os
-import json
 import xml.etree.ElementTree as ET
 import glob
-from typing import List, Set
+import threading
+from typing import Dict, List, Set
+
+from ReferenceStore import ReferenceStore
+
+
+def _parse_project_items(path):
+    """ .vcxproj / .vcxproj.filters 의 ClCompile/ClInclude 항목 → (정규화 경로 집합, 파일 없음 여부, 오류) """
+    files: Set[str] = set()
+    if not os.path.exists(path):
+        return files, True, None
+    try:
+        base_dir = os.path.dirname(path)
+        root = ET.parse(path).getroot()
+        dir_cache = {}
+        for item_group in root.findall(".//{*}ItemGroup"):
+            for element in item_group:
+                if element.tag.endswith(("ClCompile", "ClInclude")):
+                    include = element.get("Include")
+                    if include:
+                        files.add(ProjectFileManager._normalize_path_cached(os.path.join(base_dir, include),
+                                                                            dir_cache))
+    except Exception as e:
+        return set(), False, e
+    return files, False, None
+
+
+def _parse_project_job(job):
+    """ 프로세스 풀 작업: (vcxproj, filters, filters_only) → (vcxproj, 참조 집합, 오류 메시지 목록) """
+    vcxproj, filters, filters_only = job
+    files: Set[str] = set()
+    errors = []
+    for path in ((filters,) if filters_only else (vcxproj, filters)):
+        parsed, missing, error = _parse_project_items(path)
+        files |= parsed
+        if missing:
+            errors.append(f"파일을 찾을 수 없습니다: {path}")
+        elif error:
+            errors.append(f"'{path}' 파싱 실패: {error}")
+    return vcxproj, files, errors
 
 
 class ProjectFileManager:
-    def __init__(self, config_manager, logger):
+    def __init__(self, config_manager, logger, parse_pool=None, background_load=False, cache_dir=None):
+        """ cache_dir: 캐시/저널 폴더 (기본: 프로젝트 루트. 재생 등 실제 캐시를 건드리면 안 될 때 임시 폴더) """
         self.config_manager = config_manager
         self.logger = logger
         self.project_root_path = self.config_manager.get_project_root_path()
         self.main_vcxproj_path = self.config_manager.get_abs_main_vcxproj()
         self.main_vcxproj_filters_path = self.config_manager.get_abs_main_vcxproj_filters()
-        self.cache_file_path = os.path.join(self.project_root_path, "project_cache.json")
+        cache_dir = cache_dir or self.project_root_path
+        self.cache_file_path = os.path.join(cache_dir, "project_cache.json")
+        # 캐시 저널: 개별 삭제를 전체 캐시 재저장 없이 한 줄씩 추가 기록 → 다음 전체 저장/로드 시 합쳐서 비움
+        self.cache_journal_path = os.path.join(cache_dir, "project_cache.journal")
+        # 참조 상태 저장소 (Orchestrator 와 공유)
+        self.reference_store = ReferenceStore(self.cache_file_path, self.cache_journal_path, logger)
         self.watch_file_extensions = self.config_manager.get_setting(
             "WatchFileExtensions", [".cpp", ".h", ".hpp", ".c", ".inl"])
 
-        # 초기 캐시 로드
-        self.cached_file_list: List[str] = self._load_cache()
+        # 다중 프로젝트: [(vcxproj, filters)] (메인 프로젝트가 첫 번째), 프로젝트별 참조 집합
+        self.project_files = self.config_manager.get_project_files()
+        self.parse_workers = self.config_manager.get_setting("ParseWorkers", 0)  # 0 → CPU 수
+        self.project_references: Dict[str, Set[str]] = {}
+        self.failed_projects: List[str] = []
+        # 파싱 프로세스 풀 (다중 루트에서는 main 이 만든 풀 하나를 공유, 없으면 첫 사용 시 자체 생성)
+        self._pool = parse_pool
+        self._owns_pool = parse_pool is None
+
+        # 초기 캐시 로드 (background_load=True 면 별도 스레드에서, 참조 스냅샷 첫 접근 시 완료 대기)
+        if background_load:
+            threading.Thread(target=self._load_cache_in_background, name="CacheLoader", daemon=True).start()
+        else:
+            self._load_cache()
+
+    @property
+    def cached_file_list(self) -> List[str]:
+        """ 현재 참조 스냅샷의 파일 목록 (복사본) """
+        return list(self.reference_store.current().files)
+
+    def is_cache_loaded(self):
+        return self.reference_store.is_loaded()
+
+    def wait_until_loaded(self, timeout=None):
+        return self.reference_store.wait_until_loaded(timeout)
+
+    def _load_cache_in_background(self):
+        try:
+            self._load_cache()
+        except Exception as e:
+            self.logger.error(f"백그라운드 캐시 로드 실패: {e}", exc_info=True)
 
     # ---------------------------------------------------------------------
     # Public helpers -------------------------------------------------------
@@ -40,9 +118,9 @@ class ProjectFileManager:
         • filters_only=False → .vcxproj  + .filters  모두 파싱(기존 동작)
         """
         if filters_only:
-            files: Set[str] = self._parse_vcxproj_filters(self.main_vcxproj_filters_path)
-            # 파싱 실패 세이프가드
-            if files is None or len(files) == 0:
+            files: Set[str] = self.union_references(self.parse_projects(filters_only=True))
+            # 파싱 실패 세이프가드 (한 프로젝트라도 실패하면 그 프로젝트 파일이 모두 '삭제 대상'이 되므로 중단)
+            if not files or self.failed_projects:
                 self.logger.error("filters 파싱 실패·빈 결과 → 빈 리스트 반환")
                 return []
         else:
@@ -50,45 +128,39 @@ class ProjectFileManager:
 
         return list(files)
 
-    def save_cache(self, iterable):
-        """외부(Orchestrator)에서 캐시 세트를 저장할 때 사용."""
-        # 리스트인지 세트인지 구분하지 않고 처리
-        if isinstance(iterable, set):
-            iterable = list(iterable)
-        self._save_cache(iterable)
-        # 내부 상태 동기화
-        self.cached_file_list = list(iterable)
+    def save_cache(self, iterable, source="save", base=None):
+        """참조 집합을 새 스냅샷으로 커밋하고 캐시 파일에 저장. (base: 커밋 기준 스냅샷, ReferenceStore.commit 참고)"""
+        return self.reference_store.commit(iterable, source, base=base)
+
+    def journal_remove(self, normalized_path):
+        """참조 집합에서 파일 하나 제거 + 저널에 추가 기록 (O(1), 캐시 전체를 다시 쓰지 않음). 참조 중이었으면 True"""
+        return self.reference_store.remove(normalized_path)
+
+    def reload_cache(self, exclude=()):
+        """다른 프로세스가 갱신한 캐시 파일을 다시 읽어 참조 집합에 반영 (exclude: 이미 빠진 것으로 반영한 파일)"""
+        return self.reference_store.reload(normalize=self._normalize_cached_paths, exclude=exclude)
 
     # ---------------------------------------------------------------------
     # Private helpers ------------------------------------------------------
     # ---------------------------------------------------------------------
     def _load_cache(self):
-        if os.path.exists(self.cache_file_path):
-            try:
-                with open(self.cache_file_path, "r", encoding="utf-8") as f:
-                    cached_data = json.load(f)
-                    if isinstance(cached_data, list):
-                        self.logger.debug(f"캐시 파일 로드 성공: {self.cache_file_path}")
-                        return [self._normalize_path(p) for p in cached_data]
-                    else:
-                        self.logger.warning("캐시 파일 형식이 올바르지 않습니다. 캐시를 다시 생성합니다.")
-            except json.JSONDecodeError as e:
-                self.logger.error(f"캐시 파일 디코딩 오류: {e}. 캐시를 다시 생성합니다.")
-            except Exception as e:
-                self.logger.error(f"캐시 파일 로드 중 예기치 않은 오류: {e}. 캐시를 다시 생성합니다.")
-
-        self.logger.info("캐시 파일이 없거나 유효하지 않아 현재 .vcxproj에서 파일 목록을 생성합니다.")
-        initial_files = self._get_files_from_project_files()
-        self._save_cache(initial_files)
-        return initial_files
-
-    def _save_cache(self, file_list):
-        try:
-            with open(self.cache_file_path, "w", encoding="utf-8") as f:
-                json.dump(file_list, f, indent=4)
-            self.logger.debug(f"캐시 파일 저장 성공: {self.cache_file_path}")
-        except Exception as e:
-            self.logger.error(f"캐시 파일 저장 중 오류 발생: {e}")
+        self.reference_store.load(self._get_files_from_project_files, normalize=self._normalize_cached_paths)
+
+    @staticmethod
+    def _normalize_cached_paths(paths):
+        dir_cache = {}
+        return [ProjectFileManager._normalize_path_cached(p, dir_cache) for p in paths]
+
+    @staticmethod
+    def _normalize_path_cached(path, dir_cache):
+        """ _normalize_path 와 같은 결과. 폴더 부분의 정규화 결과를 dir_cache 에 저장해 같은 폴더의 파일은 문자열 연결만 한다. """
+        head, tail = os.path.split(path)
+        if not tail or tail in (".", ".."):
+            return ProjectFileManager._normalize_path(path)
+        normalized_dir = dir_cache.get(head)
+        if normalized_dir is None:
+            normalized_dir = dir_cache[head] = ProjectFileManager._normalize_path(head).rstrip("/")
+        return normalized_dir + "/" + tail.lower()
 
     @staticmethod
     def _normalize_path(path):
@@ -119,51 +191,98 @@ class ProjectFileManager:
     # Parsing helpers
     # ------------------------------------------------------------
     def _get_files_from_project_files(self):
-        files: Set[str] = set()
-        files.update(self._parse_vcxproj(self.main_vcxproj_path))
-        files.update(self._parse_vcxproj_filters(self.main_vcxproj_filters_path))
+        files = self.union_references(self.parse_projects())
         self.logger.debug(f"현재 프로젝트 파일(.vcxproj + .filters)에서 파싱된 총 파일 수: {len(files)}")
         return list(files)
 
-    def _parse_vcxproj(self, vcxproj_path):
-        files: Set[str] = set()
-        if not os.path.exists(vcxproj_path):
-            self.logger.warning(f".vcxproj 파일을 찾을 수 없습니다: {vcxproj_path}")
-            return files
-        try:
-            tree = ET.parse(vcxproj_path)
-            root = tree.getroot()
-            for item_group in root.findall(".//{*}ItemGroup"):
-                for element in item_group:
-                    if element.tag.endswith(("ClCompile", "ClInclude")):
-                        include = element.get("Include")
-                        if include:
-                            files.add(self._normalize_path(os.path.join(os.path.dirname(vcxproj_path), include)))
-        except Exception as e:
-            self.logger.error(f"'{vcxproj_path}' 파싱 실패: {e}")
-            return set()
-        self.logger.debug(f"'{vcxproj_path}'에서 파싱된 파일 수: {len(files)}")
+    def _parse_vcxproj(self, vcxproj_path, errors=None):
+        return self._parse_logged(vcxproj_path, ".vcxproj", errors)
+
+    def _parse_vcxproj_filters(self, filters_path, errors=None):
+        return self._parse_logged(filters_path, ".vcxproj.filters", errors)
+
+    def _parse_logged(self, path, kind, errors=None):
+        """ errors 가 주어지면 실패 메시지를 추가한다 (없는 파일도 실패) """
+        files, missing, error = _parse_project_items(path)
+        message = None
+        if missing:
+            message = f"{kind} 파일을 찾을 수 없습니다: {path}"
+        elif error:
+            message = f"'{path}' 파싱 실패: {error}"
+        else:
+            self.logger.debug(f"'{path}'에서 파싱된 파일 수: {len(files)}")
+        if message:
+            self.logger.error(message)
+            if errors is not None:
+                errors.append(message)
         return files
 
-    def _parse_vcxproj_filters(self, filters_path):
-        files: Set[str] = set()
-        if not os.path.exists(filters_path):
-            self.logger.warning(f".vcxproj.filters 파일을 찾을 수 없습니다: {filters_path}")
-            return files
+    # ------------------------------------------------------------
+    # 다중 프로젝트: 프로젝트별 참조 집합 + 합집합
+    # ------------------------------------------------------------
+    def parse_projects(self, filters_only=False):
+        """
+        모든 프로젝트 파일을 파싱해 {vcxproj 경로: 참조 파일 집합} 반환 (self.project_references 갱신)
+        프로젝트가 여러 개면 프로세스 풀에서 동시에 파싱한다. 실패한 프로젝트는 self.failed_projects 에 기록.
+        """
+        if len(self.project_files) == 1:
+            # 단일 프로젝트는 기존처럼 현재 프로세스에서 파싱 (실패 시 빈 집합 → 호출부 세이프가드)
+            vcxproj, filters = self.project_files[0]
+            errors = []
+            files = set(self._parse_vcxproj_filters(filters, errors))
+            if not filters_only:
+                files |= self._parse_vcxproj(vcxproj, errors)
+            results = [(vcxproj, files, errors)]
+        else:
+            jobs = [(vcxproj, filters, filters_only) for vcxproj, filters in self.project_files]
+            results = self._map_parse_jobs(jobs)
+
+        references, failed_projects = {}, []
+        for vcxproj, files, errors in results:
+            references[vcxproj] = files
+            if len(results) > 1:  # 단일 프로젝트는 _parse_logged 가 이미 기록
+                for message in errors:
+                    self.logger.error(f"[{os.path.basename(vcxproj)}] {message}")
+            if errors:
+                failed_projects.append(vcxproj)
+        self.project_references = references
+        self.failed_projects = failed_projects
+        return references
+
+    @staticmethod
+    def union_references(references):
+        """ 프로젝트별 참조 집합의 합집합 (diff/정리는 이 합집합 기준) """
+        union: Set[str] = set()
+        for files in references.values():
+            union |= files
+        return union
+
+    def projects_referencing(self, normalized_path):
+        """ 마지막 파싱 기준으로 해당 파일을 참조하는 프로젝트 목록 """
+        return [v for v, files in self.project_references.items() if normalized_path in files]
+
+    def _map_parse_jobs(self, jobs):
+        workers = self.parse_workers or os.cpu_count() or 1
+        if workers <= 1:
+            return [_parse_project_job(job) for job in jobs]
+        # multiprocessing 은 import 비용이 커서 프로세스 풀을 실제로 쓸 때만 로드
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
         try:
-            tree = ET.parse(filters_path)
-            root = tree.getroot()
-            for item_group in root.findall(".//{*}ItemGroup"):
-                for element in item_group:
-                    if element.tag.endswith(("ClCompile", "ClInclude")):
-                        include = element.get("Include")
-                        if include:
-                            files.add(self._normalize_path(os.path.join(os.path.dirname(filters_path), include)))
-        except Exception as e:
-            self.logger.error(f"'{filters_path}' 파싱 실패: {e}")
-            return set()
-        self.logger.debug(f"'{filters_path}'에서 파싱된 파일 수: {len(files)}")
-        return files
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=min(workers, len(jobs)))
+                self._owns_pool = True
+            return list(self._pool.map(_parse_project_job, jobs))
+        except (BrokenProcessPool, OSError) as e:
+            self.logger.warning(f"프로젝트 파싱 프로세스 풀 오류 → 현재 프로세스에서 파싱합니다: {e}")
+            self.close()
+            return [_parse_project_job(job) for job in jobs]
+
+    def close(self):
+        """ 파싱 프로세스 풀 종료 (공유 풀은 참조만 끊고 종료는 만든 쪽에 맡김) """
+        if self._pool is not None and self._owns_pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
 
     # ---------------------------------------------------------------------
     # 기존 compare/update API ------------------------------------------------
@@ -171,28 +290,43 @@ class ProjectFileManager:
     def get_newly_unreferenced_files_and_update_cache(self):
         """이전 캐시와 현재(.vcxproj + .filters) 비교 → 새롭게 끊긴 파일 반환"""
         self.logger.info("실시간 변경 감지: 캐시와 현재 프로젝트 상태를 비교합니다.")
+        base = self.reference_store.current()
         current = set(self._get_files_from_project_files())
-        newly_unreferenced = list(set(self.cached_file_list) - current)
+        if self._parse_failed("UBT 후 비교"):
+            return []
+        newly_unreferenced = list(base.files - current)
 
         if newly_unreferenced:
             self.logger.info(f"새롭게 참조가 끊긴 파일 {len(newly_unreferenced)}개 발견")
         else:
             self.logger.info("새롭게 참조가 끊긴 파일이 없습니다.")
 
-        # 캐시 갱신
-        self.cached_file_list = list(current)
-        self._save_cache(self.cached_file_list)
+        # 캐시 갱신 (파싱 중 이벤트로 빠진 파일은 다시 넣지 않음)
+        self.reference_store.commit(current, "post-ubt", base=base)
         return newly_unreferenced
 
+    def _parse_failed(self, what):
+        """
+        방금 파싱에서 실패한 프로젝트가 있으면 True. (UBT 가 다시 쓰는 중이거나 깨진 프로젝트)
+        그 프로젝트의 파일이 모두 '참조 끊김'으로 보이므로 diff/캐시 커밋을 하지 않고 이전 참조 집합을 유지한다.
+        """
+        if not self.failed_projects:
+            return False
+        names = ", ".join(os.path.basename(p) for p in self.failed_projects)
+        self.logger.error(f"{what}: 프로젝트 파싱 실패({names}) → 삭제/캐시 갱신을 건너뛰고 이전 참조 집합을 유지합니다.")
+        return True
+
     # ---------------------------------------------------------------------
     # 오프라인 변경 감지 ------------------------------------------------------
     # ---------------------------------------------------------------------
     def check_for_offline_changes(self):
         self.logger.info("오프라인 변경 사항 확인 중…")
+        base = self.reference_store.current()
         current = set(self._get_files_from_project_files())
-        deleted = list(set(self.cached_file_list) - current)
+        if self._parse_failed("오프라인 변경 확인"):
+            return []
+        deleted = list(base.files - current)
         if deleted:
             self.logger.info(f"오프라인 상태에서 삭제된 파일 {len(deleted)}개 발견")
-            self.cached_file_list = list(current)
-            self._save_cache(self.cached_file_list)
+            self.reference_store.commit(current, "offline", base=base)
         return deleted
@@ -0,0 +1,199 @@
+# ReferenceStore.py
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Iterable, Set
+
+
+class ReferenceSnapshot:
+    """ 프로젝트 참조 집합(정규화 경로)의 불변 스냅샷. generation 은 커밋마다 1씩 증가한다. """
+
+    __slots__ = ("generation", "files", "source", "created")
+
+    def __init__(self, generation, files, source):
+        self.generation = generation
+        self.files = frozenset(files)
+        self.source = source
+        self.created = time.time()
+
+    def __len__(self):
+        return len(self.files)
+
+    def __contains__(self, path):
+        return path in self.files
+
+    def __iter__(self):
+        return iter(self.files)
+
+
+class ReferenceStore:
+    """
+    프로젝트 참조 상태(project_cache.json)의 단일 저장소. ProjectFileManager 와 UpdateOrchestrator 가 같은 저장소를 쓴다.
+    - 읽기: current() 는 최신 불변 스냅샷 참조를 그대로 돌려준다. (잠금 없음, 한 번 잡은 스냅샷은 끝까지 일관됨)
+    - 쓰기: commit()/remove() 는 쓰기 잠금 안에서 새 스냅샷을 만들고 참조 하나를 바꾼다. (원자적 교체)
+      commit(base=...) 는 base 이후 remove() 로 빠진 파일을 다시 빼고 커밋한다.
+      (파이프라인이 파싱하는 동안 들어온 삭제 이벤트를 덮어쓰지 않도록)
+    - 저장: commit 은 캐시 파일 전체를 임시 파일에 쓴 뒤 교체하고, remove 는 저널에 한 줄만 추가한다.
+      로드 시 저널을 합치고 비운다.
+    """
+
+    REMOVED_LOG_SIZE = 4096
+
+    def __init__(self, cache_path, journal_path, logger):
+        self.cache_path = cache_path
+        self.journal_path = journal_path
+        self.logger = logger
+        self._write_lock = threading.Lock()
+        self._current = ReferenceSnapshot(0, (), "empty")
+        self._removed_log = deque(maxlen=self.REMOVED_LOG_SIZE)  # 최근 remove() 기록 [(generation, path)] (rebase 용)
+        self._ready = threading.Event()
+
+    # ------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------
+    def current(self) -> ReferenceSnapshot:
+        """ 최신 스냅샷. 백그라운드 로드 중이면 로드 완료까지 기다린다. """
+        if not self._ready.is_set():
+            self._ready.wait()
+        return self._current
+
+    @property
+    def generation(self):
+        return self._current.generation
+
+    def is_loaded(self):
+        return self._ready.is_set()
+
+    def wait_until_loaded(self, timeout=None):
+        return self._ready.wait(timeout)
+
+    # ------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------
+    def commit(self, files: Iterable[str], source, base: ReferenceSnapshot = None, persist=True):
+        """
+        새 참조 집합을 커밋하고 새 스냅샷 반환. base 를 주면 그 이후 remove() 된 파일은 다시 들어가지 않는다.
+        백그라운드 로드 중이면 로드 완료까지 기다린다. (로드 결과가 이 커밋을 덮어쓰지 않도록)
+        """
+        self._ready.wait()
+        return self._commit(files, source, base, persist)
+
+    def _commit(self, files, source, base=None, persist=True):
+        files = set(files)
+        with self._write_lock:
+            if base is not None:
+                files.difference_update(p for g, p in self._removed_log if g > base.generation)
+            snapshot = ReferenceSnapshot(self._current.generation + 1, files, source)
+            if persist:
+                self._save(snapshot.files)
+            self._current = snapshot
+        return snapshot
+
+    def remove(self, path, source="event"):
+        """
+        파일 하나를 참조 집합에서 뺀다. (없던 파일이면 False) 캐시 전체 대신 저널에 한 줄 기록
+        백그라운드 로드 중이면 로드 완료까지 기다린다. (빈 스냅샷 기준으로 '참조 안 함' 판정하지 않도록)
+        """
+        self._ready.wait()
+        with self._write_lock:
+            current = self._current
+            if path not in current.files:
+                return False
+            snapshot = ReferenceSnapshot(current.generation + 1, current.files - {path}, source)
+            self._removed_log.append((snapshot.generation, path))
+            self._append_journal(path)
+            self._current = snapshot
+        return True
+
+    # ------------------------------------------------------------
+    # 로드 / 저장
+    # ------------------------------------------------------------
+    def load(self, rebuild, normalize=None):
+        """
+        캐시 파일(+저널)에서 참조 집합을 읽어 첫 스냅샷으로 커밋한다. 없거나 손상되었으면 rebuild() 결과로 새로 만든다.
+        normalize(paths) 가 있으면 읽은 경로를 정규화한다. 성공/실패와 관계없이 로드 완료로 표시한다.
+        """
+        try:
+            cached = self._read_cache()
+            if cached is None:
+                self.logger.info("캐시 파일이 없거나 유효하지 않아 현재 .vcxproj에서 파일 목록을 생성합니다.")
+                self._commit(rebuild(), "rebuild")
+                return
+            if normalize:
+                cached = normalize(cached)
+            journal = self._read_journal()
+            if journal:
+                # 지난 실행의 저널을 캐시에 합치고 비운다
+                self._commit((p for p in cached if p not in journal), "load")
+            else:
+                self._commit(cached, "load", persist=False)
+        finally:
+            self._ready.set()
+
+    def reload(self, normalize=None, exclude=()):
+        """
+        다른 프로세스가 커밋한 캐시 파일(+저널)을 다시 읽어 새 스냅샷으로 커밋한다. (저장하지 않음)
+        exclude: 이 프로세스에서 이미 빠진 것으로 반영한 파일. 캐시 파일이 없거나 손상이면 현재 스냅샷 유지 후 None
+        """
+        cached = self._read_cache()
+        if cached is None:
+            return None
+        if normalize:
+            cached = normalize(cached)
+        removed = self._read_journal()
+        removed.update(exclude)
+        return self.commit((p for p in cached if p not in removed), "reload", persist=False)
+
+    def _read_cache(self):
+        if not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cached_data = json.load(f)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"캐시 파일 디코딩 오류: {e}. 캐시를 다시 생성합니다.")
+            return None
+        except Exception as e:
+            self.logger.error(f"캐시 파일 로드 중 예기치 않은 오류: {e}. 캐시를 다시 생성합니다.")
+            return None
+        if not isinstance(cached_data, list):
+            self.logger.warning("캐시 파일 형식이 올바르지 않습니다. 캐시를 다시 생성합니다.")
+            return None
+        self.logger.debug(f"캐시 파일 로드 성공: {self.cache_path}")
+        return cached_data
+
+    def _read_journal(self) -> Set[str]:
+        removed: Set[str] = set()
+        if not os.path.exists(self.journal_path):
+            return removed
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.rstrip("\n")
+                    if line.startswith("-"):
+                        removed.add(line[1:])
+        except OSError as e:
+            self.logger.error(f"캐시 저널 읽기 실패: {e}")
+        return removed
+
+    def _append_journal(self, path):
+        try:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write("-" + path + "\n")
+        except OSError as e:
+            self.logger.error(f"캐시 저널 기록 실패: {e}")
+
+    def _save(self, files):
+        try:
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(list(files), f, indent=4)
+            os.replace(tmp_path, self.cache_path)
+            self.logger.debug(f"캐시 파일 저장 성공: {self.cache_path}")
+            # 전체 저장에 저널 내용이 반영되었으므로 비움
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+        except Exception as e:
+            self.logger.error(f"캐시 파일 저장 중 오류 발생: {e}")
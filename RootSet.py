@@ -0,0 +1,112 @@
+# RootSet.py
+from Metrics import MetricsRegistry
+from Scheduler import Scheduler, WorkQueue
+
+
+class WatchRoot:
+    """ 감시 루트(.uproject 체크아웃) 하나의 상태: 설정, 프로젝트 파일 관리자, 오케스트레이터, 이벤트 핸들러 """
+
+    def __init__(self, name, config_manager, logger, project_file_manager, orchestrator, handler, watch_handler=None):
+        self.name = name
+        self.config_manager = config_manager
+        self.logger = logger
+        self.project_file_manager = project_file_manager
+        self.orchestrator = orchestrator
+        self.handler = handler
+        self.watch_handler = watch_handler or handler
+        self.git_monitor = None
+        self.patrol = None
+        self.config_reload = None
+
+    def warm_start(self):
+        """
+        시작 시 오프라인 대조 후 그동안 버퍼된 이벤트를 처리한다. (백그라운드 큐에서 실행)
+        버퍼된 이벤트를 먼저 반영한 뒤 갱신을 요청하므로, 이벤트로 예약된 갱신과 오프라인 변경 갱신은 생성기 큐에서 합쳐진다.
+        """
+        drift = False
+        try:
+            drift = self.orchestrator.check_offline_changes()
+        finally:
+            self.handler.end_warm_start()
+        if drift:
+            self.orchestrator.run_full_update("offline")
+
+
+class RootSet:
+    """
+    한 프로세스에서 여러 루트를 감시할 때의 공유 자원 + 루트 목록.
+    루트마다 스레드를 만들지 않도록 아래 자원을 모든 루트가 나눠 쓴다. (루트 수와 무관한 고정 스레드 수)
+      - scheduler        : 디바운스/스톰 종료 확인/순찰 예약/config.json 변경 확인 (스레드 1개)
+      - generator_queue  : 프로젝트 갱신(UBT) 실행 큐. 전역 동시 실행 한도 MaxConcurrentGenerators,
+                           루트별로는 대기 1건 + 실행 1건 (같은 루트 요청은 합쳐짐)
+      - background_queue : 시작 시 오프라인 대조/순찰/재대조 스캔 (스레드 1개, UBT 실행 큐를 막지 않음)
+    """
+
+    def __init__(self, logger, metrics=None, max_concurrent_generators=1):
+        self.logger = logger
+        self.metrics = metrics or MetricsRegistry()
+        self.scheduler = Scheduler(logger)
+        self.generator_queue = WorkQueue(max_concurrent_generators, "Generator", logger, self.metrics)
+        self.background_queue = WorkQueue(1, "Background", logger, self.metrics)
+        self.roots = []
+
+    @classmethod
+    def from_config(cls, config_manager, logger, metrics=None):
+        return cls(logger, metrics, max_concurrent_generators=config_manager.get_setting("MaxConcurrentGenerators", 1))
+
+    def unique_name(self, name):
+        names = {root.name for root in self.roots}
+        candidate, n = name, 2
+        while candidate in names:
+            candidate, n = f"{name}-{n}", n + 1
+        return candidate
+
+    def add(self, root):
+        self.roots.append(root)
+        self.metrics.set_gauge("watch_roots", len(self.roots))
+        return root
+
+    def start(self):
+        self.scheduler.start()
+        self.generator_queue.start()
+        self.background_queue.start()
+        for root in self.roots:
+            if root.handler.is_warming():
+                self.background_queue.submit(("warm-start", root.name), root.warm_start)
+            self._schedule_patrol(root)
+            self._schedule_config_reload(root)
+
+    def _schedule_patrol(self, root):
+        interval = root.config_manager.get_setting("PatrolIntervalMinutes", 0.0) * 60
+        if interval <= 0:
+            root.logger.info("정기 순찰 기능이 비활성화되었습니다. (PatrolIntervalMinutes가 0 이하)")
+            return
+        root.patrol = self.scheduler.call_every(interval, self.background_queue.submit, ("patrol", root.name),
+                                                root.orchestrator.patrol_for_changes)
+        root.logger.info(f"정기 순찰 예약. 매 {interval:.0f}초 ({interval / 60}분)마다 프로젝트 상태를 확인합니다.")
+
+    def _schedule_config_reload(self, root):
+        """ config.json 변경을 주기적으로 확인해 새 설정 스냅샷으로 교체 (mtime stat 1회, 재시작 불필요) """
+        interval = root.config_manager.get_setting("ConfigReloadSeconds", 2.0)
+        if interval > 0:
+            root.config_reload = self.scheduler.call_every(interval, root.config_manager.reload_if_changed)
+
+    def reconcile(self, reason):
+        """ 이벤트 유실 의심(OverflowMonitor) → 모든 루트를 백그라운드 큐에서 재대조 """
+        for root in self.roots:
+            self.background_queue.submit(("reconcile", root.name),
+                                         lambda orchestrator=root.orchestrator: orchestrator.reconcile(reason))
+
+    def stop(self):
+        for root in self.roots:
+            if root.patrol:
+                root.patrol.cancel()
+            if root.config_reload:
+                root.config_reload.cancel()
+        self.scheduler.stop()
+        self.background_queue.stop()
+        self.generator_queue.stop()
+        for root in self.roots:
+            root.project_file_manager.close()
+            if root.watch_handler is not root.handler:
+                root.watch_handler.close()
@@ -0,0 +1,151 @@
+# RunCoordinator.py
+import json
+import os
+import time
+
+
+class RunCoordinator:
+    """
+    같은 프로젝트를 갱신하는 여러 프로세스(감시기 여러 개, main.py --once 수동 실행) 사이의 실행 조정.
+    프로젝트 폴더의 잠금 파일(project_cache.lock)을 OS 파일 잠금으로 잡은 프로세스만 파이프라인(UBT + 캐시 커밋)을 실행한다.
+    - 바로 잡으면: 실행하고 결과를 상태 파일(<잠금 파일>.json)에 남긴 뒤 잠금 해제
+    - 다른 프로세스가 실행 중이면: 그 실행이 끝날 때까지 기다렸다가 그 결과를 재사용한다. (UBT 를 다시 돌리지 않음)
+      단, 그 실행이 이번 갱신 요청(requested_at) 이후에 시작했을 때만 재사용한다. 먼저 시작한 실행은 이번 변경을
+      못 봤을 수 있으므로, 그 실행이나 성공 실행이 없을 때(보유자 비정상 종료/실패)는 잠금을 잡은 채 직접 실행한다.
+    잠금은 프로세스가 죽으면 OS 가 풀어 주므로 남은 잠금 파일을 지울 필요가 없다.
+    lock_path 가 없으면 조정하지 않고 항상 직접 실행한다. (기본값 / 테스트용)
+    """
+
+    POLL_SECONDS = 0.2
+
+    def __init__(self, lock_path=None, logger=None, metrics=None, wait_timeout=900.0):
+        self.lock_path = lock_path
+        self.state_path = lock_path + ".json" if lock_path else None
+        self.logger = logger
+        self.metrics = metrics
+        self.wait_timeout = wait_timeout
+
+    @classmethod
+    def from_config(cls, config_manager, logger, metrics=None):
+        path = config_manager.get_setting("RunLockPath", "project_cache.lock")
+        if not path:
+            return cls(None, logger, metrics)
+        return cls(config_manager.get_abs_path(path), logger, metrics,
+                   config_manager.get_setting("RunLockWaitSeconds", 900))
+
+    @property
+    def enabled(self):
+        return bool(self.lock_path)
+
+    def run(self, fn, owner="", requested_at=None):
+        """
+        fn() 을 프로젝트 잠금 안에서 실행한다. 반환: (outcome, 상태)
+        requested_at: 이번 실행이 반영할 가장 이른 갱신 요청 시각 (time.time(), 기본: 지금)
+          ("ran", 이번 실행 상태)       : 직접 실행 (fn 의 예외는 그대로 전달)
+          ("aborted", 이번 실행 상태)   : 직접 실행했지만 fn 이 False 를 반환 (중단된 실행, 재사용 대상 아님)
+          ("reused", 다른 실행의 상태)  : 진행 중이던 다른 프로세스의 실행 결과를 재사용, fn 은 호출하지 않음
+          ("timeout", None)            : wait_timeout 안에 잠금을 얻지 못함
+        """
+        if not self.enabled:
+            return ("aborted" if fn() is False else "ran"), None
+
+        requested = requested_at if requested_at is not None else time.time()
+        handle = self._try_lock()
+        if handle is None:
+            holder = self.read_state() or {}
+            self._inc("run_lock_waits_total")
+            self._log("info", f"다른 프로세스(pid {holder.get('pid', '?')}, {holder.get('owner') or '?'})가 "
+                              f"같은 프로젝트를 갱신 중 → 끝날 때까지 기다렸다가 결과를 재사용합니다.")
+            handle = self._wait_for_lock(time.time() + self.wait_timeout)
+            if handle is None:
+                self._inc("run_lock_timeouts_total")
+                self._log("warning", f"프로젝트 잠금 대기 시간 초과({self.wait_timeout}초): {self.lock_path}")
+                return "timeout", None
+            state = self.read_state()
+            if state and state.get("result") == "ok" and (state.get("started") or 0) >= requested:
+                self._unlock(handle)
+                self._inc("runs_reused_total")
+                self._log("info", f"다른 프로세스의 갱신 결과를 재사용합니다. (pid {state.get('pid')}, "
+                                  f"{state['finished'] - state['started']:.1f}초)")
+                return "reused", state
+            if state and state.get("result") == "ok":
+                self._log("info", f"다른 프로세스의 실행(pid {state.get('pid')})이 이번 요청보다 먼저 시작했으므로 직접 다시 실행합니다.")
+
+        try:
+            state = {"pid": os.getpid(), "owner": owner, "started": time.time(), "finished": None, "result": None}
+            self._write_state(state)
+            result = "failed"
+            try:
+                result = "aborted" if fn() is False else "ok"
+            finally:
+                state.update(finished=time.time(), result=result)
+                self._write_state(state)
+            return ("ran" if result == "ok" else result), state
+        finally:
+            self._unlock(handle)
+
+    def read_state(self):
+        """ 마지막(또는 진행 중) 실행 상태. 없거나 읽을 수 없으면 None """
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    # ------------------------------------------------------------
+    # 파일 잠금 (Windows: msvcrt, 그 외: fcntl)
+    # ------------------------------------------------------------
+    def _try_lock(self):
+        """ 잠금을 바로 잡으면 열린 파일 핸들, 다른 곳이 잡고 있으면 None """
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        handle = open(self.lock_path, "a+b")
+        try:
+            if os.name == "nt":
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return None
+        return handle
+
+    def _wait_for_lock(self, deadline):
+        while True:
+            handle = self._try_lock()
+            if handle is not None or time.time() >= deadline:
+                return handle
+            time.sleep(self.POLL_SECONDS)
+
+    @staticmethod
+    def _unlock(handle):
+        try:
+            if os.name == "nt":
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            handle.close()
+
+    def _write_state(self, state):
+        try:
+            tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            self._log("error", f"실행 상태 파일 기록 실패: {e}")
+
+    def _inc(self, name):
+        if self.metrics:
+            self.metrics.inc(name)
+
+    def _log(self, level, msg):
+        if self.logger:
+            getattr(self.logger, level)(msg)
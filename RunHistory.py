@@ -0,0 +1,226 @@
+# RunHistory.py
+import os
+import queue
+import threading
+import time
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    root TEXT NOT NULL,
+    started REAL NOT NULL,
+    seconds REAL,
+    result TEXT,
+    report_path TEXT
+);
+CREATE TABLE IF NOT EXISTS stages (run_id INTEGER NOT NULL, seq INTEGER, stage TEXT, seconds REAL);
+CREATE TABLE IF NOT EXISTS triggers (run_id INTEGER NOT NULL, ts REAL, reason TEXT, event_type TEXT, path TEXT);
+CREATE TABLE IF NOT EXISTS diffs (run_id INTEGER NOT NULL, stage TEXT, path TEXT);
+CREATE TABLE IF NOT EXISTS deletions (run_id INTEGER NOT NULL, ts REAL, stage TEXT, path TEXT, result TEXT, backup TEXT);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started);
+CREATE INDEX IF NOT EXISTS idx_runs_seconds ON runs(seconds);
+CREATE INDEX IF NOT EXISTS idx_stages_run ON stages(run_id);
+CREATE INDEX IF NOT EXISTS idx_triggers_run ON triggers(run_id);
+CREATE INDEX IF NOT EXISTS idx_triggers_path ON triggers(path);
+CREATE INDEX IF NOT EXISTS idx_diffs_run ON diffs(run_id);
+CREATE INDEX IF NOT EXISTS idx_diffs_path ON diffs(path);
+CREATE INDEX IF NOT EXISTS idx_deletions_run ON deletions(run_id);
+CREATE INDEX IF NOT EXISTS idx_deletions_path ON deletions(path);
+CREATE INDEX IF NOT EXISTS idx_deletions_ts ON deletions(ts);
+"""
+
+
+def connect(db_path):
+    """ 기록 DB 연결 (스키마가 없으면 생성). WAL 모드라 감시 프로세스가 쓰는 동안에도 조회 CLI 가 읽을 수 있다. """
+    import sqlite3  # 기록을 켰을 때만 로드
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+class RunHistory:
+    """
+    실행(run) 기록을 로컬 SQLite 에 남긴다. (단계별 시간, 실행 계기와 이벤트, diff, 삭제 결과와 백업 경로)
+    "이 파일이 언제 왜 지워졌나", "이번 주 가장 느린 실행은?" 을 텍스트 로그 대신 query_history.py 로 조회한다.
+    - Orchestrator 는 실행 중 기록을 메모리에 모았다가 끝날 때 record_run() 한 번만 호출한다.
+    - 쓰기는 전용 스레드가 실행 하나를 트랜잭션 하나로 묶어 처리하므로 파이프라인을 늦추지 않는다.
+    db_path 가 없으면 아무것도 기록하지 않는다. (기본값 / 테스트용)
+    """
+
+    def __init__(self, db_path=None, logger=None, metrics=None):
+        self.db_path = db_path
+        self.logger = logger
+        self.metrics = metrics
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config_manager, logger, metrics=None):
+        path = config_manager.get_setting("RunHistoryPath", "Logs/run_history.sqlite3")
+        if not path:
+            return cls(None, logger, metrics)
+        return cls(config_manager.get_abs_path_from_base_dir(path), logger, metrics)
+
+    @property
+    def enabled(self):
+        return bool(self.db_path)
+
+    # ------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------
+    def record_run(self, record):
+        """
+        실행 하나의 기록을 쓰기 큐에 넣는다. (바로 반환)
+        record: {"root", "started"(epoch), "seconds", "result", "report_path",
+                 "stages": [(stage, seconds)], "triggers": [{"ts", "reason", "events": [(type, path)]}],
+                 "diffs": [(stage, path)], "deletions": [(ts, stage, path, result, backup)]}
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._writer, name="RunHistoryWriter", daemon=True)
+                self._thread.start()
+        self._queue.put(record)
+
+    def flush(self, timeout=None):
+        """ 큐에 쌓인 기록을 모두 쓸 때까지 대기 (테스트/종료용) """
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=10)
+        self._thread = None
+
+    def _writer(self):
+        conn = None
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                if conn is None:
+                    conn = connect(self.db_path)
+                started = time.perf_counter()
+                with conn:
+                    self._insert_run(conn, item)
+                if self.metrics:
+                    self.metrics.observe("history_write_seconds", time.perf_counter() - started)
+            except Exception as e:
+                if self.metrics:
+                    self.metrics.inc("history_write_failed_total")
+                if self.logger:
+                    self.logger.error(f"실행 기록 저장 실패 ({self.db_path}): {e}")
+        if conn is not None:
+            conn.close()
+
+    @staticmethod
+    def _insert_run(conn, record):
+        cursor = conn.execute("INSERT INTO runs (root, started, seconds, result, report_path) VALUES (?, ?, ?, ?, ?)",
+                              (record["root"], record["started"], record.get("seconds"), record.get("result"),
+                               record.get("report_path")))
+        run_id = cursor.lastrowid
+        conn.executemany("INSERT INTO stages (run_id, seq, stage, seconds) VALUES (?, ?, ?, ?)",
+                         [(run_id, seq, stage, seconds) for seq, (stage, seconds) in enumerate(record.get("stages", ()))])
+        trigger_rows = []
+        for trigger in record.get("triggers", ()):
+            events = trigger.get("events") or [(None, None)]
+            trigger_rows.extend((run_id, trigger["ts"], trigger["reason"], event_type, path)
+                                for event_type, path in events)
+        conn.executemany("INSERT INTO triggers (run_id, ts, reason, event_type, path) VALUES (?, ?, ?, ?, ?)",
+                         trigger_rows)
+        conn.executemany("INSERT INTO diffs (run_id, stage, path) VALUES (?, ?, ?)",
+                         [(run_id, stage, path) for stage, path in record.get("diffs", ())])
+        conn.executemany("INSERT INTO deletions (run_id, ts, stage, path, result, backup) VALUES (?, ?, ?, ?, ?, ?)",
+                         [(run_id,) + tuple(row) for row in record.get("deletions", ())])
+        return run_id
+
+
+# ------------------------------------------------------------
+# 조회 (query_history.py)
+# ------------------------------------------------------------
+def _rows(conn, sql, params=()):
+    cursor = conn.execute(sql, params)
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def file_lineage(conn, path, exact=True, limit=50):
+    """
+    파일 하나의 이력: 그 파일이 diff(프로젝트에서 빠짐)/삭제된 실행과, 실행 계기 이벤트에 그 파일이 등장한 실행.
+    exact=True 이면 정규화 경로 일치(인덱스 사용), False 이면 소문자 부분 문자열 검색 (%, _ 는 글자 그대로)
+    """
+    if exact:
+        where, param = "x.path = ?", path
+    else:
+        escaped = path.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        where, param = "x.path LIKE ? ESCAPE '\\'", f"%{escaped}%"
+    deletions = _rows(conn, f"""
+        SELECT r.id AS run_id, r.root, x.ts, x.stage, x.path, x.result, x.backup
+        FROM deletions x JOIN runs r ON r.id = x.run_id WHERE {where} ORDER BY x.ts DESC LIMIT ?""", (param, limit))
+    diffs = _rows(conn, f"""
+        SELECT r.id AS run_id, r.root, r.started, x.stage, x.path
+        FROM diffs x JOIN runs r ON r.id = x.run_id WHERE {where} ORDER BY r.started DESC LIMIT ?""", (param, limit))
+    triggered = _rows(conn, f"""
+        SELECT r.id AS run_id, r.root, x.ts, x.reason, x.event_type, x.path
+        FROM triggers x JOIN runs r ON r.id = x.run_id WHERE {where} ORDER BY x.ts DESC LIMIT ?""", (param, limit))
+    run_ids = {row["run_id"] for row in deletions + diffs}
+    reasons = {}
+    for run_id in run_ids:
+        reasons[run_id] = sorted({row["reason"] for row in _rows(
+            conn, "SELECT DISTINCT reason FROM triggers WHERE run_id = ?", (run_id,))})
+    for row in deletions + diffs:
+        row["reasons"] = reasons.get(row["run_id"], [])
+    return {"deletions": deletions, "diffs": diffs, "triggered": triggered}
+
+
+def slowest_runs(conn, since, limit=10):
+    """ since(epoch) 이후 실행을 소요 시간 내림차순으로. 단계별 시간 포함 """
+    runs = _rows(conn, """
+        SELECT id AS run_id, root, started, seconds, result, report_path FROM runs
+        WHERE started >= ? AND seconds IS NOT NULL ORDER BY seconds DESC LIMIT ?""", (since, limit))
+    for run in runs:
+        run["stages"] = _rows(conn, "SELECT stage, seconds FROM stages WHERE run_id = ? ORDER BY seq",
+                              (run["run_id"],))
+    return runs
+
+
+def recent_runs(conn, limit=20):
+    runs = _rows(conn, """
+        SELECT r.id AS run_id, r.root, r.started, r.seconds, r.result,
+               (SELECT COUNT(*) FROM deletions d WHERE d.run_id = r.id) AS deletions
+        FROM runs r ORDER BY r.started DESC LIMIT ?""", (limit,))
+    for run in runs:
+        run["reasons"] = [row["reason"] for row in _rows(
+            conn, "SELECT DISTINCT reason FROM triggers WHERE run_id = ?", (run["run_id"],))]
+    return runs
+
+
+def run_detail(conn, run_id):
+    runs = _rows(conn, "SELECT id AS run_id, root, started, seconds, result, report_path FROM runs WHERE id = ?",
+                 (run_id,))
+    if not runs:
+        return None
+    run = runs[0]
+    run["stages"] = _rows(conn, "SELECT stage, seconds FROM stages WHERE run_id = ? ORDER BY seq", (run_id,))
+    run["triggers"] = _rows(conn, "SELECT ts, reason, event_type, path FROM triggers WHERE run_id = ? ORDER BY ts",
+                            (run_id,))
+    run["diffs"] = _rows(conn, "SELECT stage, path FROM diffs WHERE run_id = ?", (run_id,))
+    run["deletions"] = _rows(conn, "SELECT ts, stage, path, result, backup FROM deletions WHERE run_id = ?",
+                             (run_id,))
+    return run
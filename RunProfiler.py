@@ -0,0 +1,102 @@
+# RunProfiler.py
+import os
+import threading
+from datetime import datetime
+
+# tracemalloc(와 cProfile 프로파일러 훅)은 프로세스 전역이다.
+# 여러 루트의 실행이 동시에 프로파일되면 한쪽의 stop()/스냅샷이 다른 쪽 측정을 끊거나 섞으므로, 프로파일 실행은 하나씩만 한다.
+_PROFILE_LOCK = threading.Lock()
+
+
+class RunProfiler:
+    """
+    선택된 run_full_update 실행을 cProfile + tracemalloc 으로 감싸서 분석 파일을 남긴다.
+    - every_n_runs: N번째 실행마다 한 번 프로파일링 (0이면 비활성)
+    - 결과: <output_dir>/run_<시각>_<번호>.prof        (snakeviz, pstats 등으로 열기)
+            <output_dir>/run_<시각>_<번호>_alloc.txt   (메모리 할당 상위 top_n / 실행 전후 증가분)
+    설정: config.json 의 ProfileEveryNRuns / ProfileTopN, 또는 환경변수 AUTOGEN_PROFILE_EVERY
+    프로파일 대상 실행끼리는 프로세스 안에서 직렬화된다. (대상이 아닌 실행은 기다리지 않음)
+    """
+
+    ENV_VAR = "AUTOGEN_PROFILE_EVERY"
+
+    def __init__(self, output_dir=None, every_n_runs=0, top_n=25, logger=None):
+        self.output_dir = output_dir
+        self.every_n_runs = max(0, int(every_n_runs or 0))
+        self.top_n = max(1, int(top_n or 25))
+        self.logger = logger
+        self._run_count = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config_manager, logger):
+        every = os.environ.get(cls.ENV_VAR) or config_manager.get_setting("ProfileEveryNRuns", 0)
+        try:
+            every = int(every)
+        except (TypeError, ValueError):
+            logger.warning(f"프로파일링 주기 값이 올바르지 않아 비활성화합니다: {every}")
+            every = 0
+        output_dir = os.path.join(os.path.dirname(config_manager.get_abs_logfile()), "Profiles")
+        return cls(output_dir, every, config_manager.get_setting("ProfileTopN", 25), logger)
+
+    @property
+    def enabled(self):
+        return self.every_n_runs > 0 and bool(self.output_dir)
+
+    def _should_profile(self):
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._run_count += 1
+            return self._run_count if self._run_count % self.every_n_runs == 0 else None
+
+    def profile(self, func, *args, **kwargs):
+        """ func 를 실행하고, 샘플링 대상 실행이면 프로파일 결과를 파일로 남긴다. """
+        run_no = self._should_profile()
+        if run_no is None:
+            return func(*args, **kwargs)
+
+        # 프로파일 대상 실행에서만 로드 (pstats 등은 import 비용이 커서 시작 시간에 포함시키지 않음)
+        import cProfile
+        import tracemalloc
+        with _PROFILE_LOCK:
+            base = os.path.join(self.output_dir, f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{run_no}")
+            started_tracemalloc = not tracemalloc.is_tracing()
+            if started_tracemalloc:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot()
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.disable()
+                after = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+                if started_tracemalloc:
+                    tracemalloc.stop()
+                self._dump(base, profiler, before, after, peak)
+
+    def _dump(self, base, profiler, before, after, peak):
+        import pstats
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            profiler.dump_stats(base + ".prof")
+
+            with open(base + "_alloc.txt", "w", encoding="utf-8") as f:
+                f.write(f"# peak traced memory: {peak / 1024:.1f} KiB\n\n")
+                f.write(f"# top {self.top_n} allocations (by line)\n")
+                for stat in after.statistics("lineno")[:self.top_n]:
+                    f.write(f"{stat}\n")
+                f.write(f"\n# top {self.top_n} growth during run (by line)\n")
+                for stat in after.compare_to(before, "lineno")[:self.top_n]:
+                    f.write(f"{stat}\n")
+                f.write(f"\n# top {self.top_n} functions (cumulative time)\n")
+                pstats.Stats(profiler, stream=f).sort_stats("cumulative").print_stats(self.top_n)
+
+            if self.logger:
+                self.logger.info(f"[Profiler] 실행 프로파일 저장: {base}.prof / {base}_alloc.txt")
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"[Profiler] 프로파일 결과 저장 실패: {e}")
@@ -0,0 +1,176 @@
+# Scheduler.py
+import heapq
+import itertools
+import threading
+import time
+
+
+class ScheduledCall:
+    """ Scheduler.call_later/call_every 가 돌려주는 핸들 (threading.Timer 처럼 cancel()/finished 제공) """
+
+    def __init__(self, due, fn, args, interval=None):
+        self.due = due
+        self.fn = fn
+        self.args = args
+        self.interval = interval
+        self.cancelled = False
+        self.finished = threading.Event()
+
+    def cancel(self):
+        self.cancelled = True
+        self.finished.set()
+
+
+class Scheduler(threading.Thread):
+    """
+    여러 프로젝트 루트가 함께 쓰는 단일 타이머 스레드.
+    루트/이벤트마다 threading.Timer 스레드를 만드는 대신 힙 하나로 디바운스·순찰 예약을 처리한다.
+    콜백은 이 스레드에서 실행되므로 오래 걸리는 작업은 WorkQueue 에 넘겨야 한다.
+    """
+
+    def __init__(self, logger=None):
+        super().__init__(name="Scheduler", daemon=True)
+        self.logger = logger
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+
+    def call_later(self, delay, fn, *args):
+        return self._push(ScheduledCall(time.monotonic() + max(0.0, delay), fn, args))
+
+    def call_every(self, interval, fn, *args):
+        return self._push(ScheduledCall(time.monotonic() + interval, fn, args, interval=interval))
+
+    def _push(self, call):
+        with self._cond:
+            heapq.heappush(self._heap, (call.due, next(self._seq), call))
+            self._cond.notify()
+        return call
+
+    def run(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if self._heap:
+                        wait = self._heap[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+                if self._stopped:
+                    return
+                _, _, call = heapq.heappop(self._heap)
+            if call.cancelled:
+                continue
+            try:
+                call.fn(*call.args)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"예약 작업 실행 중 오류: {e}", exc_info=True)
+            if call.interval and not call.cancelled:
+                call.due = time.monotonic() + call.interval
+                self._push(call)
+            else:
+                call.finished.set()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+
+class WorkQueue:
+    """
+    key(프로젝트 루트 등)별로 합쳐지는 작업 큐 + 고정 개수의 작업 스레드.
+    - 같은 key 는 대기 1개 + 실행 1개까지만: 실행 중에 다시 요청되면 끝난 뒤 1회 더 실행
+    - 스레드 수는 workers 로 고정 (루트 수와 무관) → 전역 동시 실행 한도
+    """
+
+    def __init__(self, workers=1, name="WorkQueue", logger=None, metrics=None):
+        self.workers = max(1, workers)
+        self.name = name
+        self.logger = logger
+        self.metrics = metrics
+        self._cond = threading.Condition()
+        self._order = []       # 대기 중인 key (요청 순서)
+        self._pending = {}     # key → fn
+        self._running = set()
+        self._threads = []
+        self._stopped = False
+        self._local = threading.local()
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"{self.name}-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def in_worker(self):
+        """ 현재 스레드가 이 큐의 작업 스레드인지 (재귀 제출 대신 바로 실행하기 위해) """
+        return getattr(self._local, "active", False)
+
+    def submit(self, key, fn):
+        """ 작업 요청. 같은 key 가 이미 대기 중이면 합쳐지고 False 반환 """
+        with self._cond:
+            if key in self._pending:
+                if self.metrics:
+                    self.metrics.inc("work_coalesced_total", queue=self.name)
+                return False
+            self._pending[key] = fn
+            self._order.append(key)
+            if self.metrics:
+                self.metrics.set_gauge("work_queue_depth", len(self._order), queue=self.name)
+            self._cond.notify()
+        return True
+
+    def pending(self):
+        with self._cond:
+            return len(self._order) + len(self._running)
+
+    def _next_key(self):
+        for key in self._order:
+            if key not in self._running:
+                return key
+        return None
+
+    def _worker(self):
+        self._local.active = True
+        while True:
+            with self._cond:
+                while not self._stopped and self._next_key() is None:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                key = self._next_key()
+                self._order.remove(key)
+                fn = self._pending.pop(key)
+                self._running.add(key)
+                if self.metrics:
+                    self.metrics.set_gauge("work_queue_depth", len(self._order), queue=self.name)
+            try:
+                fn()
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"[{self.name}] {key} 작업 중 오류: {e}", exc_info=True)
+            finally:
+                with self._cond:
+                    self._running.discard(key)
+                    self._cond.notify_all()
+
+    def join_idle(self, timeout=None):
+        """ 대기/실행 중인 작업이 모두 끝날 때까지 대기 (테스트/종료용) """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._order or self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
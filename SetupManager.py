@@ -39,6 +39,9 @@ class SetupManager:
             "MainVcxprojPath": self._get_relative_path(vcxproj_path, project_root) if vcxproj_path else "",
             "MainVcxprojFiltersPath": self._get_relative_path(filters_path, project_root) if filters_path else "",
             "LogPath": "Logs/Watcher.log",
+            "ReportDir": "Logs/Reports",
+            "LogMaxBytes": 10485760,
+            "LogBackupCount": 5,
             "WatchPaths": ["Source", "Plugins"],
             "WatchFileExtensions": [".cpp", ".h", ".hpp", ".c", ".inl"],
             "DebounceTimeMs": 1500,
@@ -0,0 +1,247 @@
+# SourceSnapshot.py
+import os
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ProjectFileManager import ProjectFileManager
+from IoThrottle import IoThrottle
+
+
+class SourceTreeSnapshot:
+    """
+    WatchPaths 아래 소스 파일 목록의 증분 스냅샷.
+    폴더별 (mtime_ns, 소스 파일 이름들, 하위 폴더 이름들)을 기억해 두고, 다음 스캔에서는
+      1) 알려진 모든 폴더를 병렬로 stat → mtime 이 바뀐 폴더만 골라
+      2) 그 폴더만 병렬 os.scandir 로 다시 나열 (새 하위 폴더는 이어서 나열, 사라진 폴더는 하위 트리째 제거)
+    한다. 폴더 mtime 은 항목 추가/삭제/이름 변경 때만 바뀌므로 변경이 없으면 stat 만으로 끝난다.
+    스냅샷은 JSON 으로 저장되어 재시작 후에도 첫 순찰부터 증분으로 동작한다.
+    stat/scandir 는 throttle(IoThrottle) 예산 안에서, 우선순위를 낮춘 작업 스레드에서 수행된다.
+    """
+
+    VERSION = 1
+    # 나열 직후 같은 mtime 틱 안에 생긴 변경을 놓치지 않도록, 너무 최근 mtime 은 기억하지 않고 다음에 다시 나열
+    RACY_NS = 2_000_000_000
+
+    def __init__(self, roots, watch_exts, ignored_dirs, snapshot_path=None, logger=None, workers=8, throttle=None):
+        self.roots = sorted(roots)
+        self.watch_exts = tuple(e.lower() for e in watch_exts)
+        self.ignored_dirs = [d.lower() for d in ignored_dirs]
+        self.snapshot_path = snapshot_path
+        self.logger = logger
+        self.workers = max(1, workers)
+        self.throttle = throttle or IoThrottle()
+
+        self._lock = threading.Lock()
+        self._dirs = {}   # dir_path → [mtime_ns, [source names], [subdir names], root]
+        self._loaded = False
+        self.last_stats = {}
+
+    @classmethod
+    def from_config(cls, config_manager, logger, throttle=None, persist=True):
+        project_dirs = {os.path.normcase(d) for d in config_manager.get_project_file_dirs()}
+        roots = [r for r in config_manager.get_abs_watch_paths() if os.path.normcase(r) not in project_dirs]
+        config = config_manager.snapshot
+        return cls(roots, config.watch_exts, config.ignored_dirs,
+                   snapshot_path=os.path.join(config_manager.get_project_root_path(), "patrol_snapshot.json")
+                   if persist else None,
+                   logger=logger,
+                   workers=config_manager.get_setting("PatrolScanWorkers", 8),
+                   throttle=throttle)
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def is_empty(self):
+        """ 스냅샷이 비었는지 (저장된 스냅샷이 있으면 먼저 읽는다) """
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            return not self._dirs
+
+    def iter_files(self):
+        """ 스냅샷의 전체 소스 파일 (디스크 상의 실제 경로) """
+        with self._lock:
+            entries = list(self._dirs.items())
+        for d, entry in entries:
+            for name in entry[1]:
+                yield os.path.join(d, name)
+
+    def files(self):
+        """ 스냅샷의 전체 소스 파일 (정규화 경로) """
+        with self._lock:
+            result = set()
+            for d, entry in self._dirs.items():
+                if entry[1]:
+                    prefix = ProjectFileManager._normalize_path(d).rstrip("/") + "/"
+                    result.update(prefix + n.lower() for n in entry[1])
+            return result
+
+    # ------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------
+    def load(self):
+        self._loaded = True
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return False
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self._log("warning", f"순찰 스냅샷을 읽을 수 없어 새로 만듭니다: {e}")
+            return False
+        if data.get("version") != self.VERSION or data.get("roots") != self.roots:
+            self._log("info", "순찰 스냅샷의 버전/감시 경로가 달라 새로 만듭니다.")
+            return False
+        self._dirs = {d: list(entry) for d, entry in data.get("dirs", {}).items()}
+        self._log("debug", "순찰 스냅샷 로드: 폴더 %d개", len(self._dirs))
+        return True
+
+    def save(self):
+        if not self.snapshot_path:
+            return
+        with self._lock:
+            data = {"version": self.VERSION, "roots": self.roots, "dirs": self._dirs}
+            try:
+                tmp_path = self.snapshot_path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.snapshot_path)
+            except OSError as e:
+                self._log("warning", f"순찰 스냅샷 저장 실패: {e}")
+
+    # ------------------------------------------------------------
+    # 스캔
+    # ------------------------------------------------------------
+    def scan(self):
+        """
+        증분 스캔. 직전 스냅샷 대비 (추가된 파일, 사라진 파일) 정규화 경로 집합을 반환한다.
+        스냅샷이 비어 있으면(첫 실행) 전체를 나열하며 모든 파일이 '추가'로 반환된다. (last_stats["full"] = True)
+        """
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            full = not self._dirs
+            started = time.perf_counter()
+            added, removed = set(), set()
+
+            known = list(self._dirs)
+            for root in self.roots:
+                if root not in self._dirs:
+                    self._dirs[root] = [0, [], [], root]
+                    known.append(root)
+
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="PatrolScan",
+                                    initializer=self.throttle.worker_initializer) as pool:
+                # 1) stat: mtime 이 바뀌었거나 사라진 폴더 찾기
+                changed = []
+                for part in pool.map(self._stat_chunk, self._chunks(known)):
+                    changed.extend(part)
+                stale = [d for d, mtime in changed if mtime is None]
+                for d in stale:
+                    self._drop_tree(d, removed)
+                pending = [(d, self._dirs[d][3]) for d, mtime in changed if mtime is not None and d in self._dirs]
+
+                # 2) 바뀐 폴더만 다시 나열 (새 하위 폴더는 다음 물결에서 나열)
+                listed = 0
+                while pending:
+                    listed += len(pending)
+                    next_pending = []
+                    for part in pool.map(self._list_chunk, self._chunks(pending)):
+                        for d, result in part:
+                            next_pending.extend(self._apply_listing(d, result, added, removed))
+                    pending = next_pending
+
+            self.last_stats = {"full": full, "dirs": len(self._dirs), "dirs_listed": listed,
+                               "added": len(added), "removed": len(removed),
+                               "seconds": round(time.perf_counter() - started, 4)}
+        if added or removed or listed:
+            self.save()
+        return added, removed
+
+    def _chunks(self, items):
+        size = max(64, len(items) // (self.workers * 4) + 1)
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    def _stat_chunk(self, dirs):
+        changed = []
+        self.throttle.charge(entries=len(dirs))
+        for d in dirs:
+            entry = self._dirs.get(d)
+            try:
+                mtime = os.stat(d).st_mtime_ns
+            except OSError:
+                changed.append((d, None))
+                continue
+            if entry is None or entry[0] != mtime:
+                changed.append((d, mtime))
+        return changed
+
+    def _list_chunk(self, items):
+        results = []
+        now_ns = time.time_ns()
+        for d, root in items:
+            files, subdirs = [], []
+            count = 0
+            try:
+                mtime = os.stat(d).st_mtime_ns
+                with os.scandir(d) as it:
+                    for entry in it:
+                        count += 1
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self._is_ignored(entry.path, root):
+                                subdirs.append(entry.name)
+                        elif entry.name.lower().endswith(self.watch_exts):
+                            files.append(entry.name)
+            except OSError:
+                results.append((d, None))
+                continue
+            finally:
+                self.throttle.charge(entries=count)
+            if now_ns - mtime < self.RACY_NS:
+                mtime = 0
+            results.append((d, (mtime, sorted(files), sorted(subdirs))))
+        return results
+
+    def _apply_listing(self, d, result, added, removed):
+        """ 나열 결과를 스냅샷에 반영하고, 새로 나열해야 할 하위 폴더 목록 반환 """
+        if result is None:
+            self._drop_tree(d, removed)
+            return []
+        mtime, files, subdirs = result
+        entry = self._dirs[d]
+        old_files, old_subdirs, root = set(entry[1]), set(entry[2]), entry[3]
+        new_files = set(files)
+        if new_files != old_files:
+            prefix = ProjectFileManager._normalize_path(d).rstrip("/") + "/"
+            added.update(prefix + name.lower() for name in new_files - old_files)
+            removed.update(prefix + name.lower() for name in old_files - new_files)
+        for name in old_subdirs - set(subdirs):
+            self._drop_tree(os.path.join(d, name), removed)
+
+        self._dirs[d] = [mtime, files, subdirs, root]
+        new_dirs = []
+        for name in subdirs:
+            path = os.path.join(d, name)
+            if path not in self._dirs:
+                self._dirs[path] = [0, [], [], root]
+                new_dirs.append((path, root))
+        return new_dirs
+
+    def _drop_tree(self, d, removed):
+        entry = self._dirs.pop(d, None)
+        if entry is None:
+            return
+        for name in entry[1]:
+            removed.add(ProjectFileManager._normalize_path(os.path.join(d, name)))
+        for name in entry[2]:
+            self._drop_tree(os.path.join(d, name), removed)
+
+    def _is_ignored(self, path, root):
+        rel = "/" + os.path.relpath(path, root).replace(os.sep, "/").lower() + "/"
+        return any(d in rel for d in self.ignored_dirs)
+
+    def _log(self, level, msg, *args):
+        if self.logger:
+            getattr(self.logger, level)(msg, *args)
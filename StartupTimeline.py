@@ -0,0 +1,58 @@
+# StartupTimeline.py
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupTimeline:
+    """
+    시작 과정(import / 초기화) 타임라인. main.py --profile-startup 에서 사용.
+    - step(name): 구간 측정 (시작 시각, 소요 시간, 그 사이 새로 로드된 모듈 수)
+    - mark(name): 시점 기록 (예: observer 시작, 캐시 로드 완료)
+    비활성(enabled=False)이면 아무것도 기록하지 않는다.
+    """
+
+    def __init__(self, started=None, enabled=False):
+        self.started = started if started is not None else time.perf_counter()
+        self.enabled = enabled
+        self.entries = []
+
+    def _offset_ms(self, t):
+        return round((t - self.started) * 1000.0, 1)
+
+    @contextmanager
+    def step(self, name):
+        if not self.enabled:
+            yield
+            return
+        modules_before = len(sys.modules)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            t1 = time.perf_counter()
+            self.entries.append({"name": name, "at_ms": self._offset_ms(t0),
+                                 "duration_ms": round((t1 - t0) * 1000.0, 1),
+                                 "modules": len(sys.modules) - modules_before})
+
+    def mark(self, name):
+        if self.enabled:
+            self.entries.append({"name": name, "at_ms": self._offset_ms(time.perf_counter()),
+                                 "duration_ms": None, "modules": None})
+
+    def report_lines(self):
+        lines = [f"{'시점(ms)':>10} {'소요(ms)':>10} {'모듈':>5}  단계"]
+        for e in self.entries:
+            duration = "" if e["duration_ms"] is None else f"{e['duration_ms']:.1f}"
+            modules = "" if e["modules"] is None else str(e["modules"])
+            lines.append(f"{e['at_ms']:>10.1f} {duration:>10} {modules:>5}  {e['name']}")
+        lines.append(f"총 모듈 {len(sys.modules)}개 로드됨")
+        return lines
+
+    def write_json(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"entries": self.entries, "modules_loaded": len(sys.modules)}, f, ensure_ascii=False, indent=2)
+        return path
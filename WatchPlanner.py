@@ -0,0 +1,184 @@
+# WatchPlanner.py
+import os
+import threading
+from watchdog.events import FileSystemEventHandler, FileCreatedEvent
+
+
+class WatchPlanner(FileSystemEventHandler):
+    """
+    감시 계획 수립기.
+    WatchPaths 를 통째로 재귀 감시하면 Intermediate/Binaries/Saved 등 IgnoredDirs 의 빌드 산출물 이벤트까지
+    모두 파이썬으로 올라온다. 대신 트리를 한 번 훑어서
+      - IgnoredDirs 를 포함하지 않는 하위 트리 → 재귀 감시 1개
+      - IgnoredDirs 를 포함하는 폴더          → 그 폴더만 비재귀 감시 + 자식 폴더별로 다시 계획
+      - IgnoredDirs 자체                      → 감시하지 않음
+    로 구독을 나눈다. 프로젝트 파일 폴더(Intermediate/ProjectFiles)는 비재귀로 좁게 감시한다.
+
+    비재귀 감시 폴더 아래에 새 폴더가 생기면(모듈 추가, git checkout 등) 스스로 감시를 추가한다.
+    """
+
+    def __init__(self, config_manager, logger, metrics=None):
+        super().__init__()
+        self.config_manager = config_manager
+        self.logger = logger
+        self.metrics = metrics
+        self.ignored_dirs = list(config_manager.snapshot.ignored_dirs)
+        self.watch_exts = set(config_manager.snapshot.watch_ext_set)
+
+        self._lock = threading.Lock()
+        self._observer = None
+        self._handler = None
+        self._watches = {}          # path(normcase) → ObservedWatch
+        self._shallow_dirs = set()  # 비재귀로 감시 중인 폴더(normcase) → 새 하위 폴더 감시 대상
+        self._roots = []            # (root, root_norm)
+
+    # ------------------------------------------------------------
+    # 계획
+    # ------------------------------------------------------------
+    def is_ignored_dir(self, path, root):
+        """ root 기준 상대경로로 IgnoredDirs 판정 (프로젝트가 C:/Build/... 아래에 있어도 오판하지 않도록) """
+        rel = os.path.relpath(path, root)
+        if rel == ".":
+            return False
+        rel_norm = "/" + rel.replace(os.sep, "/").lower() + "/"
+        return any(d in rel_norm for d in self.ignored_dirs)
+
+    def _plan_dir(self, path, root):
+        """ (계획 목록, 하위에 제외 폴더 존재 여부) 반환 """
+        children = []
+        has_ignored = False
+        try:
+            with os.scandir(path) as it:
+                entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+        except OSError as e:
+            self.logger.warning(f"감시 계획 중 폴더를 읽을 수 없습니다: {path} - {e}")
+            return [(path, True)], False
+
+        for entry in entries:
+            if self.is_ignored_dir(entry.path, root):
+                has_ignored = True
+                continue
+            child_plan, child_has_ignored = self._plan_dir(entry.path, root)
+            children.append(child_plan)
+            has_ignored = has_ignored or child_has_ignored
+
+        if not has_ignored:
+            return [(path, True)], False
+
+        plan = [(path, False)]
+        for child_plan in children:
+            plan.extend(child_plan)
+        return plan, True
+
+    def project_file_dirs(self):
+        return set(self.config_manager.get_project_file_dirs())
+
+    def plan(self):
+        """ [(path, recursive)] 반환 """
+        project_dirs = {os.path.normcase(d) for d in self.project_file_dirs()}
+        plan = []
+        self._roots = []
+        for root in self.config_manager.get_abs_watch_paths():
+            if os.path.normcase(root) in project_dirs:
+                plan.append((root, False))
+                continue
+            self._roots.append((root, os.path.normcase(root)))
+            root_plan, _ = self._plan_dir(root, root)
+            plan.extend(root_plan)
+        return plan
+
+    # ------------------------------------------------------------
+    # 적용
+    # ------------------------------------------------------------
+    def apply(self, observer, handler):
+        """ 계획대로 observer 에 handler 를 등록. 등록된 감시 수 반환 """
+        self._observer = observer
+        self._handler = handler
+        plan = self.plan()
+        recursive_count = shallow_count = 0
+        for path, recursive in plan:
+            self._schedule(path, recursive)
+            if recursive:
+                recursive_count += 1
+            else:
+                shallow_count += 1
+
+        self.logger.info(f"감시 계획: 재귀 감시 {recursive_count}개, 비재귀 감시 {shallow_count}개 "
+                         f"(IgnoredDirs 하위 트리는 구독하지 않음)")
+        for path, recursive in plan:
+            self.logger.debug("  감시: %s (%s)", path, "재귀" if recursive else "비재귀")
+        return len(plan)
+
+    def _schedule(self, path, recursive):
+        key = os.path.normcase(path)
+        with self._lock:
+            if key in self._watches:
+                return False
+            try:
+                watch = self._observer.schedule(self._handler, path, recursive=recursive)
+            except OSError as e:
+                self.logger.warning(f"감시 등록 실패: {path} - {e}")
+                return False
+            self._watches[key] = watch
+            if not recursive:
+                self._shallow_dirs.add(key)
+                # 새 하위 폴더 감지를 위해 자신도 같은 감시에 붙는다.
+                self._observer.add_handler_for_watch(self, watch)
+        if self.metrics:
+            self.metrics.set_gauge("watches", len(self._watches))
+        return True
+
+    def _root_of(self, path):
+        key = os.path.normcase(path)
+        for root, root_norm in self._roots:
+            if key == root_norm or key.startswith(root_norm + os.sep):
+                return root
+        return None
+
+    # ------------------------------------------------------------
+    # 비재귀 감시 폴더 아래의 폴더 생성/이동/삭제
+    # ------------------------------------------------------------
+    def on_created(self, event):
+        if event.is_directory:
+            self._watch_new_directory(event.src_path)
+
+    def on_moved(self, event):
+        if event.is_directory:
+            self._unwatch(event.src_path)
+            self._watch_new_directory(event.dest_path)
+
+    def on_deleted(self, event):
+        if event.is_directory:
+            self._unwatch(event.src_path)
+
+    def _watch_new_directory(self, path):
+        parent = os.path.normcase(os.path.dirname(path))
+        root = self._root_of(path)
+        if parent not in self._shallow_dirs or root is None or self.is_ignored_dir(path, root):
+            return
+
+        new_plan, _ = self._plan_dir(path, root)
+        for sub_path, recursive in new_plan:
+            self._schedule(sub_path, recursive)
+        self.logger.info(f"새 폴더 감시 추가: {path}")
+
+        # 감시 등록 전에 이미 만들어진 소스 파일은 이벤트를 놓쳤으므로 생성 이벤트로 전달
+        for dir_path, dir_names, file_names in os.walk(path):
+            dir_names[:] = [d for d in dir_names if not self.is_ignored_dir(os.path.join(dir_path, d), root)]
+            for name in file_names:
+                if os.path.splitext(name)[1].lower() in self.watch_exts:
+                    self._handler.dispatch(FileCreatedEvent(os.path.join(dir_path, name)))
+
+    def _unwatch(self, path):
+        key = os.path.normcase(path)
+        with self._lock:
+            stale = [k for k in self._watches if k == key or k.startswith(key + os.sep)]
+            for k in stale:
+                watch = self._watches.pop(k)
+                self._shallow_dirs.discard(k)
+                try:
+                    self._observer.unschedule(watch)
+                except (KeyError, OSError):
+                    pass
+        if stale and self.metrics:
+            self.metrics.set_gauge("watches", len(self._watches))
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+성능 벤치마크 스크립트
+- FakeProjectGenerator 로 가짜 프로젝트를 만든 뒤 파싱/정규화/diff/이벤트 필터/삭제/캐시 저장·로드를 측정
+- 결과는 JSON(기계 판독용)으로 출력 → 리비전 간 비교 가능
+
+사용 예)
+    python benchmark.py --modules 20 --files 500 --output bench_before.json
+    python benchmark.py --modules 20 --files 500 --compare bench_before.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileDeletedEvent
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from EventFilter import EventFilter
+from EventHandler import ChangeHandler
+from FileDeleter import FileDeleter
+from SourceSnapshot import SourceTreeSnapshot
+from OrphanScanner import OrphanScanner
+from FakeProjectGenerator import generate_fake_project
+
+
+class _IdleOrchestrator:
+    """ 이벤트 필터 경로만 측정하기 위한 아무 일도 하지 않는 오케스트레이터 """
+
+    def is_running(self):
+        return False
+
+    def run_full_update(self, reason=None, events=()):
+        pass
+
+    def is_own_project_write(self, path):
+        return False
+
+    def handle_file_deleted_pre_ubt(self, path):
+        return True  # 삭제 이벤트도 갱신 예약 경로까지 측정
+
+
+def _measure(func, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        func(arg) if setup else func()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return {
+        "runs": repeat,
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+    }
+
+
+def _git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run_benchmarks(work_dir, modules, files, plugins, repeat, events, deletes, projects=1):
+    logger = AppLogger(level="WARNING")
+    results = {}
+
+    start = time.perf_counter()
+    project = generate_fake_project(os.path.join(work_dir, "FakeGame"), modules=modules,
+                                    files_per_module=files, plugins=plugins, projects=projects)
+    results["generate_project"] = {"runs": 1, "min_ms": round((time.perf_counter() - start) * 1000.0, 3)}
+
+    config_manager = ConfigManager(config_path=project.config_path)
+    config_manager.set_logger(logger)
+    pfm = ProjectFileManager(config_manager, logger)
+
+    # --- 파싱 ---------------------------------------------------------
+    results["parse_vcxproj_and_filters"] = _measure(pfm._get_files_from_project_files, repeat)
+    results["parse_filters_only"] = _measure(lambda: pfm.parse_filters(filters_only=True), repeat)
+
+    # --- 정규화 -------------------------------------------------------
+    raw_paths = list(project.source_files)
+    results["normalize_paths"] = _measure(lambda: [pfm._normalize_path(p) for p in raw_paths], repeat)
+
+    # --- diff ---------------------------------------------------------
+    cache_set = set(pfm._get_files_from_project_files())
+    current_set = set(list(cache_set)[: max(1, int(len(cache_set) * 0.99))])
+    results["diff_cache_vs_current"] = _measure(lambda: cache_set - current_set, repeat)
+
+    # --- 캐시 저장/로드 -----------------------------------------------
+    cache_list = sorted(cache_set)
+    results["cache_save"] = _measure(lambda: pfm.save_cache(cache_list), repeat)
+    results["cache_load"] = _measure(pfm._load_cache, repeat)
+
+    # --- 순찰 스캔 (전체 나열 vs 변경 없는 증분) -------------------------
+    def _fresh_snapshot():
+        snapshot = SourceTreeSnapshot.from_config(config_manager, logger)
+        snapshot.snapshot_path = None  # 저장/로드 없이 스캔만 측정
+        return snapshot
+
+    results["patrol_full_scan"] = _measure(lambda snapshot: snapshot.scan(), repeat, setup=_fresh_snapshot)
+    warm = _fresh_snapshot()
+    warm.scan()
+    warm.RACY_NS = 0  # 방금 만든 폴더도 mtime 을 기억하도록 (측정용)
+    warm.scan()
+    results["patrol_noop_scan"] = _measure(warm.scan, repeat)
+    results["patrol_noop_scan"]["dirs"] = warm.last_stats["dirs"]
+
+    # --- 고아 소스 스캔 (전체 나열 + 참조 집합 diff) ----------------------
+    results["orphan_scan"] = _measure(OrphanScanner(config_manager, pfm, logger).scan, repeat)
+
+    # --- 이벤트 필터 ----------------------------------------------------
+    # 측정 중 디바운스 타이머/이벤트 스톰(bulk) 모드가 동작하지 않도록
+    # (스톰 감지가 켜지면 필터 대신 bulk 경로를 재게 되고 StormQuiescence 스레드가 남는다)
+    handler_config = config_manager.with_overrides({"DebounceTimeMs": 3600 * 1000, "StormEventsPerSecond": 0})
+    handler = ChangeHandler(handler_config, logger, EventFilter(handler_config), _IdleOrchestrator())
+    binaries_dir = os.path.join(project.root, "Binaries", "Win64")
+
+    def _make_events():
+        batch = []
+        for i in range(events):
+            src = project.source_files[i % len(project.source_files)]
+            kind = i % 4
+            if kind == 0:
+                batch.append(FileCreatedEvent(src.replace(".cpp", f"_{i}.cpp").replace(".h", f"_{i}.h")))
+            elif kind == 1:
+                batch.append(FileModifiedEvent(src))
+            elif kind == 2:
+                batch.append(FileCreatedEvent(os.path.join(binaries_dir, f"Obj{i}.pdb")))
+            else:
+                batch.append(FileDeletedEvent(src.replace(".cpp", f"_gone{i}.cpp").replace(".h", f"_gone{i}.h")))
+        return batch
+
+    def _dispatch(batch):
+        for event in batch:
+            handler.dispatch(event)
+
+    results["event_filter"] = _measure(_dispatch, repeat, setup=_make_events)
+    results["event_filter"]["events"] = events
+    if handler.timer:
+        handler.timer.cancel()
+
+    # --- 삭제 ---------------------------------------------------------
+    deleter = FileDeleter(dry_run=False, logger=logger, use_trash=False)
+    sandbox = os.path.join(work_dir, "DeleteSandbox")
+
+    def _make_files():
+        shutil.rmtree(sandbox, ignore_errors=True)
+        os.makedirs(sandbox)
+        paths = []
+        for i in range(deletes):
+            path = os.path.join(sandbox, f"File{i}.cpp")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("// delete me\n")
+            paths.append(path)
+        return paths
+
+    def _delete_all(paths):
+        for path in paths:
+            deleter.delete(path)
+
+    results["delete_files"] = _measure(_delete_all, repeat, setup=_make_files)
+    results["delete_files"]["files"] = deletes
+
+    pfm.close()
+    logger.shutdown()
+    return results
+
+
+def compare(current, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\n=== 비교: {baseline.get('revision')} → {current.get('revision')} (median ms) ===")
+    for name, result in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        new_ms = result.get("median_ms", result.get("min_ms"))
+        if not old:
+            print(f"  {name:28s} {new_ms:>10.3f}   (기준 없음)")
+            continue
+        old_ms = old.get("median_ms", old.get("min_ms"))
+        ratio = (new_ms / old_ms) if old_ms else float("inf")
+        print(f"  {name:28s} {old_ms:>10.3f} → {new_ms:>10.3f}   x{ratio:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AutoGenerate 성능 벤치마크")
+    parser.add_argument("--modules", type=int, default=10)
+    parser.add_argument("--files", type=int, default=200, help="모듈당 소스 파일 수")
+    parser.add_argument("--plugins", type=int, default=0)
+    parser.add_argument("--projects", type=int, default=1, help=".vcxproj 개수 (다중 프로젝트 파싱)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--deletes", type=int, default=200)
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (없으면 stdout)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--keep", action="store_true", help="생성한 가짜 프로젝트를 지우지 않음")
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix="autogen_bench_")
+    try:
+        results = run_benchmarks(work_dir, args.modules, args.files, args.plugins, args.repeat,
+                                 args.events, args.deletes, args.projects)
+    finally:
+        if args.keep:
+            print(f"[INFO] 가짜 프로젝트 유지: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"modules": args.modules, "files_per_module": args.files, "plugins": args.plugins,
+                   "projects": args.projects,
+                   "source_files": (args.modules + args.plugins) * args.files, "repeat": args.repeat},
+        "results": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"[INFO] 벤치마크 결과 저장: {args.output}")
+    else:
+        print(text)
+
+    if args.compare:
+        compare(report, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+고아 소스 파일 탐지 스크립트
+- WatchPaths 아래 디스크에는 있지만 .vcxproj/.filters 가 참조하지 않는 소스 파일을 찾아 리포트로 남긴다.
+- 삭제하지 않는다. 리포트(ReportDir/orphans_<ts>.jsonl)를 보고 직접 정리하거나 프로젝트 파일을 재생성할 것.
+
+사용 예)
+    python find_orphans.py
+    python find_orphans.py --config C:\\Tools\\AutoGenerate\\config.json --no-throttle --output orphans.jsonl
+"""
+
+import os
+import sys
+import argparse
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from IoThrottle import IoThrottle
+from OrphanScanner import OrphanScanner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="프로젝트가 참조하지 않는 소스 파일 탐지")
+    parser.add_argument("--config", help="config.json 경로 (기본: 스크립트 폴더의 config.json)")
+    parser.add_argument("--output", help="리포트 경로 (기본: ReportDir/orphans_<ts>.jsonl)")
+    parser.add_argument("--no-throttle", action="store_true", help="I/O 예산/빌드 중 대기 없이 최대 속도로 스캔")
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args(argv)
+
+    logger = AppLogger(level=args.log_level)
+    try:
+        config_manager = ConfigManager(config_path=args.config)
+        config_manager.set_logger(logger)
+        throttle = None if args.no_throttle else IoThrottle.from_config(config_manager, logger)
+        scanner = OrphanScanner(config_manager, ProjectFileManager(config_manager, logger), logger, throttle=throttle)
+        result = scanner.scan()
+        scanner.write_report(result, args.output)
+        return 1 if result["orphans"] else 0
+    finally:
+        logger.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,128 +1,242 @@
 # main.py
-import sys
-import os
 import time
-from watchdog.observers import Observer
-import threading
-
-# 모든 모듈 임포트
-import AppLogger
-import ConfigManager
-import SetupManager
-import ProjectFileManager
-import FileDeleter
-import EventFilter
-import EventHandler
-import Orchestrator
-import BackupManager
-
-class PatrolThread(threading.Thread):
-    logger: object
-
-    def __init__(self, orchestrator, patrol_interval_minutes, logger):
-        super().__init__()
-        self.orchestrator = orchestrator
-        self.patrol_interval_seconds = patrol_interval_minutes * 60
-        self.logger = logger
-        self._stop_event = threading.Event()
-
-    def run(self):
-        if self.patrol_interval_seconds <= 0:
-            self.logger.info("정기 순찰 기능이 비활성화되었습니다. (PatrolIntervalMinutes가 0 이하)")
-            return
-
-        self.logger.info(
-            f"정기 순찰 스레드 시작. 매 {self.patrol_interval_seconds}초 ({self.patrol_interval_seconds / 60}분)마다 프로젝트 상태를 확인합니다.")
-        while not self._stop_event.is_set():
-            stopped = self._stop_event.wait(self.patrol_interval_seconds)
-            if stopped:
-                break
-
-            self.orchestrator.patrol_for_changes()
-
-        self.logger.info("정기 순찰 스레드 종료.")
-
-    def stop(self):
-        self._stop_event.set()
+_STARTED = time.perf_counter()  # --profile-startup 타임라인 기준 시각
 
+import sys
+import os
 
-def main():
-    # 1. 로거 및 설정 마법사 실행 (config.json 생성 보장)
-    base_dir = os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else os.path.abspath(__file__))
-
-    # 임시 로그 경로를 .txt 확장자로 변경
-    temp_log_path = os.path.join(base_dir, 'Logs/Watcher_init.txt')
-    logger = AppLogger.AppLogger(log_file=temp_log_path, level="INFO")
-
-    setup_manager = SetupManager.SetupManager(logger=logger)
-    setup_manager.run_setup_if_needed()
-
-    # 2. 핵심 관리자들 생성
-    config_manager = ConfigManager.ConfigManager()
-    config_manager.set_logger(logger)
-
-    # 이제 진짜 설정값을 읽어서 로거를 재설정
-    # 로그 파일 경로도 .txt 확장자로 변경
-    logger.reconfigure(log_file=config_manager.get_abs_logfile().replace('.log', '.txt'),
-                       level=config_manager.get_setting("LogLevel", "INFO").upper())
+from StartupTimeline import StartupTimeline
+
+startup = StartupTimeline(_STARTED, enabled="--profile-startup" in sys.argv[1:])
+
+# 감시에 항상 필요한 모듈만 여기서 임포트.
+# 설정 마법사/제어 채널/1회 실행 모드와 무거운 외부 의존성(watchdog observer, multiprocessing, send2trash, psutil,
+# http.server, pstats)은 실제로 쓰는 시점에 임포트한다.
+with startup.step("import:core"):
+    import AppLogger
+    import ConfigManager
+    import ProjectFileManager
+    import FileDeleter
+    import EventFilter
+    import EventHandler
+    import Orchestrator
+    import BackupManager
+    import Metrics
+    import EventTracer
+    import RunProfiler
+    import RunHistory
+    import RunCoordinator
+    import EventRecorder
+    import GitStateMonitor
+    import WatchPlanner
+    import OverflowMonitor
+    import IoThrottle
+    import RootSet
+    from RootSet import WatchRoot
+
+
+def build_root(config_manager, logger, root_set, shared, parse_pool=None):
+    """ 루트 하나의 상태(프로젝트 파일/오케스트레이터/핸들러)를 만들고 공유 observer 에 감시를 건다. """
+    name = root_set.unique_name(config_manager.get_root_name())
+    if shared["multi_root"]:
+        logger = logger.for_root(name)
+    metrics = shared["metrics"]
 
-    # 3. 의존성 객체들 생성
     backup_manager = BackupManager.BackupManager(config_manager.get_abs_backup_dir(), logger)
-
     file_deleter = FileDeleter.FileDeleter(
         config_manager.get_setting("DryRun", False),
         backup_manager,
         logger
     )
-
-    project_file_manager = ProjectFileManager.ProjectFileManager(config_manager, logger)
+    # 캐시는 백그라운드 스레드에서 로드 (observer 는 그동안 이벤트를 큐에 쌓고, 캐시가 필요한 처리만 로드 완료를 기다림)
+    project_file_manager = ProjectFileManager.ProjectFileManager(config_manager, logger, parse_pool=parse_pool,
+                                                                 background_load=True)
     event_filter = EventFilter.EventFilter(config_manager)
+    # 같은 프로젝트를 갱신하는 다른 감시기/--once 실행과 UBT·캐시 커밋을 겹치지 않도록 (프로젝트 폴더의 잠금 파일)
+    coordinator = RunCoordinator.RunCoordinator.from_config(config_manager, logger, metrics)
+
+    # 실제 작업을 할 Orchestrator 생성 (갱신은 루트 공유 생성기 큐에서 실행)
+    orchestrator = Orchestrator.UpdateOrchestrator(config_manager, logger, project_file_manager, file_deleter,
+                                                   metrics=metrics, tracer=shared["tracer"],
+                                                   profiler=shared["profiler"], io_throttle=shared["io_throttle"],
+                                                   history=shared["history"],
+                                                   coordinator=coordinator,
+                                                   work_queue=root_set.generator_queue)
+    orchestrator.name = name
+
+    # 이벤트를 감지할 EventHandler 생성 (Orchestrator 전달)
+    handler = EventHandler.ChangeHandler(config_manager, logger, event_filter, orchestrator,
+                                         metrics=metrics, tracer=shared["tracer"], scheduler=root_set.scheduler)
+    if config_manager.get_setting("WarmStart", True):
+        # 감시를 먼저 시작하고 오프라인 대조는 백그라운드에서 (그동안 이벤트는 버퍼링 후 대조가 끝나면 처리)
+        handler.begin_warm_start()
+    # (옵션) 원본 watchdog 이벤트 기록 → replay_events.py 로 재생
+    watch_handler = EventRecorder.EventRecorder.wrap_if_enabled(handler, config_manager, logger)
+    root = root_set.add(WatchRoot(name, config_manager, logger, project_file_manager, orchestrator, handler,
+                                  watch_handler))
+
+    observer = shared["observer"]
+    if config_manager.get_setting("WatchPlanning", True):
+        # IgnoredDirs 하위 트리를 구독하지 않도록 감시 계획 수립
+        WatchPlanner.WatchPlanner(config_manager, logger, metrics).apply(observer, watch_handler)
+    else:
+        for path in config_manager.get_abs_watch_paths():
+            if os.path.exists(path):
+                observer.schedule(watch_handler, path, recursive=True)
+                logger.info(f"Watchdog 감시 시작: {path} (재귀 포함)")
+            else:
+                logger.warning(f"감시할 경로를 찾을 수 없습니다: {path}")
+
+    # git checkout/rebase 등 진행 중에는 갱신 보류
+    root.git_monitor = GitStateMonitor.GitStateMonitor.create_if_available(orchestrator, config_manager, logger,
+                                                                           metrics)
+    if root.git_monitor:
+        root.git_monitor.start(observer)
+    return root
 
-    # 4. 실제 작업을 할 Orchestrator 생성
-    orchestrator = Orchestrator.UpdateOrchestrator(config_manager, logger, project_file_manager, file_deleter)
 
-    # 5. 이벤트를 감지할 EventHandler 생성 (Orchestrator 전달)
-    handler = EventHandler.ChangeHandler(config_manager, logger, event_filter, orchestrator)
+def main():
+    # 1. 설정 마법사 (config.json 이 없을 때만, 임시 로그로)
+    base_dir = os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else os.path.abspath(__file__))
+    logger = None
+    if not os.path.exists(os.path.join(base_dir, "config.json")):
+        with startup.step("setup_wizard"):
+            import SetupManager  # winreg 등 Windows 전용 의존성 → 필요할 때만
+            # 임시 로그 경로를 .txt 확장자로 변경
+            logger = AppLogger.AppLogger(log_file=os.path.join(base_dir, 'Logs/Watcher_init.txt'), level="INFO")
+            SetupManager.SetupManager(logger=logger).run_setup_if_needed()
+
+    # 2. 설정 로드 후 로거는 설정값으로 한 번만 생성 (마법사를 거친 경우에만 재설정)
+    with startup.step("config"):
+        config_manager = ConfigManager.ConfigManager()
+    with startup.step("logger"):
+        # 로그 파일 경로도 .txt 확장자로 변경
+        log_options = dict(
+            log_file=config_manager.get_abs_logfile().replace('.log', '.txt'),
+            level=config_manager.get_setting("LogLevel", "INFO").upper(),
+            file_level=config_manager.get_setting("FileLogLevel", "DEBUG").upper(),
+            max_bytes=config_manager.get_setting("LogMaxBytes", AppLogger.AppLogger.DEFAULT_MAX_BYTES),
+            backup_count=config_manager.get_setting("LogBackupCount", AppLogger.AppLogger.DEFAULT_BACKUP_COUNT))
+        if logger:
+            logger.reconfigure(**log_options)
+        else:
+            logger = AppLogger.AppLogger(**log_options)
+        config_manager.set_logger(logger)
+
+    # 3. 루트 공유 객체들 생성 (다중 루트여도 observer/메트릭/스케줄러/생성기 큐는 하나)
+    root_configs = config_manager.get_root_configs()
+
+    metrics = Metrics.MetricsRegistry()
+    metrics_file = config_manager.get_setting("MetricsFilePath", "")
+    metrics_exporter = Metrics.MetricsExporter(
+        metrics, logger,
+        file_path=config_manager.get_abs_path_from_base_dir(metrics_file) if metrics_file else None,
+        http_port=config_manager.get_setting("MetricsHttpPort", 0),
+        interval_seconds=config_manager.get_setting("MetricsIntervalSeconds", 15)
+    )
 
-    # 6. Watchdog 감시 시작
+    tracer = EventTracer.EventTracer.from_config(config_manager, logger)
+    profiler = RunProfiler.RunProfiler.from_config(config_manager, logger)
+    history = RunHistory.RunHistory.from_config(config_manager, logger, metrics)
+    io_throttle = IoThrottle.IoThrottle.from_config(config_manager, logger, metrics)
+    with startup.step("import:watchdog"):
+        from watchdog.observers import Observer
     observer = Observer()
-    watch_paths = config_manager.get_abs_watch_paths()
-    if not watch_paths:
-        logger.error("감시할 경로가 설정되지 않았습니다. config.json의 WatchPaths를 확인해주세요.")
-        return
-
-    for path in watch_paths:
-        if os.path.exists(path):
-            observer.schedule(handler, path, recursive=True)
-            logger.info(f"Watchdog 감시 시작: {path} (재귀 포함)")
-        else:
-            logger.warning(f"감시할 경로를 찾을 수 없습니다: {path}")
+    root_set = RootSet.RootSet.from_config(config_manager, logger, metrics)
+    shared = {"multi_root": len(root_configs) > 1, "metrics": metrics, "tracer": tracer, "profiler": profiler,
+              "io_throttle": io_throttle, "observer": observer, "history": history}
+
+    # 다중 루트: 프로젝트 파싱 프로세스 풀도 하나만 (첫 파싱 때 프로세스 생성)
+    parse_pool = None
+    if len(root_configs) > 1:
+        parse_workers = config_manager.get_setting("ParseWorkers", 0) or os.cpu_count() or 1
+        if parse_workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            parse_pool = ProcessPoolExecutor(max_workers=parse_workers)
+        logger.info(f"다중 루트 감시: {len(root_configs)}개 루트 "
+                    f"(동시 갱신 최대 {root_set.generator_queue.workers}개)")
+
+    # 4~6. 루트별 Orchestrator/EventHandler 생성 + Watchdog 감시 등록
+    for root_config in root_configs:
+        with startup.step(f"root:{root_config.get_root_name()}"):
+            build_root(root_config, logger, root_set, shared, parse_pool)
 
     if not observer.emitters:
+        if not any(root.config_manager.get_abs_watch_paths() for root in root_set.roots):
+            logger.error("감시할 경로가 설정되지 않았습니다. config.json의 WatchPaths를 확인해주세요.")
         logger.error("감시할 폴더가 하나도 없습니다. 프로그램을 종료합니다.")
+        root_set.stop()
+        if parse_pool:
+            parse_pool.shutdown(wait=False, cancel_futures=True)
         return
 
-    observer.start()
+    with startup.step("observer_start"):
+        observer.start()
+    startup.mark("watching")
+    logger.info(f"감시 시작까지 {time.perf_counter() - _STARTED:.2f}초 (프로젝트 캐시는 백그라운드에서 로드 중)")
+    metrics_exporter.start()
+    # 스케줄러/생성기 큐 시작 + 루트별 정기 순찰 예약
+    root_set.start()
+
+    # 로컬 제어 채널 (watcherctl.py status/update/report/pause/resume/metrics)
+    control_server = None
+    if config_manager.get_setting("ControlServer", True):
+        import ControlServer  # socket/socketserver 는 제어 채널을 켤 때만 로드
+        control_server = ControlServer.ControlServer.from_config(root_set, config_manager, logger, metrics)
+        control_server.start()
+
+    # OS 감시 버퍼 overflow 등 이벤트 유실 의심 시 감시 트리 재대조 (모든 루트)
+    overflow_monitor = OverflowMonitor.OverflowMonitor.from_config(observer, root_set, config_manager, logger, metrics)
+    if overflow_monitor:
+        overflow_monitor.start()
     logger.info(f"폴더 변경 감시 중... (딜레이: {config_manager.get_setting('DebounceTimeMs', 1500) / 1000.0}초) (종료: Ctrl+C)")
 
-    # 정기 순찰 스레드 시작
-    patrol_interval = config_manager.get_setting("PatrolIntervalMinutes", 0.0)  # 0.0으로 명시하여 float형 기본값 보장
-    patrol_thread = PatrolThread(orchestrator, patrol_interval, logger)
-    patrol_thread.start()
-
     # 메인 루프
     try:
+        if startup.enabled:
+            _report_startup(root_set, config_manager, logger)
+            return
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
         logger.info("사용자 요청으로 종료합니다...")
     finally:
+        if control_server:
+            control_server.stop()
+        if overflow_monitor:
+            overflow_monitor.stop()
         observer.stop()
         observer.join()
-        patrol_thread.stop()
-        patrol_thread.join()
+        root_set.stop()
+        if parse_pool:
+            parse_pool.shutdown(wait=False, cancel_futures=True)
+        metrics_exporter.stop()
+        tracer.close()
+        history.close()
         logger.info("폴더 감시가 완전히 종료되었습니다.")
+        logger.shutdown()
+
+
+def _report_startup(root_set, config_manager, logger):
+    """ --profile-startup: 모든 루트의 캐시 로드 완료까지 기다린 뒤 타임라인을 출력/저장하고 종료 """
+    with startup.step("cache_load_wait"):
+        for root in root_set.roots:
+            root.project_file_manager.wait_until_loaded()
+            root.orchestrator.cache_set  # 참조 집합 준비까지 포함
+    startup.mark("ready")
+    logger.info("=== 시작 타임라인 (--profile-startup) ===")
+    for line in startup.report_lines():
+        logger.info(line)
+    path = startup.write_json(config_manager.get_abs_path_from_base_dir(
+        config_manager.get_setting("StartupProfilePath", "Logs/startup_profile.json")))
+    logger.info(f"시작 타임라인 저장: {path}")
 
 
 if __name__ == "__main__":
+    from multiprocessing import freeze_support
+    freeze_support()  # PyInstaller 빌드에서 프로젝트 파싱 프로세스 풀 사용
+    if "--once" in sys.argv[1:]:
+        # 빌드 에이전트용: 감시 없이 1회 대조/정리/UBT 후 종료 (종료 코드 0=일치, 1=drift, 2=오류)
+        import OnceRunner
+        sys.exit(OnceRunner.main(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+실행 기록(RunHistory, SQLite) 조회 스크립트
+- 감시기/1회 실행이 남긴 실행 기록(기본: 도구 폴더의 Logs/run_history.sqlite3)을 읽기 전용으로 조회한다.
+- 감시기가 실행 중이어도 조회할 수 있다. (WAL)
+
+사용 예)
+    python query_history.py file C:\\Game\\Source\\Game\\Foo.cpp     # 이 파일은 언제, 왜 지워졌나
+    python query_history.py file foo.cpp                             # 경로 일부로 검색
+    python query_history.py slowest --days 7                         # 이번 주 가장 느린 실행
+    python query_history.py runs --limit 20
+    python query_history.py run 42 --json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import RunHistory
+from ProjectFileManager import ProjectFileManager
+
+
+def _db_path(args):
+    if args.db:
+        return args.db
+    config_path = args.config or os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+    base_dir = os.path.dirname(os.path.abspath(config_path))
+    name = "Logs/run_history.sqlite3"
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            name = json.load(f).get("RunHistoryPath", name) or name
+    except (OSError, ValueError):
+        pass
+    return os.path.abspath(os.path.join(base_dir, name))
+
+
+def _time(ts):
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else "-"
+
+
+def _print_lineage(result):
+    if not any(result.values()):
+        print("기록 없음")
+        return
+    for row in result["deletions"]:
+        backup = f" (백업: {row['backup']})" if row["backup"] else ""
+        print(f"{_time(row['ts'])} [{row['root']}] 실행 #{row['run_id']} {row['stage']} 삭제 {row['result']}: "
+              f"{row['path']}{backup} | 계기: {', '.join(row['reasons']) or '-'}")
+    for row in result["diffs"]:
+        print(f"{_time(row['started'])} [{row['root']}] 실행 #{row['run_id']} {row['stage']} diff 에서 빠짐: "
+              f"{row['path']} | 계기: {', '.join(row['reasons']) or '-'}")
+    for row in result["triggered"]:
+        print(f"{_time(row['ts'])} [{row['root']}] 실행 #{row['run_id']} 계기 이벤트 {row['reason']}/"
+              f"{row['event_type']}: {row['path']}")
+
+
+def _print_runs(runs):
+    for run in runs:
+        extra = ""
+        if "stages" in run:
+            top = sorted(run["stages"], key=lambda s: s["seconds"], reverse=True)[:3]
+            extra = " | " + ", ".join(f"{s['stage']} {s['seconds']:.2f}초" for s in top)
+        elif "reasons" in run:
+            extra = f" | 삭제 {run['deletions']}건, 계기: {', '.join(r for r in run['reasons'] if r) or '-'}"
+        print(f"#{run['run_id']} {_time(run['started'])} [{run['root']}] {run['seconds'] or 0:.2f}초 "
+              f"{run['result']}{extra}")
+
+
+def _print_run(run):
+    print(f"#{run['run_id']} {_time(run['started'])} [{run['root']}] {run['seconds'] or 0:.2f}초 {run['result']}")
+    if run["report_path"]:
+        print(f"  리포트: {run['report_path']}")
+    for stage in run["stages"]:
+        print(f"  단계 {stage['stage']}: {stage['seconds']:.3f}초")
+    for trigger in run["triggers"]:
+        event = f" {trigger['event_type']} {trigger['path']}" if trigger["path"] else ""
+        print(f"  계기 {_time(trigger['ts'])} {trigger['reason']}{event}")
+    for diff in run["diffs"]:
+        print(f"  diff {diff['stage']}: {diff['path']}")
+    for row in run["deletions"]:
+        backup = f" (백업: {row['backup']})" if row["backup"] else ""
+        print(f"  삭제 {row['stage']} {row['result']}: {row['path']}{backup}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="실행 기록(SQLite) 조회")
+    parser.add_argument("--db", help="기록 DB 경로 직접 지정")
+    parser.add_argument("--config", help="감시기 config.json 경로 (RunHistoryPath 결정)")
+    parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    sub = parser.add_subparsers(dest="command", required=True)
+    file_parser = sub.add_parser("file", help="파일 하나의 diff/삭제 이력")
+    file_parser.add_argument("path", help="파일 경로 (존재하는 경로 형태가 아니면 부분 문자열 검색)")
+    file_parser.add_argument("--limit", type=int, default=50)
+    slowest_parser = sub.add_parser("slowest", help="가장 느린 실행")
+    slowest_parser.add_argument("--days", type=float, default=7)
+    slowest_parser.add_argument("--limit", type=int, default=10)
+    runs_parser = sub.add_parser("runs", help="최근 실행")
+    runs_parser.add_argument("--limit", type=int, default=20)
+    run_parser = sub.add_parser("run", help="실행 하나의 상세")
+    run_parser.add_argument("run_id", type=int)
+    args = parser.parse_args(argv)
+
+    db_path = _db_path(args)
+    if not os.path.exists(db_path):
+        print(f"실행 기록이 없습니다: {db_path}", file=sys.stderr)
+        return 2
+    conn = RunHistory.connect(db_path)
+    try:
+        if args.command == "file":
+            exact = os.path.isabs(args.path) or os.sep in args.path or "/" in args.path
+            path = ProjectFileManager._normalize_path(args.path) if exact else args.path
+            result = RunHistory.file_lineage(conn, path, exact=exact, limit=args.limit)
+            printer = _print_lineage
+        elif args.command == "slowest":
+            result = RunHistory.slowest_runs(conn, time.time() - args.days * 86400, args.limit)
+            printer = _print_runs
+        elif args.command == "runs":
+            result = RunHistory.recent_runs(conn, args.limit)
+            printer = _print_runs
+        else:
+            result = RunHistory.run_detail(conn, args.run_id)
+            if result is None:
+                print(f"실행 #{args.run_id} 기록이 없습니다.", file=sys.stderr)
+                return 1
+            printer = _print_run
+    finally:
+        conn.close()
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        printer(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
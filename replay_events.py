@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+기록된 watchdog 이벤트 재생 스크립트
+- EventRecorder 로 남긴 기록(RecordEventsPath / AUTOGEN_RECORD_EVENTS)을 ChangeHandler 에 다시 흘려보낸다.
+- 기본은 가짜 프로젝트(FakeProjectGenerator) 위에서 DryRun 으로 재생 → 실제 프로젝트/UBT 불필요
+- --config 로 실제 프로젝트를 지정해도 프로젝트를 바꾸지 않는다: 삭제는 DryRun, UBT 는 실행하지 않고,
+  캐시(project_cache.json/저널)는 임시 폴더의 복사본을 쓴다. (실행 중인 감시기의 참조 상태와 어긋나지 않도록)
+- 디바운스/중복 제거/병합 처리량을 메트릭(JSON)으로 출력해 리비전 간 회귀 비교에 사용
+
+사용 예)
+    python replay_events.py Logs/events.jsonl.gz --speed 10
+    python replay_events.py Logs/events.jsonl.gz --speed 0 --config C:\\Tools\\AutoGenerate\\config.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from EventFilter import EventFilter
+from EventHandler import ChangeHandler
+from Orchestrator import UpdateOrchestrator
+from Metrics import MetricsRegistry
+from EventRecorder import EventReplayer
+from FakeProjectGenerator import generate_fake_project
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기록된 watchdog 이벤트 재생")
+    parser.add_argument("trace", help="EventRecorder 기록 파일 (.jsonl / .jsonl.gz)")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0 = 대기 없이 최대 속도)")
+    parser.add_argument("--config", help="재생 대상 config.json (없으면 가짜 프로젝트 생성)")
+    parser.add_argument("--modules", type=int, default=4)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--debounce-ms", type=int, help="DebounceTimeMs 덮어쓰기")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    logger = AppLogger(level=args.log_level)
+    temp_dir = None
+    try:
+        overrides = {"DebounceTimeMs": args.debounce_ms} if args.debounce_ms is not None else None
+        if args.config:
+            config_manager = ConfigManager(config_path=args.config, overrides=overrides)
+        else:
+            temp_dir = tempfile.mkdtemp(prefix="autogen_replay_")
+            project = generate_fake_project(temp_dir, modules=args.modules, files_per_module=args.files)
+            config_manager = ConfigManager(config_path=project.config_path, overrides=overrides)
+        config_manager.set_logger(logger)
+
+        cache_dir = None
+        if args.config:
+            cache_dir = tempfile.mkdtemp(prefix="autogen_replay_cache_")
+            for name in ("project_cache.json", "project_cache.journal"):
+                path = os.path.join(config_manager.get_project_root_path(), name)
+                if os.path.exists(path):
+                    shutil.copy2(path, cache_dir)
+            temp_dir = cache_dir
+
+        metrics = MetricsRegistry()
+        project_file_manager = ProjectFileManager(config_manager, logger, cache_dir=cache_dir)
+        file_deleter = FileDeleter(dry_run=True, logger=logger)
+        orchestrator = UpdateOrchestrator(config_manager, logger, project_file_manager, file_deleter, metrics=metrics)
+        orchestrator._run_generate_script = lambda: logger.info("[재생] UBT 실행 생략")
+        handler = ChangeHandler(config_manager, logger, EventFilter(config_manager), orchestrator, metrics=metrics)
+
+        root = None if args.config else config_manager.get_project_root_path()
+        stats = EventReplayer(handler, args.trace, root=root, speed=args.speed, logger=logger).replay()
+
+        # 마지막 디바운스 타이머 / 진행 중인 갱신이 끝날 때까지 대기
+        deadline = time.monotonic() + handler.debounce_time_ms / 1000.0 + 600
+        while time.monotonic() < deadline:
+            timer = handler.timer
+            if (timer is None or timer.finished.is_set()) and not orchestrator.is_running():
+                break
+            time.sleep(0.05)
+
+        print(json.dumps({"replay": stats, "metrics": metrics.snapshot()}, indent=2, ensure_ascii=False))
+        return 0
+    finally:
+        logger.shutdown()
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
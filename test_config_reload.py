@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+설정 스냅샷(ConfigSnapshot) + config.json 핫 리로드 테스트 스크립트
+"""
+
+import json
+import os
+import sys
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.events import FileCreatedEvent
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from EventFilter import EventFilter
+from FakeProjectGenerator import generate_fake_project
+
+
+def _rewrite_config(path, **changes):
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    config.update(changes)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(config, f)
+    # 같은 mtime 틱 안의 재작성도 변경으로 보이도록
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_snapshot_swapped_on_config_change():
+    logger = AppLogger(level="CRITICAL")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=2)
+        config_manager = ConfigManager(config_path=project.config_path)
+        config_manager.set_logger(logger)
+        first = config_manager.snapshot
+
+        # 미리 계산된 값
+        assert first.version == 1
+        assert config_manager.get_abs_main_vcxproj() == os.path.abspath(project.vcxproj_path)
+        assert config_manager.get_abs_path("Source") is config_manager.get_abs_path("Source")
+        assert ".cpp" in first.watch_ext_set and first.ignored_dir_matcher is not None
+
+        source = project.source_files[0]
+        generated = os.path.join(os.path.dirname(source), "Foo.gen.cpp")
+        event_filter = EventFilter(config_manager)
+        assert not event_filter.ignore_by_pattern(FileCreatedEvent(generated))
+        assert config_manager.reload_if_changed() is False  # 변경 없음
+
+        # 변경 → 새 스냅샷으로 교체, 이벤트 판정에 바로 반영 (기존 스냅샷은 그대로)
+        _rewrite_config(project.config_path, IgnoredNamePatterns=[".gen.cpp"], DebounceTimeMs=250)
+        assert config_manager.reload_if_changed() is True
+        assert config_manager.snapshot is not first and config_manager.snapshot.version == 2
+        assert config_manager.get_setting("DebounceTimeMs") == 250
+        assert event_filter.ignore_by_pattern(FileCreatedEvent(generated))
+        assert not first.is_ignored_name("foo.gen.cpp")
+
+        # 스냅샷 설정은 읽기 전용, 덮어쓰기(overrides)는 다시 읽어도 유지
+        try:
+            config_manager.config["DebounceTimeMs"] = 1
+            raise AssertionError("스냅샷 설정이 수정되었습니다.")
+        except TypeError:
+            pass
+        overridden = config_manager.with_overrides({"DebounceTimeMs": 10, "WatchFileExtensions": [".ixx"]})
+        assert overridden.snapshot.watch_exts == (".ixx",) and config_manager.snapshot.watch_exts != (".ixx",)
+        _rewrite_config(project.config_path, DebounceTimeMs=300)
+        assert overridden.reload_if_changed() is False  # 바뀐 키가 덮어쓴 키뿐
+        assert overridden.get_setting("DebounceTimeMs") == 10 and overridden.get_setting("IgnoredNamePatterns")
+        assert config_manager.reload_if_changed() is True and config_manager.get_setting("DebounceTimeMs") == 300
+
+        # 읽을 수 없는 설정 → 기존 스냅샷 유지
+        with open(project.config_path, "w", encoding="utf-8") as f:
+            f.write("{ broken")
+        stat = os.stat(project.config_path)
+        os.utime(project.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+        assert config_manager.reload_if_changed() is False
+        assert config_manager.snapshot.version == 3
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 설정 핫 리로드 테스트 시작 ===")
+    test_snapshot_swapped_on_config_change()
+    print("=== 설정 핫 리로드 테스트 완료 ===")
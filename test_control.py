@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+로컬 제어 채널(ControlServer + watcherctl) 테스트 스크립트
+"""
+
+import json
+import os
+import sys
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from Orchestrator import UpdateOrchestrator
+from EventHandler import ChangeHandler
+from EventFilter import EventFilter
+from RootSet import RootSet, WatchRoot
+from ControlServer import ControlServer, PAUSE_REASON, send_command
+from FakeProjectGenerator import generate_fake_project
+import watcherctl
+
+
+def test_control_commands():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    root_set = RootSet(logger)
+    server = None
+    try:
+        project = generate_fake_project(temp_dir, modules=2, files_per_module=3)
+        config_manager = ConfigManager(config_path=project.config_path)
+        pfm = ProjectFileManager(config_manager, logger)
+        orchestrator = UpdateOrchestrator(config_manager, logger, pfm, FileDeleter(dry_run=True, logger=logger),
+                                          metrics=root_set.metrics, work_queue=root_set.generator_queue)
+        runs = []
+        orchestrator._run_pipeline = lambda: runs.append(1)
+        handler = ChangeHandler(config_manager, logger, EventFilter(config_manager), orchestrator,
+                                scheduler=root_set.scheduler)
+        root_set.add(WatchRoot("Game", config_manager, logger, pfm, orchestrator, handler))
+        root_set.start()
+
+        endpoint = os.path.join(temp_dir, "control_endpoint.json")
+        server = ControlServer(root_set, logger, root_set.metrics, endpoint)
+        assert server.start()
+
+        # 토큰 없는 요청 / 없는 루트 / 알 수 없는 명령은 거부
+        with open(endpoint, "r", encoding="utf-8") as f:
+            assert json.load(f)["port"] == server.port
+        assert not server.handle_line(b'{"command": "status"}\n')["ok"]
+        assert not send_command(endpoint, "status", root="Nope")["ok"]
+        assert not send_command(endpoint, "reboot")["ok"]
+
+        status = send_command(endpoint, "status")["result"]
+        assert [r["name"] for r in status["roots"]] == ["Game"]
+        assert status["roots"][0]["last_run"] is None
+
+        # pause 중 update 는 보류 → resume 때 1회 실행
+        assert send_command(endpoint, "pause")["ok"]
+        assert send_command(endpoint, "update")["ok"]
+        assert root_set.generator_queue.join_idle(timeout=5)
+        assert runs == []
+        assert send_command(endpoint, "status")["result"]["roots"][0]["holds"] == [PAUSE_REASON]
+        assert send_command(endpoint, "resume")["ok"]
+        assert root_set.generator_queue.join_idle(timeout=5)
+        assert runs == [1]
+
+        report = send_command(endpoint, "report")["result"]["roots"][0]
+        assert report["last_run"]["result"] == "ok"
+        metrics = send_command(endpoint, "metrics", args={"format": "prometheus"})["result"]
+        assert 'control_requests_total{command="update"} 1' in metrics
+
+        # CLI 클라이언트
+        assert watcherctl.main(["ping", "--endpoint", endpoint]) == 0
+        assert watcherctl.main(["status", "--endpoint", endpoint]) == 0
+
+        server.stop()
+        server = None
+        assert not os.path.exists(endpoint)
+        assert watcherctl.main(["status", "--endpoint", endpoint]) == 2
+    finally:
+        if server:
+            server.stop()
+        root_set.stop()
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_control_commands()
+    print("✅ 제어 채널 테스트 통과")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+삭제 결과 리포트(DeleteReport) 테스트 스크립트
+- 경로별 결과가 JSON-lines 로 기록되고, 메모리에는 건수와 결과별 최대 SAMPLE_SIZE개 샘플만 남는지 확인
+- with 블록 안에서 예외가 나도 리포트 파일이 닫히는지 확인
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from DeleteReport import DeleteReport
+
+
+def _records(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_counts_and_bounded_samples():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        report_path = os.path.join(temp_dir, "Reports", "run_test.jsonl")
+        with DeleteReport(report_path=report_path, stage="pre-ubt") as report:
+            for i in range(8):
+                report.add_deleted(f"C:/Game/Source/Deleted{i}.cpp")
+            report.add_failed("C:/Game/Source/Locked.cpp")
+            report.add_dryrun("C:/Game/Source/DryRun.cpp")
+            line = report.summary()
+
+        records = _records(report_path)
+        assert [(r["stage"], r["result"]) for r in records] == \
+            [("pre-ubt", "deleted")] * 8 + [("pre-ubt", "failed"), ("pre-ubt", "dryrun")]
+        assert records[0]["path"] == "C:/Game/Source/Deleted0.cpp" and all("ts" in r for r in records)
+
+        assert report.counts == {"deleted": 8, "failed": 1, "dryrun": 1} and report.total == 10
+        # 샘플은 결과별 최근 SAMPLE_SIZE개만
+        assert list(report.samples["deleted"]) == [f"C:/Game/Source/Deleted{i}.cpp" for i in range(3, 8)]
+        assert "실패 샘플: C:/Game/Source/Locked.cpp" in line and report_path in line
+
+        # 같은 실행의 다음 단계는 같은 파일에 이어 쓴다
+        with DeleteReport(report_path=report_path, stage="post-ubt") as report:
+            report.add_deleted("C:/Game/Source/Later.cpp")
+        assert _records(report_path)[-1]["stage"] == "post-ubt" and len(_records(report_path)) == 11
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_report_closed_when_stage_fails():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        report_path = os.path.join(temp_dir, "run_test.jsonl")
+        report = DeleteReport(report_path=report_path, stage="post-ubt")
+        try:
+            with report:
+                report.add_deleted("C:/Game/Source/Deleted.cpp")
+                raise RuntimeError("삭제 도중 실패")
+        except RuntimeError:
+            pass
+        assert report._fp is None
+        assert [r["path"] for r in _records(report_path)] == ["C:/Game/Source/Deleted.cpp"]
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 삭제 리포트 테스트 시작 ===")
+    test_records_counts_and_bounded_samples()
+    test_report_closed_when_stage_fails()
+    print("=== 삭제 리포트 테스트 완료 ===")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+이벤트 스톰(bulk 모드) 테스트 스크립트
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.events import FileCreatedEvent, FileDeletedEvent
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from EventFilter import EventFilter, EventStormDetector
+from EventHandler import ChangeHandler
+from Metrics import MetricsRegistry
+from FakeProjectGenerator import generate_fake_project
+
+
+class _CountingOrchestrator:
+    def __init__(self):
+        self.runs = 0
+
+    def is_running(self):
+        return False
+
+    def wait_idle(self, timeout=None):
+        return True
+
+    def run_full_update(self, reason=None, events=()):
+        self.runs += 1
+
+    def is_own_project_write(self, path):
+        return False
+
+    def handle_file_deleted_pre_ubt(self, path):
+        pass
+
+
+def test_storm_detector_threshold():
+    """초당 임계치를 넘는 순간 한 번만 bulk 모드 진입을 알린다."""
+    detector = EventStormDetector(threshold_per_sec=10, quiet_ms=500)
+    entered = [detector.record(now=100.0 + i * 0.01) for i in range(50)]
+    assert entered.count(True) == 1
+    assert entered.index(True) == 10
+    assert detector.in_bulk
+    assert not detector.is_quiet(now=100.6)
+    assert detector.is_quiet(now=101.0)
+
+    events, _ = detector.end_bulk()
+    assert events == 50
+    assert not detector.in_bulk
+
+
+def test_checkout_storm_runs_single_update():
+    """git checkout 처럼 이벤트가 폭주해도 조용해진 뒤 전체 갱신은 1번만 실행된다."""
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=2)
+        config_manager = ConfigManager(config_path=project.config_path,
+                                       overrides={"StormEventsPerSecond": 50, "StormQuietMs": 200, "DebounceTimeMs": 100})
+
+        orchestrator = _CountingOrchestrator()
+        metrics = MetricsRegistry()
+        handler = ChangeHandler(config_manager, logger, EventFilter(config_manager), orchestrator, metrics=metrics)
+
+        source_dir = os.path.join(project.root, "Source", "FakeGameModule00", "Private")
+        for i in range(1000):
+            path = os.path.join(source_dir, f"Checkout{i}.cpp")
+            handler.dispatch(FileCreatedEvent(path) if i % 2 else FileDeletedEvent(path))
+
+        deadline = time.monotonic() + 5
+        while orchestrator.runs == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(0.3)
+
+        logger.info(f"전체 갱신 횟수: {orchestrator.runs}")
+        assert orchestrator.runs == 1
+        assert metrics.get_counter("storm_entered_total") == 1
+        assert metrics.get_counter("events_bulk_total") > 900
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 이벤트 스톰 테스트 시작 ===")
+    test_storm_detector_threshold()
+    test_checkout_storm_runs_single_update()
+    print("=== 이벤트 스톰 테스트 완료 ===")
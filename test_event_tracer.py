@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+이벤트 타임라인 트레이스(EventTracer) 테스트 스크립트
+- 파일 이벤트 → 디바운스 → 전체 갱신을 실제로 흘려보낸 trace 가 유효한 JSON(Chrome trace-event 배열)인지 확인
+- async 트랙(b/e)이 짝을 이루고, 단계 span(X)과 instant(i)가 올바른 필드를 갖는지 확인
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+from collections import defaultdict
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.events import FileCreatedEvent
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from EventFilter import EventFilter
+from EventHandler import ChangeHandler
+from EventTracer import EventTracer
+from Orchestrator import UpdateOrchestrator
+from FakeProjectGenerator import generate_fake_project
+
+
+def test_trace_is_valid_json_with_paired_spans():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path, overrides={"DebounceTimeMs": 3600 * 1000})
+        trace_path = os.path.join(temp_dir, "Logs", "trace.json")
+        tracer = EventTracer(trace_path, logger)
+        orchestrator = UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger),
+                                          FileDeleter(dry_run=True, logger=logger), tracer=tracer)
+        orchestrator._run_generate_script = lambda: None
+        handler = ChangeHandler(config_manager, logger, EventFilter(config_manager), orchestrator, tracer=tracer)
+
+        # 수락되는 이벤트 1개, 걸러지는 이벤트 1개 → 디바운스 만료 → 전체 갱신
+        new_file = os.path.join(os.path.dirname(project.source_files[0]), "Traced.cpp")
+        open(new_file, "w").close()
+        handler.dispatch(FileCreatedEvent(new_file))
+        handler.dispatch(FileCreatedEvent(os.path.join(project.root, "Saved", "Logs", "Traced.log")))
+        handler.timer.cancel()
+        handler._on_debounce_expired()
+
+        # 기록 도중(닫기 전)에도 ']' 만 붙이면 유효한 JSON
+        tracer.flush()
+        with open(trace_path, "r", encoding="utf-8") as f:
+            assert isinstance(json.loads(f.read() + "]"), list)
+
+        tracer.close()
+        with open(trace_path, "r", encoding="utf-8") as f:
+            events = json.load(f)
+        assert not tracer.enabled
+        tracer.instant("after_close")  # 닫은 뒤 기록은 무시
+
+        assert all({"name", "ph", "pid", "tid"} <= set(e) for e in events)
+        meta = [e for e in events if e["ph"] == "M"]
+        assert meta[0]["name"] == "process_name"
+        named_tids = {e["tid"] for e in meta if e["name"] == "thread_name"}
+        assert {e["tid"] for e in events if e["ph"] != "M"} <= named_tids
+
+        # async 트랙: id 별로 b 하나, e 하나 (같은 name/cat), 그 사이에 n
+        tracks = defaultdict(list)
+        for e in events:
+            if e["ph"] in ("b", "n", "e"):
+                tracks[e["id"]].append(e)
+        assert len(tracks) == 2
+        outcomes = {}
+        for event_id, track in tracks.items():
+            assert [e["ph"] for e in track if e["ph"] != "n"] == ["b", "e"], track
+            begin, end = track[0], track[-1]
+            assert (begin["name"], begin["cat"]) == (end["name"], end["cat"]) == ("file_event", "event")
+            assert begin["ts"] <= end["ts"]
+            outcomes[begin["args"]["path"]] = ([e["name"] for e in track if e["ph"] == "n"], end["args"]["outcome"])
+        assert outcomes[new_file] == (["accepted", "run_started"], "ready")
+        assert outcomes[os.path.join(project.root, "Saved", "Logs", "Traced.log")][1].startswith("filtered:")
+
+        # span(X): dur 이 있고, 단계 span 은 run_full_update 안에 들어간다
+        spans = {e["name"]: e for e in events if e["ph"] == "X"}
+        run = spans["run_full_update"]
+        assert run["args"] == {"events": 1}
+        for name in ("filters_parse", "ubt", "post_parse"):
+            span = spans[name]
+            assert span["dur"] >= 0
+            assert run["ts"] <= span["ts"] and span["ts"] + span["dur"] <= run["ts"] + run["dur"]
+        assert spans["ubt"]["cat"] == "generator"
+
+        instants = [e for e in events if e["ph"] == "i"]
+        assert [e["name"] for e in instants] == ["debounce_expired"] and instants[0]["s"] == "t"
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 이벤트 트레이스 테스트 시작 ===")
+    test_trace_is_valid_json_with_paired_spans()
+    print("=== 이벤트 트레이스 테스트 완료 ===")
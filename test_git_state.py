@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+git 작업 감지(GitStateMonitor) 테스트 스크립트
+- 가짜 프로젝트를 git 저장소로 만들고 index.lock 생성/삭제에 따라 갱신이 보류/해제되는지 확인
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.observers import Observer
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from Orchestrator import UpdateOrchestrator
+from GitStateMonitor import GitStateMonitor, find_git_dir
+from FakeProjectGenerator import generate_fake_project
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return predicate()
+
+
+def test_git_operation_defers_update():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    observer = Observer()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=2)
+        try:
+            subprocess.run(["git", "init", "-q", project.root], check=True, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            os.makedirs(os.path.join(project.root, ".git"))  # git 미설치 환경
+
+        config_manager = ConfigManager(config_path=project.config_path)
+        git_dir = find_git_dir(os.path.join(project.root, "Source"))
+        assert git_dir == os.path.join(project.root, ".git")
+
+        orchestrator = UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger),
+                                          FileDeleter(dry_run=True, logger=logger))
+        monitor = GitStateMonitor(orchestrator, logger, git_dir, settle_ms=100)
+        monitor.start(observer)
+        observer.start()
+
+        # git 작업 시작 → 보류
+        lock_path = os.path.join(git_dir, "index.lock")
+        open(lock_path, "w").close()
+        assert _wait_for(orchestrator.is_held)
+
+        orchestrator.run_full_update()
+        orchestrator.run_full_update()
+        assert orchestrator.metrics.get_counter("runs_executed_total") == 0
+        assert orchestrator.metrics.get_counter("runs_deferred_total", reason="git") == 2
+
+        # git 작업 종료 → 보류된 요청을 1회 실행
+        os.remove(lock_path)
+        assert _wait_for(lambda: orchestrator.metrics.get_counter("runs_executed_total") == 1)
+        assert not orchestrator.is_held()
+        time.sleep(0.3)
+        assert orchestrator.metrics.get_counter("runs_executed_total") == 1
+    finally:
+        observer.stop()
+        observer.join()
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== git 작업 감지 테스트 시작 ===")
+    test_git_operation_defers_update()
+    print("=== git 작업 감지 테스트 완료 ===")
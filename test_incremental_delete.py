@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+삭제 이벤트 증분 반영(handle_file_deleted_pre_ubt) 테스트 스크립트
+- 참조 중인 파일 삭제만 갱신을 예약하고, XML 파싱 없이 캐시 저널에 기록되는지 확인
+- 중단된 실행(filters 파싱 실패 등)이 대기 삭제를 버리지 않고 다음 실행으로 넘기는지 확인
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.events import FileDeletedEvent
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from EventFilter import EventFilter
+from EventHandler import ChangeHandler
+from Orchestrator import UpdateOrchestrator
+from FakeProjectGenerator import generate_fake_project
+
+
+def test_delete_updates_reference_set_without_parsing():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path, overrides={"DebounceTimeMs": 3600 * 1000})
+        pfm = ProjectFileManager(config_manager, logger)
+        orchestrator = UpdateOrchestrator(config_manager, logger, pfm, FileDeleter(dry_run=True, logger=logger))
+        handler = ChangeHandler(config_manager, logger, EventFilter(config_manager), orchestrator)
+
+        def _no_parse(*args, **kwargs):
+            raise AssertionError("삭제 처리 중 XML 파싱 발생")
+        pfm._parse_vcxproj_filters = pfm._parse_vcxproj = _no_parse
+
+        # 프로젝트가 참조하지 않는 파일 삭제 → 갱신 예약 없음
+        handler.dispatch(FileDeletedEvent(os.path.join(os.path.dirname(project.source_files[0]), "Scratch.cpp")))
+        assert handler.timer is None
+        assert handler.metrics.get_counter("events_filtered_total", reason="unreferenced_delete") == 1
+
+        # 참조 중인 파일 삭제 → 메모리/저널 반영 후 갱신 예약
+        victim = project.source_files[0]
+        os.remove(victim)
+        handler.dispatch(FileDeletedEvent(victim))
+        assert handler.timer is not None
+        handler.timer.cancel()
+        normalized = ProjectFileManager._normalize_path(victim)
+        assert normalized not in orchestrator.cache_set
+        assert orchestrator.pending_work() == 1
+        with open(pfm.cache_journal_path, "r", encoding="utf-8") as f:
+            assert f.read() == "-" + normalized + "\n"
+
+        # 재시작 시 저널이 캐시에 합쳐지고 비워진다
+        del pfm._parse_vcxproj_filters, pfm._parse_vcxproj
+        reloaded = ProjectFileManager(config_manager, logger)
+        assert normalized not in reloaded.cached_file_list
+        assert not os.path.exists(reloaded.cache_journal_path)
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_aborted_run_keeps_pending_deletes():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path)
+        pfm = ProjectFileManager(config_manager, logger)
+        orchestrator = UpdateOrchestrator(config_manager, logger, pfm, FileDeleter(dry_run=True, logger=logger))
+        orchestrator._run_generate_script = lambda: None
+
+        victim = project.source_files[0]
+        os.remove(victim)
+        assert orchestrator.handle_file_deleted_pre_ubt(victim) is True
+        assert orchestrator.pending_work() == 1
+
+        # filters 파싱 실패로 PRE-UBT 단계가 중단 → 대기 삭제는 다음 실행으로
+        pfm.parse_filters = lambda *args, **kwargs: []
+        orchestrator.run_full_update("debounce")
+        assert orchestrator.last_run["result"] == "aborted"
+        assert orchestrator.pending_work() == 1
+
+        # 다음 실행이 끝까지 진행하면 반영되어 비워진다 (UBT 가 빠진 파일을 프로젝트에서 제거)
+        del pfm.parse_filters
+        orchestrator._run_generate_script = lambda: project.write_project_files(source_files=project.source_files[1:])
+        orchestrator.run_full_update("debounce")
+        assert orchestrator.pending_work() == 0
+        assert ProjectFileManager._normalize_path(victim) not in orchestrator.cache_set
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 삭제 증분 반영 테스트 시작 ===")
+    test_delete_updates_reference_set_without_parsing()
+    test_aborted_run_keeps_pending_deletes()
+    print("=== 삭제 증분 반영 테스트 완료 ===")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+비동기 로거(AppLogger) 테스트 스크립트
+- 여러 스레드의 로그가 writer 스레드를 거쳐 빠짐없이 순서대로 파일에 기록되는지 확인
+- 크기 기반 회전 + 백그라운드 gzip 압축이 잦은 회전에서도 백업을 덮어쓰지 않는지 확인
+- 새 로거를 만들면 이전 로거의 writer 스레드/atexit 등록이 해제되는지 확인
+"""
+
+import os
+import sys
+import glob
+import gzip
+import time
+import types
+import shutil
+import tempfile
+import threading
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import AppLogger as app_logger_module
+from AppLogger import AppLogger
+
+
+def _read_lines(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def test_queue_writer_keeps_every_record_in_order():
+    temp_dir = tempfile.mkdtemp()
+    log_file = os.path.join(temp_dir, "watcher.txt")
+    logger = AppLogger(log_file=log_file, level="ERROR", file_level="INFO", max_bytes=0)
+    try:
+        def _write(worker):
+            for i in range(200):
+                logger.info("worker %d line %d", worker, i)
+            logger.debug("worker %d debug", worker)  # file_level 미만 → 기록되지 않음
+
+        threads = [threading.Thread(target=_write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.shutdown()
+
+        lines = [line.split("] ", 2)[-1] for line in _read_lines(log_file) if "worker" in line]
+        assert len(lines) == 800
+        for worker in range(4):
+            mine = [line for line in lines if line.startswith(f"worker {worker} ")]
+            assert mine == [f"worker {worker} line {i}" for i in range(200)]
+        assert not any("debug" in line for line in lines)
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_rotation_compresses_without_losing_backups():
+    temp_dir = tempfile.mkdtemp()
+    log_file = os.path.join(temp_dir, "watcher.txt")
+
+    # 압축을 느리게 → 이전 압축이 끝나기 전에 다음 회전이 일어난다
+    def _slow_copy(src, dst):
+        time.sleep(0.05)
+        shutil.copyfileobj(src, dst)
+    real_shutil = app_logger_module.shutil
+    app_logger_module.shutil = types.SimpleNamespace(copyfileobj=_slow_copy)
+    logger = AppLogger(log_file=log_file, level="ERROR", file_level="INFO", max_bytes=400, backup_count=50)
+    try:
+        for i in range(60):
+            logger.info("rotation line %03d %s", i, "x" * 20)
+        logger.shutdown()
+
+        backups = sorted(glob.glob(log_file + ".*"))
+        assert backups and all(path.endswith(".gz") for path in backups), backups
+        assert len(backups) >= 3
+        # 번호가 클수록 오래된 로그: 합치면 빠짐 없이 순서대로
+        lines = []
+        for path in sorted(backups, key=lambda p: int(p.split(".")[-2]), reverse=True) + [log_file]:
+            lines += [line.split("] ", 2)[-1] for line in _read_lines(path) if "rotation line" in line]
+        assert lines == [f"rotation line {i:03d} {'x' * 20}" for i in range(60)]
+    finally:
+        app_logger_module.shutil = real_shutil
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_new_logger_releases_previous_one():
+    first = AppLogger(level="ERROR")
+    listener_thread = first._listener._thread
+    second = AppLogger(level="ERROR")
+    try:
+        # 이전 인스턴스의 writer 스레드는 멈추고, 로거에는 새 큐 핸들러만 남는다
+        listener_thread.join(timeout=5)
+        assert not listener_thread.is_alive()
+        assert first._listener is None
+        assert second.logger.handlers == [second._queue_handler]
+    finally:
+        second.shutdown()
+    assert second._queue_handler not in second.logger.handlers
+    second.shutdown()  # 두 번 호출해도 안전
+
+
+if __name__ == "__main__":
+    print("=== 로거 테스트 시작 ===")
+    test_queue_writer_keeps_every_record_in_order()
+    test_rotation_compresses_without_losing_backups()
+    test_new_logger_releases_previous_one()
+    print("=== 로거 테스트 완료 ===")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+메트릭(MetricsRegistry) 테스트 스크립트
+- render_prometheus() 출력이 Prometheus text exposition format 을 따르는지 확인
+  (TYPE 줄, 라벨 값 이스케이프, 누적 히스토그램 버킷/+Inf/_sum/_count, 최근 분위수)
+"""
+
+import os
+import re
+import sys
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from Metrics import MetricsRegistry, MetricsExporter
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{.*\})? (\S+)$')
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"(,|$)')
+
+
+def _unescape(value):
+    return re.sub(r'\\(.)', lambda m: "\n" if m.group(1) == "n" else m.group(1), value)
+
+
+def _parse(text):
+    """ exposition 텍스트 → (TYPE 목록, [(이름, 라벨 dict, 값)]) """
+    assert text.endswith("\n")
+    types, samples = {}, []
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, name, kind = line.split(" ")
+            assert name not in types, f"TYPE 중복: {name}"
+            types[name] = kind
+            continue
+        match = _SAMPLE.match(line)
+        assert match, f"형식 오류: {line!r}"
+        name, label_text, value = match.groups()
+        labels = {}
+        if label_text:
+            body = label_text[1:-1]
+            pos = 0
+            while pos < len(body):
+                label = _LABEL.match(body, pos)
+                assert label, f"라벨 형식 오류: {line!r}"
+                labels[label.group(1)] = _unescape(label.group(2))
+                pos = label.end()
+        samples.append((name, labels, float(value)))
+    return types, samples
+
+
+def test_prometheus_exposition_format():
+    metrics = MetricsRegistry()
+    tricky = 'C:\\Game\\"Source"\nFoo.cpp'
+    metrics.inc("events_received_total", type="created")
+    metrics.inc("events_received_total", 2, type="deleted")
+    metrics.inc("deletes_handled_total", path=tricky)
+    metrics.set_gauge("watches", 7)
+    for value in (0.0005, 0.001, 0.003, 0.2, 2.0, 1000.0):  # 경계값(0.001)과 마지막 버킷 초과값 포함
+        metrics.observe("stage_seconds", value, stage="ubt")
+
+    types, samples = _parse(metrics.render_prometheus())
+    assert types == {"autogen_events_received_total": "counter", "autogen_deletes_handled_total": "counter",
+                     "autogen_watches": "gauge", "autogen_stage_seconds": "histogram",
+                     "autogen_stage_seconds_recent": "gauge"}
+    values = {(name, tuple(sorted(labels.items()))): value for name, labels, value in samples}
+
+    # 라벨 값 이스케이프(\\, \", \n)가 원래 값으로 되돌아온다
+    assert values[("autogen_deletes_handled_total", (("path", tricky),))] == 1
+    assert values[("autogen_events_received_total", (("type", "deleted"),))] == 2
+    assert values[("autogen_watches", ())] == 7
+
+    # 히스토그램: le 오름차순 누적 카운트, 마지막은 +Inf == _count, _sum 은 관측값 합계
+    bucket_samples = [(labels, value) for name, labels, value in samples if name == "autogen_stage_seconds_bucket"]
+    assert all(set(labels) == {"stage", "le"} and labels["stage"] == "ubt" for labels, _ in bucket_samples)
+    buckets = [(labels["le"], value) for labels, value in bucket_samples]
+    bounds = [float(le) for le, _ in buckets[:-1]]
+    assert bounds == sorted(bounds) and buckets[-1][0] == "+Inf"
+    counts = [value for _, value in buckets]
+    assert counts == sorted(counts)
+    by_le = dict(buckets)
+    assert by_le["0.001"] == 2 and by_le["0.005"] == 3 and by_le["0.25"] == 4 and by_le["2.5"] == 5
+    assert by_le["600.0"] == 5 and by_le["+Inf"] == 6
+    assert values[("autogen_stage_seconds_count", (("stage", "ubt"),))] == 6
+    assert abs(values[("autogen_stage_seconds_sum", (("stage", "ubt"),))] - 1002.2045) < 1e-6
+
+    quantiles = {labels["quantile"] for name, labels, _ in samples if name == "autogen_stage_seconds_recent"}
+    assert quantiles == {"0.5", "0.9", "0.99"}
+
+    # 같은 이름의 샘플은 TYPE 줄 바로 뒤에 모여 있어야 한다
+    order = [name for name, _, _ in samples]
+    for family in types:
+        idx = [i for i, name in enumerate(order) if name == family or
+               (types[family] == "histogram" and name in (family + "_bucket", family + "_sum", family + "_count"))]
+        assert idx == list(range(idx[0], idx[-1] + 1)), family
+
+
+def test_exporter_writes_text_file():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        metrics = MetricsRegistry()
+        metrics.inc("runs_executed_total")
+        path = os.path.join(temp_dir, "textfile", "autogen.prom")
+        MetricsExporter(metrics, logger, file_path=path).write_file()
+        with open(path, "r", encoding="utf-8") as f:
+            assert _parse(f.read())[1] == [("autogen_runs_executed_total", {}, 1.0)]
+        assert not os.path.exists(path + ".tmp")
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 메트릭 테스트 시작 ===")
+    test_prometheus_exposition_format()
+    test_exporter_writes_text_file()
+    print("=== 메트릭 테스트 완료 ===")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+다중 프로젝트(.sln 탐색 + 프로세스 풀 파싱) 테스트 스크립트
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from Orchestrator import UpdateOrchestrator
+from FakeProjectGenerator import generate_fake_project
+
+
+def test_solution_projects_parsed_in_pool():
+    logger = AppLogger(level="CRITICAL")
+    temp_dir = tempfile.mkdtemp()
+    pfm = None
+    try:
+        project = generate_fake_project(temp_dir, modules=3, files_per_module=4, plugins=1, projects=3)
+        config_manager = ConfigManager(config_path=project.config_path)
+
+        # 메인 프로젝트 + .sln 의 나머지 두 프로젝트 (메인은 중복 제거)
+        project_files = config_manager.get_project_files()
+        assert [v for v, _ in project_files] == list(project.project_sources)
+        assert config_manager.get_project_file_dirs() == [project.project_files_dir]
+
+        config_manager = config_manager.with_overrides({"ParseWorkers": 2})  # CPU 1개 환경에서도 프로세스 풀 경로 사용
+        pfm = ProjectFileManager(config_manager, logger)
+        union = set(pfm.parse_filters(filters_only=True))
+        assert union == {ProjectFileManager._normalize_path(p) for p in project.source_files}
+        assert pfm._pool is not None
+        for vcxproj, files in project.project_sources.items():
+            assert len(pfm.project_references[vcxproj]) == len(files)
+
+        some_file = ProjectFileManager._normalize_path(project.source_files[0])
+        assert pfm.projects_referencing(some_file) == [project.vcxproj_path]
+
+        # 한 프로젝트라도 filters 파싱에 실패하면 삭제 diff 를 막는다
+        os.remove(list(project.project_sources)[1] + ".filters")
+        assert pfm.parse_filters(filters_only=True) == []
+        assert len(pfm.parse_filters()) > 0
+    finally:
+        if pfm:
+            pfm.close()
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_post_ubt_parse_failure_keeps_references():
+    logger = AppLogger(level="CRITICAL")
+    temp_dir = tempfile.mkdtemp()
+    pfm = None
+    try:
+        project = generate_fake_project(temp_dir, modules=3, files_per_module=4, projects=3)
+        config_manager = ConfigManager(config_path=project.config_path).with_overrides({"ParseWorkers": 1})
+        pfm = ProjectFileManager(config_manager, logger)
+        file_deleter = FileDeleter(dry_run=True, logger=logger)
+        orchestrator = UpdateOrchestrator(config_manager, logger, pfm, file_deleter)
+        before = orchestrator.cache_set
+        broken = list(project.project_sources)[1]
+
+        # UBT 가 프로젝트 파일을 다시 쓰는 도중(잘린 파일)에 UBT 후 비교가 일어남
+        def _truncating_ubt():
+            for path in (broken, broken + ".filters"):
+                with open(path, "r+", encoding="utf-8") as f:
+                    f.truncate(40)
+        orchestrator._run_generate_script = _truncating_ubt
+        orchestrator.run_full_update()
+        assert pfm.failed_projects == [broken]
+        assert "post-ubt" not in orchestrator.last_run["deleted"]
+        assert orchestrator.cache_set == before
+        assert pfm.get_newly_unreferenced_files_and_update_cache() == []
+        assert pfm.check_for_offline_changes() == []
+        assert orchestrator.cache_set == before
+
+        # .vcxproj 가 없어도 실패로 본다 (.filters 만 남은 프로젝트)
+        project.write_project_files(project.project_sources[broken], broken)
+        os.remove(broken)
+        pfm.parse_projects()
+        assert pfm.failed_projects == [broken]
+        assert pfm.get_newly_unreferenced_files_and_update_cache() == []
+        assert orchestrator.cache_set == before
+    finally:
+        if pfm:
+            pfm.close()
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 다중 프로젝트 테스트 시작 ===")
+    test_solution_projects_parsed_in_pool()
+    test_post_ubt_parse_failure_keeps_references()
+    print("=== 다중 프로젝트 테스트 완료 ===")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+다중 루트(한 프로세스에서 여러 체크아웃 감시) 테스트 스크립트
+"""
+
+import json
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.events import FileModifiedEvent
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from Orchestrator import UpdateOrchestrator
+from EventFilter import EventFilter
+from EventHandler import ChangeHandler
+from RootSet import RootSet
+from Scheduler import Scheduler, WorkQueue
+from FakeProjectGenerator import generate_fake_project
+
+
+def _make_roots(temp_dir):
+    game_a = generate_fake_project(os.path.join(temp_dir, "A"), name="GameA", modules=2, files_per_module=3)
+    game_b = generate_fake_project(os.path.join(temp_dir, "B"), name="GameB", modules=2, files_per_module=3)
+    with open(game_a.config_path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    config["Roots"] = [game_b.config_path]
+    with open(game_a.config_path, "w", encoding="utf-8") as f:
+        json.dump(config, f)
+    return game_a, game_b
+
+
+def test_root_configs():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        game_a, game_b = _make_roots(temp_dir)
+        roots = ConfigManager(config_path=game_a.config_path).get_root_configs()
+        assert [os.path.normcase(r.get_project_root_path()) for r in roots] == \
+            [os.path.normcase(game_a.root), os.path.normcase(game_b.root)]
+        assert roots[1].get_setting("Roots") is None
+
+        # 인라인 루트: 이 config.json 위에 키만 덮어씀, 같은 루트는 한 번만
+        config_manager = ConfigManager(config_path=game_a.config_path, overrides={
+            "Roots": [{"RootName": "Copy"}, {"RootName": "GameB2", "ProjectRootPath": game_b.root}]})
+        roots = config_manager.get_root_configs()
+        assert [r.get_root_name() for r in roots] == [os.path.basename(game_a.root), "GameB2"]
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_shared_generator_queue_limits_concurrency():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    root_set = RootSet(logger, max_concurrent_generators=1)
+    try:
+        game_a, _ = _make_roots(temp_dir)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0, "runs": []}
+
+        orchestrators = []
+        for config_manager in ConfigManager(config_path=game_a.config_path).get_root_configs():
+            orchestrator = UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger),
+                                              FileDeleter(dry_run=True, logger=logger),
+                                              work_queue=root_set.generator_queue)
+
+            def fake_pipeline(name=orchestrator.name):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                    state["runs"].append(name)
+                time.sleep(0.2)
+                with lock:
+                    state["active"] -= 1
+
+            orchestrator._run_pipeline = fake_pipeline
+            orchestrators.append(orchestrator)
+
+        root_set.start()
+        first, second = orchestrators
+        first.run_full_update()
+        time.sleep(0.05)                  # first 실행 중
+        for _ in range(3):
+            first.run_full_update()       # 실행 중 요청 3건 → 끝난 뒤 1회로 합쳐짐
+        second.run_full_update()
+        assert root_set.generator_queue.join_idle(timeout=5)
+
+        assert state["peak"] == 1
+        assert sorted(state["runs"]) == sorted([first.name, first.name, second.name])
+        assert first.metrics.get_counter("runs_enqueued_total") == 2
+        assert root_set.metrics.get_counter("work_coalesced_total", queue="Generator") == 2
+    finally:
+        root_set.stop()
+        shutil.rmtree(temp_dir)
+
+
+def test_project_files_written_by_ubt_do_not_requeue():
+    """ UBT 가 갱신 중에 다시 쓴 .filters 이벤트(실행 중 도착/실행 후 늦게 도착)로 갱신이 반복되지 않는다 """
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    work_queue = WorkQueue(workers=1, name="Generator", logger=logger)
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=2)
+        config_manager = ConfigManager(config_path=project.config_path)
+        orchestrator = UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger),
+                                          FileDeleter(dry_run=True, logger=logger), work_queue=work_queue)
+        handler = ChangeHandler(config_manager, logger, EventFilter(config_manager), orchestrator)
+        ubt_runs = []
+
+        def fake_ubt():
+            ubt_runs.append(time.time())
+            project.write_project_files()
+            # watchdog 스레드가 실행 중에 이벤트를 전달
+            delivery = threading.Thread(target=handler.dispatch, args=(FileModifiedEvent(project.filters_path),))
+            delivery.start()
+            delivery.join()
+        orchestrator._run_generate_script = fake_ubt
+
+        work_queue.start()
+        orchestrator.run_full_update()
+        assert work_queue.join_idle(timeout=10)
+        # 실행이 끝난 뒤 늦게 도착한 같은 쓰기의 이벤트
+        handler.dispatch(FileModifiedEvent(project.filters_path))
+        assert work_queue.join_idle(timeout=10)
+        assert len(ubt_runs) == 1
+        assert handler.metrics.get_counter("events_filtered_total", reason="busy") == 1
+        assert handler.metrics.get_counter("events_filtered_total", reason="own_write") == 1
+
+        # 사용자가 프로젝트 파일을 바꾸면 다시 갱신
+        stat = os.stat(project.filters_path)
+        os.utime(project.filters_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        handler.dispatch(FileModifiedEvent(project.filters_path))
+        assert work_queue.join_idle(timeout=10)
+        assert len(ubt_runs) == 2
+    finally:
+        work_queue.stop()
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_scheduler_debounce_handle():
+    scheduler = Scheduler()
+    scheduler.start()
+    try:
+        fired = []
+        cancelled = scheduler.call_later(0.05, fired.append, "cancelled")
+        kept = scheduler.call_later(0.05, fired.append, "kept")
+        cancelled.cancel()
+        assert kept.finished.wait(2)
+        assert cancelled.finished.is_set()
+        assert fired == ["kept"]
+    finally:
+        scheduler.stop()
+
+
+if __name__ == "__main__":
+    test_root_configs()
+    test_shared_generator_queue_limits_concurrency()
+    test_project_files_written_by_ubt_do_not_requeue()
+    test_scheduler_debounce_handle()
+    print("✅ 다중 루트 테스트 통과")
@@ -5,6 +5,8 @@
 
 import os
 import sys
+import shutil
+import tempfile
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -12,16 +14,21 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from ProjectFileManager import ProjectFileManager
 from ConfigManager import ConfigManager
 from AppLogger import AppLogger
+from FakeProjectGenerator import generate_fake_project
 
 def test_path_normalization():
     """경로 정규화가 제대로 작동하는지 테스트합니다."""
     
     # 로거 설정
     logger = AppLogger(level="DEBUG")
+
+    # 실제 프로젝트 대신 가짜 프로젝트 사용
+    temp_dir = tempfile.mkdtemp()
+    project = generate_fake_project(temp_dir, modules=2, files_per_module=6)
     
     try:
         # ConfigManager 생성
-        config_manager = ConfigManager()
+        config_manager = ConfigManager(config_path=project.config_path)
         config_manager.set_logger(logger)
         
         # ProjectFileManager 생성
@@ -72,10 +79,17 @@ def test_path_normalization():
             for i, path in enumerate(list(filters_files)[:3]):
                 logger.info(f"  {i+1}. {path}")
         
+        assert len(vcxproj_files) == len(project.source_files)
+        assert vcxproj_files == filters_files
+        assert vcxproj_files == {project_file_manager._normalize_path(p) for p in project.source_files}
+
         logger.info("=== 경로 정규화 테스트 완료 ===")
         
     except Exception as e:
         logger.error(f"테스트 중 오류 발생: {e}", exc_info=True)
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 if __name__ == "__main__":
     test_path_normalization() 
\ No newline at end of file
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+1회 실행(headless, main.py --once) 모드 테스트 스크립트
+"""
+
+import json
+import os
+import sys
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from OnceRunner import OnceRunner, EXIT_CLEAN, EXIT_DRIFT
+import OnceRunner as once_module
+from FakeProjectGenerator import generate_fake_project
+
+
+def test_once_reports_and_cleans_drift():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=2, files_per_module=5)
+        config_manager = ConfigManager(config_path=project.config_path)
+        pfm = ProjectFileManager(config_manager, logger)
+        pfm.save_cache(set(pfm.parse_filters(filters_only=True)))
+
+        summary, exit_code = OnceRunner(config_manager, logger, check=True).run()
+        assert exit_code == EXIT_CLEAN, summary
+        assert summary["roots"][0]["counts"]["sources_on_disk"] == len(project.source_files)
+
+        # 프로젝트에서 빠졌지만 디스크에 남은 파일 → drift (check 모드는 아무것도 바꾸지 않음)
+        dropped = project.source_files[0]
+        project.write_project_files([p for p in project.source_files if p != dropped])
+        summary, exit_code = OnceRunner(config_manager, logger, check=True).run()
+        root = summary["roots"][0]
+        assert exit_code == EXIT_DRIFT
+        assert root["counts"]["not_in_project"] == 1 and root["counts"]["stale_cache"] == 1
+        assert root["run"] is None
+
+        # --once: 정리(DryRun) + UBT 1회 후 요약 파일/종료 코드
+        summary_path = os.path.join(temp_dir, "summary.json")
+        exit_code = once_module.main(["--once", "--config", project.config_path, "--summary-file", summary_path,
+                                      "--log-level", "ERROR"])
+        assert exit_code == EXIT_DRIFT
+        with open(summary_path, "r", encoding="utf-8") as f:
+            run = json.load(f)["roots"][0]["run"]
+        assert run["result"] == "ok"
+        # (정규화 경로는 소문자 → 대소문자 구분 FS 에서는 failed 로 집계될 수 있음)
+        assert sum(run["deleted"]["pre-ubt"].values()) == 1
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_once_reports_and_cleans_drift()
+    print("✅ 1회 실행 모드 테스트 통과")
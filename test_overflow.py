@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+이벤트 유실(overflow) 감지 → 감시 트리 재대조 테스트 스크립트
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from Orchestrator import UpdateOrchestrator
+from OverflowMonitor import OverflowMonitor
+from FakeProjectGenerator import generate_fake_project
+
+
+def test_overflow_triggers_reconciliation_only_on_drift():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path)
+        orchestrator = UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger),
+                                          FileDeleter(dry_run=True, logger=logger))
+        monitor = OverflowMonitor(Observer(), orchestrator, logger, rescan_delay_ms=0)
+        metrics = orchestrator.metrics
+
+        # 신호가 없으면 아무것도 하지 않음
+        assert monitor.check() is False
+
+        # 유실 의심이지만 디스크와 프로젝트가 일치 → 갱신 없음
+        monitor.signal("native", "test")
+        assert monitor.check() is True
+        assert metrics.get_counter("event_queue_overflows_total", reason="native") == 1
+        assert metrics.get_counter("reconciliations_total", result="clean") == 1
+        assert metrics.get_counter("runs_executed_total") == 0
+
+        # 이벤트를 놓친 새 소스 파일 → 전체 갱신 1회
+        new_file = os.path.join(os.path.dirname(project.source_files[0]), "Missed.cpp")
+        open(new_file, "w").close()
+        monitor.signal("queue_depth")
+        monitor.signal("native")
+        assert monitor.check() is True
+        assert metrics.get_counter("reconciliations_total", result="drift") == 1
+        assert metrics.get_counter("runs_executed_total") == 1
+        assert monitor.check() is False
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_reconcile_waits_for_running_update_without_polling():
+    """ 진행 중인 갱신이 있으면 재대조는 그 실행이 끝나는 즉시 시작한다. """
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path)
+        orchestrator = UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger),
+                                          FileDeleter(dry_run=True, logger=logger))
+        in_ubt, finished, scanned = threading.Event(), [], []
+
+        def _slow_ubt():
+            in_ubt.set()
+            time.sleep(0.1)
+        orchestrator._run_generate_script = _slow_ubt
+        scan = orchestrator.source_snapshot.scan
+        orchestrator.source_snapshot.scan = lambda: (scanned.append(time.perf_counter()), scan())[1]
+
+        def _run():
+            orchestrator.run_full_update()
+            finished.append(time.perf_counter())
+        worker = threading.Thread(target=_run)
+        worker.start()
+        assert in_ubt.wait(10)
+        assert orchestrator.wait_idle(timeout=0) is False
+
+        assert orchestrator.reconcile("test") is False
+        worker.join(10)
+        assert orchestrator.wait_idle(timeout=0) is True
+        # 0.5초 간격 폴링이었다면 실행 종료 후 한참 뒤에야 대조를 시작한다
+        assert scanned[0] - finished[0] < 0.15
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class _Recorder(FileSystemEventHandler):
+    def __init__(self):
+        self.paths = []
+
+    def on_any_event(self, event):
+        self.paths.append(event.src_path)
+
+
+def test_dead_emitter_is_rescheduled():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    observer = Observer(timeout=0.1)
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path)
+        orchestrator = UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger),
+                                          FileDeleter(dry_run=True, logger=logger))
+        orchestrator._run_generate_script = lambda: None
+        monitor = OverflowMonitor(observer, orchestrator, logger, rescan_delay_ms=0)
+        source_dir = os.path.dirname(project.source_files[0])
+        recorder = _Recorder()
+        observer.schedule(recorder, source_dir, recursive=True)
+        observer.start()
+
+        # 감시 스레드가 stop 없이 끝남 (예외 등으로 죽은 emitter 흉내)
+        dead = next(iter(observer.emitters))
+        dead.should_keep_running = lambda: False
+        open(os.path.join(source_dir, "Wake.cpp"), "w").close()  # 이벤트 대기 중인 루프를 한 번 깨운다
+        dead.join(timeout=5)
+        assert not dead.is_alive()
+
+        # 재대조와 함께 같은 핸들러로 다시 감시
+        assert monitor.check() is True
+        assert orchestrator.metrics.get_counter("watches_restarted_total") == 1
+        assert dead not in observer.emitters and all(e.is_alive() for e in observer.emitters)
+        assert monitor.check() is False
+
+        new_file = os.path.join(source_dir, "AfterRestart.cpp")
+        open(new_file, "w").close()
+        deadline = time.time() + 5
+        while new_file not in recorder.paths and time.time() < deadline:
+            time.sleep(0.05)
+        assert new_file in recorder.paths
+    finally:
+        observer.stop()
+        observer.join()
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 이벤트 유실 감지 테스트 시작 ===")
+    test_overflow_triggers_reconciliation_only_on_drift()
+    test_reconcile_waits_for_running_update_without_polling()
+    test_dead_emitter_is_rescheduled()
+    print("=== 이벤트 유실 감지 테스트 완료 ===")
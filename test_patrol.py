@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+정기 순찰(patrol_for_changes) 증분 스캔 테스트 스크립트
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from Orchestrator import UpdateOrchestrator
+from SourceSnapshot import SourceTreeSnapshot
+from IoThrottle import IoThrottle, TokenBucket
+from OrphanScanner import OrphanScanner
+from FakeProjectGenerator import generate_fake_project
+
+
+def _orchestrator(config_manager, logger):
+    return UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger),
+                              FileDeleter(dry_run=True, logger=logger))
+
+
+def test_snapshot_incremental_scan():
+    """변경된 폴더만 다시 나열하고, 사라진 폴더는 하위 트리째 제거한다."""
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=2, files_per_module=5)
+        config_manager = ConfigManager(config_path=project.config_path)
+        snapshot = SourceTreeSnapshot.from_config(config_manager, logger)
+        snapshot.RACY_NS = 0
+
+        added, removed = snapshot.scan()
+        assert len(added) == len(project.source_files) and not removed
+
+        added, removed = snapshot.scan()
+        assert not added and not removed
+        assert snapshot.last_stats["dirs_listed"] == 0
+
+        new_dir = os.path.join(os.path.dirname(project.source_files[0]), "NewFolder")
+        os.makedirs(new_dir)
+        open(os.path.join(new_dir, "New.cpp"), "w").close()
+        ignored_dir = os.path.join(os.path.dirname(project.source_files[0]), "Intermediate")
+        os.makedirs(ignored_dir)
+        open(os.path.join(ignored_dir, "Generated.cpp"), "w").close()
+        added, removed = snapshot.scan()
+        assert added == {ProjectFileManager._normalize_path(os.path.join(new_dir, "New.cpp"))}
+
+        shutil.rmtree(new_dir)
+        added, removed = snapshot.scan()
+        assert not added and len(removed) == 1
+
+        # 저장된 스냅샷으로 재시작해도 증분으로 동작
+        reloaded = SourceTreeSnapshot.from_config(config_manager, logger)
+        added, removed = reloaded.scan()
+        assert not added and not removed
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_patrol_runs_update_only_on_drift():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path)
+        orchestrator = _orchestrator(config_manager, logger)
+        metrics = orchestrator.metrics
+
+        # 첫 순찰: 디스크와 filters 일치 → 갱신 없음
+        assert orchestrator.patrol_for_changes() is False
+        assert orchestrator.patrol_for_changes() is False
+
+        # filters 에 없는 새 파일 → 갱신 1회
+        open(os.path.join(os.path.dirname(project.source_files[0]), "Offline.cpp"), "w").close()
+        assert orchestrator.patrol_for_changes() is True
+        assert metrics.get_counter("runs_executed_total") == 1
+        assert metrics.get_counter("patrol_drift_total") == 1
+
+        # 이미 처리한 변경은 다시 갱신하지 않음
+        assert orchestrator.patrol_for_changes() is False
+        assert metrics.get_counter("runs_executed_total") == 1
+        assert metrics.get_counter("patrols_total") == 4
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_patrol_after_restart_is_incremental():
+    """재시작 후 첫 순찰은 저장된 스냅샷 기준 증분 결과로 대조한다. (전체 나열로 오판해 갱신하지 않음)"""
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path)
+        assert _orchestrator(config_manager, logger).patrol_for_changes() is False
+
+        # 꺼져 있는 동안 새 파일이 생겼고 프로젝트에도 이미 반영됨
+        new_file = os.path.join(os.path.dirname(project.source_files[0]), "AddedWhileOff.cpp")
+        open(new_file, "w").close()
+        project.write_project_files(source_files=project.source_files + [new_file])
+
+        restarted = _orchestrator(config_manager, logger)
+        assert restarted.patrol_for_changes() is False
+        assert restarted.source_snapshot.last_stats["full"] is False
+        assert restarted.metrics.get_counter("runs_executed_total") == 0
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_orphan_scan_finds_unreferenced_sources():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=2, files_per_module=5)
+        config_manager = ConfigManager(config_path=project.config_path)
+        scanner = OrphanScanner(config_manager, ProjectFileManager(config_manager, logger), logger)
+
+        result = scanner.scan()
+        assert result["orphans"] == [] and result["scanned"] == len(project.source_files)
+
+        orphan = os.path.join(os.path.dirname(project.source_files[0]), "Forgotten.h")
+        open(orphan, "w").close()
+        result = scanner.scan()
+        assert result["orphans"] == [orphan]
+
+        report_path = scanner.write_report(result)
+        with open(report_path, "r", encoding="utf-8") as f:
+            assert len(f.readlines()) == 1
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_io_throttle_budget_and_backoff():
+    """예산을 넘으면 기다리고, 빌드 중에는 끝날 때까지 스캔을 멈춘다."""
+    bucket = TokenBucket(rate=1000)
+    assert bucket.consume(1000) == 0.0
+    assert 0.15 < bucket.consume(200) < 0.3
+
+    busy = threading.Event()
+    busy.set()
+    throttle = IoThrottle(busy_checks=[busy.is_set], backoff_ms=20)
+    threading.Timer(0.2, busy.clear).start()
+    started = time.monotonic()
+    throttle.charge(entries=10)
+    assert time.monotonic() - started >= 0.2
+
+    # 제한 없는 기본 throttle 은 기다리지 않는다
+    started = time.monotonic()
+    IoThrottle().charge(entries=10 ** 9, nbytes=10 ** 12)
+    assert time.monotonic() - started < 0.05
+
+
+if __name__ == "__main__":
+    print("=== 정기 순찰 테스트 시작 ===")
+    test_snapshot_incremental_scan()
+    test_patrol_runs_update_only_on_drift()
+    test_patrol_after_restart_is_incremental()
+    test_orphan_scan_finds_unreferenced_sources()
+    test_io_throttle_budget_and_backoff()
+    print("=== 정기 순찰 테스트 완료 ===")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+실행 프로파일러(RunProfiler) 테스트 스크립트
+- 여러 루트가 하나의 프로파일러를 공유할 때, 동시에 들어온 프로파일 대상 실행이 하나씩 측정되는지 확인
+  (tracemalloc 은 프로세스 전역이라 겹치면 한쪽이 다른 쪽 측정을 끊는다)
+"""
+
+import os
+import sys
+import glob
+import time
+import shutil
+import tempfile
+import threading
+import tracemalloc
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from RunProfiler import RunProfiler
+
+
+def test_concurrent_profiled_runs_are_serialized():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        profiler = RunProfiler(temp_dir, every_n_runs=1, top_n=5, logger=logger)
+        state = {"active": 0, "max_active": 0, "tracing": []}
+        state_lock = threading.Lock()
+        errors = []
+
+        def _run():
+            with state_lock:
+                state["active"] += 1
+                state["max_active"] = max(state["max_active"], state["active"])
+            buffers = [bytearray(1024) for _ in range(100)]
+            time.sleep(0.1)
+            state["tracing"].append(tracemalloc.is_tracing())
+            with state_lock:
+                state["active"] -= 1
+            return len(buffers)
+
+        def _worker():
+            try:
+                assert profiler.profile(_run) == 100
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=_worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors, errors
+        assert state["max_active"] == 1
+        assert state["tracing"] == [True, True, True]  # 다른 실행이 tracemalloc 을 멈추지 않았다
+        assert not tracemalloc.is_tracing()
+        assert len(glob.glob(os.path.join(temp_dir, "*.prof"))) == 3
+        assert len(glob.glob(os.path.join(temp_dir, "*_alloc.txt"))) == 3
+
+        # 대상이 아닌 실행은 프로파일 없이 그대로 실행
+        assert RunProfiler(temp_dir, every_n_runs=0).profile(lambda: "plain") == "plain"
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 실행 프로파일러 테스트 시작 ===")
+    test_concurrent_profiled_runs_are_serialized()
+    print("=== 실행 프로파일러 테스트 완료 ===")
@@ -6,12 +6,17 @@
 import os
 import sys
 import json
+import shutil
+import tempfile
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from FileDeleter import FileDeleter
 from AppLogger import AppLogger
+from FakeProjectGenerator import generate_fake_project
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
 
 def test_real_file_deletion():
     """실제 프로젝트의 캐시된 파일 중 하나를 테스트합니다."""
@@ -19,8 +24,14 @@ def test_real_file_deletion():
     # 로거 설정
     logger = AppLogger(level="DEBUG")
     
-    # 캐시 파일 경로
-    cache_file = r"C:\SpartaTeamPrj\Final\1st-Team4-Final-Project\project_cache.json"
+    # 캐시 파일 경로 (환경변수 AUTOGEN_CACHE_FILE 로 실제 프로젝트 지정, 없으면 가짜 프로젝트 생성)
+    cache_file = os.environ.get("AUTOGEN_CACHE_FILE")
+    temp_dir = None
+    if not cache_file:
+        temp_dir = tempfile.mkdtemp()
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=6)
+        config_manager = ConfigManager(config_path=project.config_path)
+        cache_file = ProjectFileManager(config_manager, logger).cache_file_path
     
     try:
         # 캐시 파일 읽기
@@ -65,6 +76,10 @@ def test_real_file_deletion():
         
     except Exception as e:
         logger.error(f"테스트 중 오류 발생: {e}", exc_info=True)
+    finally:
+        # 가짜 프로젝트를 만들었다면 정리
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
 def test_file_path_normalization():
     """경로 정규화 문제를 테스트합니다."""
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+참조 상태 저장소(ReferenceStore) 테스트 스크립트
+- generation 번호가 붙은 불변 스냅샷, 원자적 커밋, 파싱 중 삭제 이벤트 보존(rebase), 캐시/저널 영속화
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from Orchestrator import UpdateOrchestrator
+from ReferenceStore import ReferenceStore
+from FakeProjectGenerator import generate_fake_project
+
+
+def test_snapshots_and_rebase():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache_path = os.path.join(temp_dir, "project_cache.json")
+        journal_path = os.path.join(temp_dir, "project_cache.journal")
+        store = ReferenceStore(cache_path, journal_path, logger)
+        store.load(lambda: ["a", "b", "c"])
+        first = store.current()
+        assert first.generation == 1 and set(first) == {"a", "b", "c"}
+
+        # 파싱 중(base 이후) 삭제 이벤트로 빠진 파일은 커밋에 다시 들어가지 않는다
+        assert store.remove("b") and not store.remove("zzz")
+        snapshot = store.commit({"a", "b", "c", "d"}, "test", base=first)
+        assert set(snapshot) == {"a", "c", "d"} and snapshot.generation == 3
+        assert set(first) == {"a", "b", "c"}  # 이전 스냅샷은 그대로
+
+        # 저널에만 기록된 삭제는 다음 로드 때 캐시에 합쳐진다
+        assert store.remove("c")
+        reloaded = ReferenceStore(cache_path, journal_path, logger)
+        reloaded.load(lambda: [])
+        assert set(reloaded.current()) == {"a", "d"}
+        assert not os.path.exists(journal_path)
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_remove_during_background_load_waits():
+    """ 백그라운드 로드 중의 삭제는 로드가 끝난 참조 집합 기준으로 판정된다 """
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        store = ReferenceStore(os.path.join(temp_dir, "project_cache.json"),
+                               os.path.join(temp_dir, "project_cache.journal"), logger)
+        loading, release = threading.Event(), threading.Event()
+
+        def _slow_rebuild():
+            loading.set()
+            release.wait(5)
+            return ["a", "b"]
+        loader = threading.Thread(target=store.load, args=(_slow_rebuild,))
+        loader.start()
+        assert loading.wait(5)
+
+        results = []
+        remover = threading.Thread(target=lambda: results.append(store.remove("a")))
+        remover.start()
+        remover.join(0.2)
+        assert remover.is_alive()  # 로드 완료 대기 중
+        release.set()
+        loader.join(5)
+        remover.join(5)
+        assert results == [True]
+        assert set(store.current()) == {"b"}
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_orchestrator_and_file_manager_share_state():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path)
+        pfm = ProjectFileManager(config_manager, logger)
+        orchestrator = UpdateOrchestrator(config_manager, logger, pfm, FileDeleter(dry_run=True, logger=logger))
+        orchestrator._run_generate_script = lambda: None
+        assert orchestrator.references is pfm.reference_store
+
+        # UBT 후 파싱 도중 참조 파일이 삭제되어도 커밋이 그 삭제를 덮어쓰지 않는다
+        victim = project.source_files[0]
+        parse = pfm._get_files_from_project_files
+
+        def _parse_with_delete():
+            files = parse()
+            os.remove(victim)
+            assert orchestrator.handle_file_deleted_pre_ubt(victim)
+            return files
+        pfm._get_files_from_project_files = _parse_with_delete
+
+        generation = pfm.reference_store.generation
+        orchestrator.run_full_update()
+        normalized = ProjectFileManager._normalize_path(victim)
+        assert orchestrator.last_run["result"] == "ok"
+        assert normalized not in orchestrator.cache_set
+        assert normalized not in pfm.cached_file_list
+        assert pfm.reference_store.generation > generation
+        assert pfm.reference_store.current().source == "post-ubt"
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 참조 상태 저장소 테스트 시작 ===")
+    test_snapshots_and_rebase()
+    test_remove_during_background_load_waits()
+    test_orchestrator_and_file_manager_share_state()
+    print("=== 참조 상태 저장소 테스트 완료 ===")
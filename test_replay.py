@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+이벤트 재생(replay_events.py) 테스트 스크립트
+- --config 로 실제 프로젝트를 지정해도 프로젝트 캐시/저널을 바꾸지 않고 UBT 도 실행하지 않는지 확인
+"""
+
+import io
+import json
+import os
+import sys
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FakeProjectGenerator import generate_fake_project
+import replay_events
+
+
+def test_replay_against_config_leaves_project_cache_alone():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        pfm = ProjectFileManager(ConfigManager(config_path=project.config_path), logger)
+        with open(pfm.cache_file_path, "rb") as f:
+            cache_before = f.read()
+
+        # 프로젝트에서 빠진 파일의 삭제 이벤트 → 디바운스 후 전체 갱신이 캐시를 커밋하려 한다
+        victim = project.source_files[0]
+        project.write_project_files(source_files=project.source_files[1:])
+        os.remove(victim)
+        trace_path = os.path.join(temp_dir, "events.jsonl")
+        with open(trace_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"v": 1, "root": project.root, "started": 0}) + "\n")
+            f.write(json.dumps([0, "d", os.path.relpath(victim, project.root).replace(os.sep, "/"), None, 0]) + "\n")
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            assert replay_events.main([trace_path, "--speed", "0", "--config", project.config_path,
+                                       "--debounce-ms", "50", "--log-level", "ERROR"]) == 0
+        metrics = json.loads(out.getvalue()[out.getvalue().index("{"):])["metrics"]
+        assert metrics["counters"]["autogen_runs_executed_total"] == 1
+
+        with open(pfm.cache_file_path, "rb") as f:
+            assert f.read() == cache_before
+        assert not os.path.exists(pfm.cache_journal_path)
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 이벤트 재생 테스트 시작 ===")
+    test_replay_against_config_leaves_project_cache_alone()
+    print("=== 이벤트 재생 테스트 완료 ===")
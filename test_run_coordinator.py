@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+프로세스 간 실행 조정(RunCoordinator) 테스트 스크립트
+- 두 프로세스가 같은 프로젝트를 갱신하면 한쪽만 UBT/캐시 커밋을 하고, 나중 요청은 진행 중인 실행이 끝나길 기다려 결과를 재사용하는지 확인
+- 요청보다 먼저 시작한 실행은 그 변경을 못 봤을 수 있으므로 재사용하지 않고 다시 실행하는지 확인
+- 중단된 실행(파이프라인이 False 반환)은 "aborted" 로 기록되고 재사용되지 않는지 확인
+- 자식 프로세스는 이 스크립트를 --hold 로 실행한다.
+
+사용 예)
+    python test_run_coordinator.py
+    python test_run_coordinator.py --hold <config.json> <UBT 흉내 시간(초)> <UBT 실행 기록 파일>
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import subprocess
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from Orchestrator import UpdateOrchestrator
+from RunCoordinator import RunCoordinator
+from FakeProjectGenerator import generate_fake_project
+
+
+def _make_orchestrator(config_path, logger, ubt_seconds, ubt_log):
+    config_manager = ConfigManager(config_path=config_path)
+    orchestrator = UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger),
+                                      FileDeleter(dry_run=True, logger=logger),
+                                      coordinator=RunCoordinator.from_config(config_manager, logger))
+
+    def _fake_ubt():
+        with open(ubt_log, "a", encoding="utf-8") as f:
+            f.write(f"{os.getpid()}\n")
+        time.sleep(ubt_seconds)
+    orchestrator._run_generate_script = _fake_ubt
+    return orchestrator
+
+
+def _hold(config_path, ubt_seconds, ubt_log):
+    """ 자식 프로세스: 잠금을 잡고 느린 UBT 로 전체 갱신 1회 """
+    logger = AppLogger(level="ERROR")
+    try:
+        orchestrator = _make_orchestrator(config_path, logger, float(ubt_seconds), ubt_log)
+        orchestrator.run_full_update()
+        return 0 if orchestrator.last_run["result"] == "ok" else 1
+    finally:
+        logger.shutdown()
+
+
+def _wait_for_state(coordinator, pid, timeout=15.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        state = coordinator.read_state()
+        if state and state.get("pid") == pid and state.get("finished") is None:
+            return state
+        time.sleep(0.05)
+    raise AssertionError("자식 프로세스가 실행을 시작하지 않았습니다.")
+
+
+def test_second_process_reuses_in_flight_run():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    child = None
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        ubt_log = os.path.join(temp_dir, "ubt_runs.txt")
+        orchestrator = _make_orchestrator(project.config_path, logger, 0.0, ubt_log)
+        victim = ProjectFileManager._normalize_path(project.source_files[0])
+        assert victim in orchestrator.cache_set
+
+        # 이쪽 갱신 요청(디바운스 대기 중) 뒤에 프로젝트에서 파일이 빠지고 다른 프로세스가 갱신을 시작
+        orchestrator._note_trigger("debounce", [])
+        project.write_project_files(source_files=project.source_files[1:])
+        child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--hold", project.config_path, "2", ubt_log])
+        _wait_for_state(orchestrator.coordinator, child.pid)
+
+        # 이쪽 요청은 자체 UBT 없이 진행 중인 실행이 끝나길 기다려 결과를 재사용한다
+        orchestrator.run_full_update()
+        assert child.wait(timeout=30) == 0
+        assert orchestrator.last_run["result"] == "reused"
+        assert orchestrator.last_run["reused_from"]["pid"] == child.pid
+        with open(ubt_log, "r", encoding="utf-8") as f:
+            assert f.read().split() == [str(child.pid)]
+        # 다른 프로세스가 커밋한 캐시를 다시 읽었다
+        assert victim not in orchestrator.cache_set
+        assert orchestrator.references.current().source == "reload"
+
+        # 경합이 없으면 직접 실행
+        orchestrator.run_full_update()
+        assert orchestrator.last_run["result"] == "ok"
+        with open(ubt_log, "r", encoding="utf-8") as f:
+            assert f.read().split() == [str(child.pid), str(os.getpid())]
+    finally:
+        if child and child.poll() is None:
+            child.kill()
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_run_started_before_request_is_not_reused():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    child = None
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        ubt_log = os.path.join(temp_dir, "ubt_runs.txt")
+        orchestrator = _make_orchestrator(project.config_path, logger, 0.0, ubt_log)
+
+        # 다른 프로세스가 먼저 갱신을 시작한 뒤에 이쪽 변경/요청이 생김 → 그 실행은 이 변경을 못 봤을 수 있다
+        child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--hold", project.config_path, "1", ubt_log])
+        _wait_for_state(orchestrator.coordinator, child.pid)
+        orchestrator.run_full_update("debounce")
+        assert child.wait(timeout=30) == 0
+        assert orchestrator.last_run["result"] == "ok" and "reused_from" not in orchestrator.last_run
+        with open(ubt_log, "r", encoding="utf-8") as f:
+            assert f.read().split() == [str(child.pid), str(os.getpid())]
+    finally:
+        if child and child.poll() is None:
+            child.kill()
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_lock_released_when_holder_fails():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        coordinator = RunCoordinator(os.path.join(temp_dir, "project_cache.lock"))
+
+        def _fail():
+            raise RuntimeError("UBT 실패")
+        try:
+            coordinator.run(_fail)
+            raise AssertionError("예외가 전달되지 않았습니다.")
+        except RuntimeError:
+            pass
+        assert coordinator.read_state()["result"] == "failed"
+        calls = []
+        assert coordinator.run(lambda: calls.append(1))[0] == "ran" and calls == [1]
+        assert RunCoordinator().run(lambda: calls.append(2)) == ("ran", None)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_aborted_run_is_reported_and_not_reused():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        lock_path = os.path.join(temp_dir, "project_cache.lock")
+        holder, waiter = RunCoordinator(lock_path), RunCoordinator(lock_path, wait_timeout=30)
+        assert RunCoordinator().run(lambda: False) == ("aborted", None)
+
+        # 잠금 보유 실행이 중단(False)으로 끝나면 기다리던 요청은 그 결과를 재사용하지 않고 직접 실행한다
+        started, release, outcomes = threading.Event(), threading.Event(), []
+
+        def _aborting():
+            started.set()
+            release.wait(10)
+            return False
+        thread = threading.Thread(target=lambda: outcomes.append(holder.run(_aborting)))
+        thread.start()
+        assert started.wait(10)
+        requested_at = time.time() - 60
+        threading.Timer(0.3, release.set).start()
+        calls = []
+        outcome, state = waiter.run(lambda: calls.append(1), requested_at=requested_at)
+        thread.join(10)
+        assert outcomes[0][0] == "aborted" and outcomes[0][1]["result"] == "aborted"
+        assert outcome == "ran" and state["result"] == "ok" and calls == [1]
+
+        # 오케스트레이터: filters 파싱 실패로 중단된 실행은 성공으로 보고하지 않는다
+        project = generate_fake_project(os.path.join(temp_dir, "project"), modules=1, files_per_module=4)
+        orchestrator = _make_orchestrator(project.config_path, logger, 0.0, os.path.join(temp_dir, "ubt_runs.txt"))
+        orchestrator.project_file_manager.parse_filters = lambda filters_only=False: []
+        orchestrator.run_full_update()
+        assert orchestrator.last_run["result"] == "aborted"
+        assert orchestrator.coordinator.read_state()["result"] == "aborted"
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--hold":
+        sys.exit(_hold(*sys.argv[2:]))
+    print("=== 프로세스 간 실행 조정 테스트 시작 ===")
+    test_second_process_reuses_in_flight_run()
+    test_run_started_before_request_is_not_reused()
+    test_lock_released_when_holder_fails()
+    test_aborted_run_is_reported_and_not_reused()
+    print("=== 프로세스 간 실행 조정 테스트 완료 ===")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+실행 기록(RunHistory) 테스트 스크립트
+- 실행마다 단계/계기/diff/삭제(백업 경로 포함)가 SQLite 에 한 번에 기록되고, query_history.py 로 조회되는지 확인
+"""
+
+import io
+import json
+import os
+import sys
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from BackupManager import BackupManager
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from Orchestrator import UpdateOrchestrator
+from RunHistory import RunHistory, connect
+from FakeProjectGenerator import generate_fake_project
+import query_history
+
+
+def _query(db_path, *args):
+    out = io.StringIO()
+    with redirect_stdout(out):
+        assert query_history.main(["--db", db_path, "--json", *args]) == 0
+    return json.loads(out.getvalue())
+
+
+def test_run_recorded_and_queried():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path)
+        db_path = os.path.join(temp_dir, "history.sqlite3")
+        history = RunHistory(db_path, logger)
+        pfm = ProjectFileManager(config_manager, logger)
+        file_deleter = FileDeleter(dry_run=False, backup_manager=BackupManager(os.path.join(temp_dir, "Backup"), logger),
+                                   logger=logger, use_trash=False)
+        orchestrator = UpdateOrchestrator(config_manager, logger, pfm, file_deleter, history=history)
+        orchestrator._run_generate_script = lambda: None
+
+        # 프로젝트에서 빠진 파일 → PRE-UBT 단계에서 백업 후 삭제
+        victim = project.source_files[0]
+        normalized = ProjectFileManager._normalize_path(victim)
+        if not os.path.exists(normalized):
+            # 대소문자를 구분하는 파일 시스템: 삭제는 정규화(소문자) 경로로 이뤄지므로 그 경로에도 파일을 둔다
+            os.makedirs(os.path.dirname(normalized), exist_ok=True)
+            shutil.copy2(victim, normalized)
+        project.write_project_files(source_files=project.source_files[1:])
+        orchestrator.run_full_update("debounce", [("created", victim)])
+        orchestrator.run_full_update("patrol")
+        assert not os.path.exists(normalized)
+        history.close()
+
+        # 파일 이력: 언제, 어떤 실행(계기)에서, 어디로 백업 후 지워졌나
+        lineage = _query(db_path, "file", victim)
+        assert [(row["stage"], row["result"]) for row in lineage["deletions"]] == [("pre-ubt", "deleted")]
+        deletion = lineage["deletions"][0]
+        assert deletion["path"] == normalized and deletion["reasons"] == ["debounce"]
+        assert deletion["backup"] and os.path.exists(deletion["backup"])
+        assert [row["stage"] for row in lineage["diffs"]] == ["pre-ubt"]
+        assert lineage["triggered"][0]["event_type"] == "created"
+        assert lineage["triggered"][0]["path"] == normalized  # 계기 경로도 정규화해 저장 → 정확히 일치 검색
+        assert _query(db_path, "file", os.path.basename(victim))["deletions"][0]["run_id"] == deletion["run_id"]
+        # 부분 문자열 검색에서 _ / % 는 와일드카드가 아니다
+        assert not any(_query(db_path, "file", os.path.basename(victim).replace("Class", "_lass")).values())
+        assert not any(_query(db_path, "file", "%").values())
+
+        conn = connect(db_path)
+        try:
+            plan = " ".join(str(row[-1]) for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM triggers x WHERE x.path = ?", (normalized,)))
+            assert "idx_triggers_path" in plan, plan
+        finally:
+            conn.close()
+
+        # 가장 느린 실행 / 실행 상세
+        slowest = _query(db_path, "slowest", "--days", "1")
+        assert len(slowest) == 2 and slowest[0]["seconds"] >= slowest[1]["seconds"]
+        detail = _query(db_path, "run", str(deletion["run_id"]))
+        stages = [stage["stage"] for stage in detail["stages"]]
+        assert stages[:4] == ["filters_parse", "diff", "pre_delete", "cache_save"] and "ubt" in stages
+        assert detail["result"] == "ok" and detail["root"] == orchestrator.name
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_disabled_history_writes_nothing():
+    history = RunHistory()
+    assert not history.enabled
+    history.record_run({"root": "x", "started": 0})
+    history.close()
+
+
+def test_backups_collected_only_with_history():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=1, files_per_module=4)
+        config_manager = ConfigManager(config_path=project.config_path)
+        file_deleter = FileDeleter(dry_run=False, backup_manager=BackupManager(os.path.join(temp_dir, "Backup"), logger),
+                                   logger=logger, use_trash=False)
+        UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger), file_deleter)
+        assert file_deleter.delete(project.source_files[0])
+        assert file_deleter.take_backups() == {}  # 실행 기록이 꺼져 있으면 백업 경로를 쌓아 두지 않는다
+
+        history = RunHistory(os.path.join(temp_dir, "history.sqlite3"), logger)
+        UpdateOrchestrator(config_manager, logger, ProjectFileManager(config_manager, logger), file_deleter,
+                           history=history)
+        history.close()
+        assert file_deleter.delete(project.source_files[1])
+        assert list(file_deleter.take_backups()) == [project.source_files[1]]
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 실행 기록 테스트 시작 ===")
+    test_run_recorded_and_queried()
+    test_disabled_history_writes_nothing()
+    test_backups_collected_only_with_history()
+    print("=== 실행 기록 테스트 완료 ===")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+시작 경로(백그라운드 캐시 로드 + 시작 타임라인) 테스트 스크립트
+"""
+
+import json
+import os
+import sys
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from StartupTimeline import StartupTimeline
+from FakeProjectGenerator import generate_fake_project
+
+
+def test_background_cache_load_matches_sync_load():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=2, files_per_module=5)
+        config_manager = ConfigManager(config_path=project.config_path)
+
+        # 캐시 파일이 없으면 로드 시 프로젝트 파싱 결과로 채워진다 (동기/백그라운드 동일)
+        sync_list = ProjectFileManager(config_manager, logger).cached_file_list
+        pfm = ProjectFileManager(config_manager, logger, background_load=True)
+        assert pfm.wait_until_loaded(timeout=10)
+        assert pfm.is_cache_loaded()
+        assert set(pfm.cached_file_list) == set(sync_list)
+        assert len(sync_list) == len(project.source_files)
+
+        # 로드 완료 전에 캐시를 읽으면 로드를 기다렸다가 반환
+        pfm = ProjectFileManager(config_manager, logger, background_load=True)
+        assert set(pfm.cached_file_list) == set(sync_list)
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir)
+
+
+def test_startup_timeline():
+    disabled = StartupTimeline()
+    with disabled.step("noop"):
+        pass
+    disabled.mark("noop")
+    assert disabled.entries == []
+
+    timeline = StartupTimeline(enabled=True)
+    with timeline.step("import:json"):
+        import json as _json  # noqa: F401 (이미 로드된 모듈 → 새 모듈 0개)
+    timeline.mark("watching")
+    names = [e["name"] for e in timeline.entries]
+    assert names == ["import:json", "watching"]
+    assert timeline.entries[0]["modules"] == 0 and timeline.entries[0]["duration_ms"] >= 0
+    assert timeline.entries[1]["duration_ms"] is None
+    assert len(timeline.report_lines()) == 4
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = timeline.write_json(os.path.join(temp_dir, "Logs", "startup_profile.json"))
+        with open(path, "r", encoding="utf-8") as f:
+            assert [e["name"] for e in json.load(f)["entries"]] == names
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    test_background_cache_load_matches_sync_load()
+    test_startup_timeline()
+    print("✅ 시작 경로 테스트 통과")
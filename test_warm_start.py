@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+시작 시 오프라인 대조(warm start) 테스트 스크립트
+- 대조가 끝날 때까지 이벤트가 버퍼링되고, 끝난 뒤 빠짐없이(중복은 합쳐서) 처리되는지 확인
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.events import FileCreatedEvent, FileDeletedEvent
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from ProjectFileManager import ProjectFileManager
+from FileDeleter import FileDeleter
+from EventFilter import EventFilter
+from EventHandler import ChangeHandler
+from Orchestrator import UpdateOrchestrator
+from RootSet import WatchRoot
+from FakeProjectGenerator import generate_fake_project
+
+
+def _make_root(project, logger):
+    config_manager = ConfigManager(config_path=project.config_path, overrides={"DebounceTimeMs": 3600 * 1000})
+    pfm = ProjectFileManager(config_manager, logger, background_load=True)
+    orchestrator = UpdateOrchestrator(config_manager, logger, pfm, FileDeleter(dry_run=True, logger=logger))
+    runs = []
+    orchestrator._run_pipeline = lambda: runs.append(1)
+    handler = ChangeHandler(config_manager, logger, EventFilter(config_manager), orchestrator)
+    root = WatchRoot("Game", config_manager, logger, pfm, orchestrator, handler)
+    return root, runs
+
+
+def test_events_buffered_until_offline_check_finishes():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project = generate_fake_project(temp_dir, modules=2, files_per_module=4)
+        ProjectFileManager(config_manager=ConfigManager(config_path=project.config_path), logger=logger).save_cache(
+            {ProjectFileManager._normalize_path(p) for p in project.source_files})
+
+        # 변경 없음 → 갱신 없음
+        root, runs = _make_root(project, logger)
+        root.handler.begin_warm_start()
+        root.warm_start()
+        assert runs == [] and not root.handler.is_warming()
+        assert root.orchestrator.metrics.get_counter("warm_starts_total", result="clean") == 1
+
+        # 꺼져 있는 동안 프로젝트에 없는 소스 추가 + 시작 중 참조 파일 삭제 이벤트(중복 2건)
+        with open(os.path.join(os.path.dirname(project.source_files[0]), "Offline.cpp"), "w") as f:
+            f.write("// offline\n")
+        root, runs = _make_root(project, logger)
+        root.handler.begin_warm_start()
+        victim = project.source_files[1]
+        os.remove(victim)
+        root.handler.dispatch(FileDeletedEvent(victim))
+        root.handler.dispatch(FileDeletedEvent(victim))
+        assert root.orchestrator.pending_work() == 0  # 대조 전에는 처리하지 않음
+        assert root.handler.metrics.get_counter("events_buffered_total") == 2
+
+        root.warm_start()
+        assert root.orchestrator.metrics.get_counter("warm_starts_total", result="drift") == 1
+        assert root.handler.metrics.get_counter("events_received_total", type="deleted") == 1
+        assert root.orchestrator.pending_work() == 1  # 버퍼된 삭제가 반영됨
+        assert runs == [1]
+        root.handler.timer.cancel()
+
+        # 버퍼 한도 초과 → 개별 처리 대신 전체 갱신 1회
+        root, runs = _make_root(project, logger)
+        root.handler.warm_buffer_limit = 2
+        root.handler.begin_warm_start()
+        for i in range(5):
+            root.handler.dispatch(FileCreatedEvent(os.path.join(temp_dir, f"New{i}.cpp")))
+        root.handler.end_warm_start()
+        assert runs == [1]
+        assert root.handler.metrics.get_counter("events_received_total", type="created") == 0
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== warm start 테스트 시작 ===")
+    test_events_buffered_until_offline_check_finishes()
+    print("=== warm start 테스트 완료 ===")
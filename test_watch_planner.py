@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+감시 계획(WatchPlanner) 테스트 스크립트
+- IgnoredDirs(Intermediate/Binaries 등)를 포함하는 폴더만 비재귀로, 나머지 하위 트리는 재귀로 나눠 감시하는지 확인
+- 비재귀 감시 폴더 아래에 새 모듈 폴더가 생기면 감시를 추가하고, 감시 전에 이미 생긴 소스 파일을 생성 이벤트로 전달하는지 확인
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from watchdog.events import FileSystemEventHandler, DirCreatedEvent, DirDeletedEvent
+from watchdog.observers import Observer
+
+from AppLogger import AppLogger
+from ConfigManager import ConfigManager
+from WatchPlanner import WatchPlanner
+from FakeProjectGenerator import generate_fake_project
+
+
+class _Recorder(FileSystemEventHandler):
+    """ observer 대신 받은 이벤트를 기록하는 핸들러 """
+
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def dispatch(self, event):
+        self.events.append((event.event_type, event.src_path, event.is_directory))
+
+    def created_files(self):
+        return {path for event_type, path, is_dir in self.events if event_type == "created" and not is_dir}
+
+
+def _write(path, content=""):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def _make_project(temp_dir):
+    # 프로젝트가 IgnoredDirs 이름의 폴더(Build) 아래에 있어도 상대경로로만 판정해야 한다
+    project = generate_fake_project(os.path.join(temp_dir, "Build", "Game"), modules=2, files_per_module=4,
+                                    plugins=1, junk_files=2)
+    plugin_dir = os.path.join(project.root, "Plugins", "FakeGamePlugin00")
+    _write(os.path.join(plugin_dir, "Intermediate", "Build", "Win64", "Plugin.gen.cpp"), "// generated\n")
+    _write(os.path.join(plugin_dir, "Binaries", "Win64", "FakeGamePlugin00.dll"))
+    return project, plugin_dir
+
+
+def _new_module(parent, name):
+    """ 런타임에 추가되는 모듈 (빌드 산출물 폴더 포함) """
+    module_dir = os.path.join(parent, name)
+    header = os.path.join(module_dir, "Source", name, "Public", f"{name}.h")
+    _write(header, "#pragma once\n")
+    _write(os.path.join(module_dir, "Intermediate", "Build", f"{name}.gen.cpp"), "// generated\n")
+    _write(os.path.join(module_dir, "Binaries", "Win64", f"{name}.dll"))
+    return module_dir, header
+
+
+def test_plan_splits_ignored_subtrees():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project, plugin_dir = _make_project(temp_dir)
+        planner = WatchPlanner(ConfigManager(config_path=project.config_path), logger)
+
+        plan = {(os.path.relpath(path, project.root), recursive) for path, recursive in planner.plan()}
+        assert plan == {
+            ("Source", True),                                          # 제외 폴더 없음 → 통째로 재귀
+            ("Plugins", False),                                        # 하위에 제외 폴더 → 비재귀
+            (os.path.relpath(plugin_dir, project.root), False),
+            (os.path.join("Plugins", "FakeGamePlugin00", "Source"), True),
+            (os.path.join("Intermediate", "ProjectFiles"), False),     # 프로젝트 파일 폴더는 좁게
+        }, plan
+
+        # _plan_dir: 제외 폴더 자체는 구독하지 않고, 있으면 has_ignored
+        sub_plan, has_ignored = planner._plan_dir(plugin_dir, project.root)
+        assert has_ignored and (plugin_dir, False) in sub_plan
+        assert not any(os.sep + "Intermediate" in path or os.sep + "Binaries" in path
+                       for path, _ in sub_plan if path.startswith(plugin_dir))
+        assert planner._plan_dir(os.path.join(project.root, "Source"), project.root) == \
+            ([(os.path.join(project.root, "Source"), True)], False)
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_new_directory_is_watched_and_existing_files_replayed():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        project, _ = _make_project(temp_dir)
+        observer = Observer()  # 시작하지 않음: schedule 만 기록
+        recorder = _Recorder()
+        planner = WatchPlanner(ConfigManager(config_path=project.config_path), logger)
+        planned = planner.apply(observer, recorder)
+        assert len(observer.emitters) == planned == 5
+
+        # 비재귀 감시 폴더(Plugins) 아래 새 플러그인: 감시 추가 + 감시 전에 생긴 소스만 생성 이벤트로 전달
+        plugin_dir, header = _new_module(os.path.join(project.root, "Plugins"), "LatePlugin")
+        planner.on_created(DirCreatedEvent(plugin_dir))
+        watched = {(os.path.relpath(w.path, project.root), w.is_recursive) for w in observer._watches}
+        assert (os.path.join("Plugins", "LatePlugin"), False) in watched
+        assert (os.path.join("Plugins", "LatePlugin", "Source"), True) in watched
+        assert not any("Intermediate" in path or "Binaries" in path for path, _ in watched
+                       if path.startswith(os.path.join("Plugins", "LatePlugin")))
+        assert recorder.created_files() == {header}
+
+        # 재귀 감시(Source) 아래 새 모듈은 이미 감시 중 → 추가 감시/재생 없음
+        module_dir, _ = _new_module(os.path.join(project.root, "Source"), "LateModule")
+        before = len(observer.emitters)
+        planner.on_created(DirCreatedEvent(module_dir))
+        assert len(observer.emitters) == before and recorder.created_files() == {header}
+
+        # 폴더 삭제 → 그 아래 감시 해제
+        planner.on_deleted(DirDeletedEvent(plugin_dir))
+        assert not any(w.path.startswith(plugin_dir) for w in observer._watches)
+        assert len(observer.emitters) == planned
+    finally:
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_module_created_while_watching():
+    logger = AppLogger(level="ERROR")
+    temp_dir = tempfile.mkdtemp()
+    observer = Observer(timeout=0.1)
+    try:
+        project, _ = _make_project(temp_dir)
+        recorder = _Recorder()
+        WatchPlanner(ConfigManager(config_path=project.config_path), logger).apply(observer, recorder)
+        observer.start()
+
+        # 감시 밖에서 만든 플러그인을 통째로 옮겨 넣는다 (압축 해제/체크아웃처럼 폴더가 한 번에 생김)
+        staged_dir, _ = _new_module(os.path.join(temp_dir, "Staging"), "RuntimePlugin")
+        plugin_dir = os.path.join(project.root, "Plugins", "RuntimePlugin")
+        header = os.path.join(plugin_dir, "Source", "RuntimePlugin", "Public", "RuntimePlugin.h")
+        os.rename(staged_dir, plugin_dir)
+        later = os.path.join(plugin_dir, "Source", "RuntimePlugin", "Private", "RuntimePlugin.cpp")
+        deadline = time.time() + 5
+        while not any(w.path == plugin_dir for w in observer._watches) and time.time() < deadline:
+            time.sleep(0.05)
+        _write(later, '#include "RuntimePlugin.h"\n')
+
+        # 감시 전에 만든 헤더(재생)와 감시 후 만든 소스(실제 이벤트) 모두 전달, 빌드 산출물 파일은 제외
+        # (비재귀 감시 폴더의 직계 자식인 Intermediate/Binaries 폴더 자체의 이벤트는 ChangeHandler 가 거른다)
+        while not {header, later} <= recorder.created_files() and time.time() < deadline:
+            time.sleep(0.05)
+        assert {header, later} <= recorder.created_files()
+        assert not any("Intermediate" in p or "Binaries" in p for p in recorder.created_files())
+    finally:
+        observer.stop()
+        observer.join()
+        logger.shutdown()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    print("=== 감시 계획 테스트 시작 ===")
+    test_plan_splits_ignored_subtrees()
+    test_new_directory_is_watched_and_existing_files_replayed()
+    test_module_created_while_watching()
+    print("=== 감시 계획 테스트 완료 ===")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+실행 중인 감시기(main.py) 제어 클라이언트
+- 감시기가 남긴 endpoint 파일(기본: 도구 폴더의 control_endpoint.json)로 로컬 제어 채널에 접속한다.
+- 새 프로세스에서 캐시를 다시 읽지 않으므로 수 ms 안에 응답한다.
+
+사용 예)
+    python watcherctl.py status
+    python watcherctl.py update --root GameB
+    python watcherctl.py report --limit 20
+    python watcherctl.py pause / resume
+    python watcherctl.py metrics --prometheus
+"""
+
+import os
+import sys
+import json
+import argparse
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ControlServer import ControlServer, send_command
+
+
+def _endpoint_path(args):
+    if args.endpoint:
+        return args.endpoint
+    config_path = args.config or os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+    base_dir = os.path.dirname(os.path.abspath(config_path))
+    name = "control_endpoint.json"
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            name = json.load(f).get("ControlEndpointFile", name)
+    except (OSError, ValueError):
+        pass
+    return os.path.abspath(os.path.join(base_dir, name))
+
+
+def _print_status(result):
+    print(f"pid {result['pid']}, 가동 {result['uptime_seconds']}초, 대기/실행 중 갱신 {result['queued_runs']}건")
+    for root in result["roots"]:
+        state = "실행 중" if root["running"] else ("일시 정지" if root["paused"] else "대기")
+        print(f"[{root['name']}] {state} | 참조 파일 {root['referenced_files']}개 | "
+              f"반영 대기 삭제 {root['pending_deletes']}개 | {root['project_root']}")
+        if root["holds"]:
+            print(f"    보류 사유: {', '.join(root['holds'])}")
+        last_run = root["last_run"]
+        if last_run:
+            print(f"    마지막 실행: {last_run['started']} ({last_run['seconds']}초, {last_run['result']})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="실행 중인 감시기 제어")
+    parser.add_argument("command", choices=ControlServer.COMMANDS)
+    parser.add_argument("--root", help="대상 루트 이름 (다중 루트, 기본: 전체)")
+    parser.add_argument("--config", help="감시기 config.json 경로 (endpoint 파일 위치 결정)")
+    parser.add_argument("--endpoint", help="endpoint 파일 경로 직접 지정")
+    parser.add_argument("--limit", type=int, help="report: 출력할 최근 기록 수")
+    parser.add_argument("--prometheus", action="store_true", help="metrics: Prometheus 텍스트 형식")
+    parser.add_argument("--json", action="store_true", help="응답 JSON 그대로 출력")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    command_args = {}
+    if args.limit is not None:
+        command_args["limit"] = args.limit
+    if args.prometheus:
+        command_args["format"] = "prometheus"
+
+    endpoint = _endpoint_path(args)
+    try:
+        response = send_command(endpoint, args.command, root=args.root, args=command_args, timeout=args.timeout)
+    except FileNotFoundError:
+        print(f"감시기가 실행 중이 아니거나 제어 채널이 꺼져 있습니다. (endpoint 없음: {endpoint})", file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(f"제어 채널 접속 실패: {e}", file=sys.stderr)
+        return 2
+
+    if not response.get("ok"):
+        print(f"오류: {response.get('error')}", file=sys.stderr)
+        return 1
+    result = response["result"]
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    elif args.command == "status":
+        _print_status(result)
+    elif isinstance(result, str):
+        print(result, end="")
+    else:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())